@@ -0,0 +1,248 @@
+"""Pre-baked sprite and glyph bundle.
+
+Decoding PNGs, resizing and premultiplying sprites, and rasterizing text
+with FreeType all cost time at startup (and mid-game, the first time a size
+is needed). ``python -m ar_catcher.asset_bundle`` does that work once and
+stores every result in a single uint8 ``.npy`` blob plus a small JSON index.
+At runtime :func:`load_bundle` memory-maps the blob, so loading is just an
+``mmap`` and every sprite or glyph atlas is a view into it.
+
+The bundle file name contains a hash of the source files and of the baked
+sizes; when a PNG, the font or a size changes the old bundle simply stops
+matching and the game falls back to loading the sources until it is rebuilt.
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from ar_catcher.objects import ObjectType
+from ar_catcher.sprite_manager import ASSETS_DIR, blit_mask, load_png, premultiply
+
+
+BUNDLE_DIR = ASSETS_DIR.parent / ".bundle"
+FONT_PATH = ASSETS_DIR.parent / "Roboto-Bold.ttf"
+FORMAT_VERSION = 1
+
+# Every font size the UI draws text with (popups use 30 * their scale)
+FONT_SIZES: Tuple[int, ...] = (18, 24, 30, 36, 45, 54, 72, 120)
+GLYPHS = "".join(chr(c) for c in range(32, 127))  # printable ASCII
+
+
+def sprite_sizes() -> Dict[str, List[int]]:
+    """Sprite name -> sizes the game draws it at (diameter of every object type)."""
+    sizes: Dict[str, List[int]] = {}
+    for obj_type in ObjectType:
+        name, radius = obj_type.value[0], obj_type.value[1]
+        if (ASSETS_DIR / f"{name}.png").exists():
+            sizes.setdefault(name, []).append(radius * 2)
+    return sizes
+
+
+def source_hash(sizes: Dict[str, List[int]], font_sizes: Sequence[int]) -> str:
+    """Hash of every source file and baked size; names the bundle files."""
+    digest = hashlib.sha256(f"v{FORMAT_VERSION}".encode())
+    digest.update(json.dumps([sizes, list(font_sizes), GLYPHS], sort_keys=True).encode())
+    for path in [ASSETS_DIR / f"{name}.png" for name in sorted(sizes)] + [FONT_PATH]:
+        if path.exists():
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# ----------------------------------------------------------------------
+# Glyph atlas
+# ----------------------------------------------------------------------
+
+
+class GlyphAtlas:
+    """Coverage masks of every glyph of one font size, packed in one strip.
+
+    ``glyphs`` maps a character to ``(atlas_x, width, height, left, top,
+    advance)``; ``left``/``top`` place the glyph relative to the pen origin
+    with Pillow's default (left, ascender) anchor.
+    """
+
+    def __init__(self, atlas: np.ndarray, glyphs: Dict[str, Sequence[float]]) -> None:
+        self.atlas = atlas
+        self.glyphs = glyphs
+
+    def covers(self, text: str) -> bool:
+        return all(ch in self.glyphs for ch in text)
+
+    def getbbox(self, text: str) -> Tuple[int, int, int, int]:
+        """``(left, top, right, bottom)`` of *text*, like ``FreeTypeFont.getbbox``."""
+        left = top = 1 << 30
+        right = bottom = -(1 << 30)
+        pen = 0.0
+        for ch in text:
+            _, w, h, gl, gt, advance = self.glyphs[ch]
+            if w and h:
+                gx = int(round(pen)) + gl
+                left, right = min(left, gx), max(right, gx + w)
+                top, bottom = min(top, gt), max(bottom, gt + h)
+            pen += advance
+        if right < left:
+            return 0, 0, int(round(pen)), 0
+        return left, top, right, bottom
+
+    def render(self, text: str) -> Tuple[np.ndarray, int, int]:
+        """Return the coverage mask of *text* and its ``(left, top)`` offset."""
+        left, top, right, bottom = self.getbbox(text)
+        mask = np.zeros((max(0, bottom - top), max(0, right - left)), dtype=np.uint8)
+        pen = 0.0
+        for ch in text:
+            ax, w, h, gl, gt, advance = self.glyphs[ch]
+            if w and h:
+                x = int(round(pen)) + gl - left
+                y = gt - top
+                dst = mask[y : y + h, x : x + w]
+                np.maximum(dst, self.atlas[:h, ax : ax + w], out=dst)
+            pen += advance
+        return mask, left, top
+
+    def draw(
+        self,
+        frame: np.ndarray,
+        text: str,
+        pos: Tuple[int, int],
+        color: Tuple[int, int, int],
+        alpha: float = 1.0,
+    ) -> None:
+        """Blend *text* in *color* onto *frame* with its pen origin at *pos*."""
+        mask, left, top = self.render(text)
+        blit_mask(frame, mask, color, (pos[0] + left, pos[1] + top), alpha)
+
+
+def rasterize_glyphs(font: ImageFont.FreeTypeFont, chars: str = GLYPHS) -> Tuple[np.ndarray, Dict[str, list]]:
+    """Render *chars* with *font* into a single-row atlas."""
+    boxes = {ch: font.getbbox(ch) for ch in chars}
+    height = max(1, max(b - t for _, t, _, b in boxes.values()))
+    width = sum(max(0, r - l) for l, _, r, _ in boxes.values())
+    atlas = Image.new("L", (max(1, width), height))
+    draw = ImageDraw.Draw(atlas)
+
+    glyphs: Dict[str, list] = {}
+    x = 0
+    for ch, (l, t, r, b) in boxes.items():
+        w, h = max(0, r - l), max(0, b - t)
+        if w and h:
+            draw.text((x - l, -t), ch, font=font, fill=255)
+        glyphs[ch] = [x, w, h, l, t, font.getlength(ch)]
+        x += w
+    return np.asarray(atlas, dtype=np.uint8), glyphs
+
+
+# ----------------------------------------------------------------------
+# Bundle
+# ----------------------------------------------------------------------
+
+
+class AssetBundle:
+    """Read-only view of a baked bundle (see module docstring)."""
+
+    def __init__(self, data: np.ndarray, index: dict) -> None:
+        self.data = data
+        self.index = index
+        self._atlases: Dict[int, GlyphAtlas] = {}
+
+    def _array(self, entry: dict) -> np.ndarray:
+        offset, shape = entry["offset"], tuple(entry["shape"])
+        return self.data[offset : offset + int(np.prod(shape))].reshape(shape)
+
+    def sprite(self, name: str, size: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """``(premultiplied_bgr, inverse_alpha)`` of a baked sprite, or ``None``."""
+        entry = self.index["sprites"].get(f"{name}:{size}")
+        if entry is None:
+            return None
+        return self._array(entry["premul"]), self._array(entry["inv_alpha"])
+
+    def glyph_atlas(self, size: int) -> Optional[GlyphAtlas]:
+        atlas = self._atlases.get(size)
+        if atlas is None:
+            entry = self.index["fonts"].get(str(size))
+            if entry is None:
+                return None
+            atlas = GlyphAtlas(self._array(entry["atlas"]), entry["glyphs"])
+            self._atlases[size] = atlas
+        return atlas
+
+
+def _paths(directory: Path, key: str) -> Tuple[Path, Path]:
+    return directory / f"bundle-{key}.npy", directory / f"bundle-{key}.json"
+
+
+def build_bundle(directory: Path = BUNDLE_DIR, font_sizes: Sequence[int] = FONT_SIZES) -> Path:
+    """Bake every sprite size and glyph atlas into *directory*; return the blob path."""
+    sizes = sprite_sizes()
+    key = source_hash(sizes, font_sizes)
+    chunks: List[np.ndarray] = []
+    offset = 0
+
+    def add(array: np.ndarray) -> dict:
+        nonlocal offset
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        chunks.append(array.ravel())
+        entry = {"offset": offset, "shape": list(array.shape)}
+        offset += array.size
+        return entry
+
+    index: dict = {"hash": key, "version": FORMAT_VERSION, "sprites": {}, "fonts": {}}
+    for name, name_sizes in sorted(sizes.items()):
+        bgr, alpha = load_png(ASSETS_DIR / f"{name}.png")
+        for size in sorted(set(name_sizes)):
+            premul, inv_alpha = premultiply(
+                cv2.resize(bgr, (size, size), interpolation=cv2.INTER_AREA),
+                cv2.resize(alpha, (size, size), interpolation=cv2.INTER_AREA),
+            )
+            index["sprites"][f"{name}:{size}"] = {"premul": add(premul), "inv_alpha": add(inv_alpha)}
+
+    if FONT_PATH.exists():
+        for size in font_sizes:
+            atlas, glyphs = rasterize_glyphs(ImageFont.truetype(str(FONT_PATH), size))
+            index["fonts"][str(size)] = {"atlas": add(atlas), "glyphs": glyphs}
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("bundle-*"):
+        stale.unlink()
+    blob_path, index_path = _paths(directory, key)
+    np.save(blob_path, np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8))
+    index_path.write_text(json.dumps(index))
+    return blob_path
+
+
+def load_bundle(directory: Path = BUNDLE_DIR, font_sizes: Sequence[int] = FONT_SIZES) -> Optional[AssetBundle]:
+    """Memory-map the bundle matching the current sources, or return ``None``."""
+    blob_path, index_path = _paths(directory, source_hash(sprite_sizes(), font_sizes))
+    if not blob_path.exists() or not index_path.exists():
+        return None
+    try:
+        # Plain ndarray view of the map: slicing np.memmap objects is slow
+        data = np.asarray(np.load(blob_path, mmap_mode="r"))
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        return None
+    return AssetBundle(data, index)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bake AR Catcher sprites and glyphs into a bundle")
+    parser.add_argument("--out", type=Path, default=BUNDLE_DIR, help="Output directory")
+    args = parser.parse_args()
+
+    path = build_bundle(args.out)
+    bundle = load_bundle(args.out)
+    print(
+        f"📦 {path} ({path.stat().st_size / 1e6:.1f} MB): "
+        f"{len(bundle.index['sprites'])} sprites, {len(bundle.index['fonts'])} font sizes"
+    )
+
+
+if __name__ == "__main__":
+    main()
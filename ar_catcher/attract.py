@@ -0,0 +1,90 @@
+import time
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+
+class AttractMode:
+    """Low-power idle state entered when nobody has played for a while.
+
+    After ``idle_after`` seconds without a detected hand the game switches to
+    attract mode: hand detection runs only ``detect_hz`` times per second on
+    a frame downscaled by ``detect_scale``, and the game is expected to draw
+    a minimal screen at ``fps``. A tiny thumbnail difference is checked every
+    frame so that movement in front of the camera triggers a detection
+    immediately instead of waiting for the next slot; as soon as a hand is
+    found the game is back in full mode on the same frame.
+    """
+
+    def __init__(
+        self,
+        idle_after: float = 30.0,
+        detect_hz: float = 4.0,
+        detect_scale: float = 0.5,
+        fps: float = 10.0,
+        thumb_width: int = 32,
+        motion_threshold: float = 6.0,
+    ) -> None:
+        self.idle_after = idle_after
+        self.detect_period = 1.0 / detect_hz
+        self.detect_scale = detect_scale
+        self.fps = fps
+        self.thumb_width = thumb_width
+        self.motion_threshold = motion_threshold
+
+        self.active = False
+        self.transitions = 0
+        self.time_in: Dict[str, float] = {"full": 0.0, "attract": 0.0}
+        self._last_hand: Optional[float] = None
+        self._last_detect = 0.0
+        self._last_update: Optional[float] = None
+        self._thumb: Optional[np.ndarray] = None
+
+    @property
+    def mode(self) -> str:
+        return "attract" if self.active else "full"
+
+    def update(self, hands_found: bool, now: Optional[float] = None) -> bool:
+        """Account time and switch modes; return ``True`` when the mode changed."""
+        now = time.monotonic() if now is None else now
+        if self._last_update is not None:
+            self.time_in[self.mode] += now - self._last_update
+        self._last_update = now
+        if self._last_hand is None or hands_found:
+            self._last_hand = now
+
+        idle = now - self._last_hand >= self.idle_after
+        if idle == self.active:
+            return False
+        self.active = idle
+        self.transitions += 1
+        self._thumb = None
+        return True
+
+    def should_detect(self, frame: np.ndarray, now: Optional[float] = None) -> bool:
+        """In attract mode, whether this frame is worth running detection on."""
+        if not self.active:
+            return True
+        now = time.monotonic() if now is None else now
+        if now - self._last_detect >= self.detect_period or self._moved(frame):
+            self._last_detect = now
+            return True
+        return False
+
+    def _moved(self, frame: np.ndarray) -> bool:
+        h, w = frame.shape[:2]
+        size = (self.thumb_width, max(1, self.thumb_width * h // w))
+        thumb = cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        previous, self._thumb = self._thumb, thumb
+        if previous is None:
+            return False
+        return float(cv2.absdiff(thumb, previous).mean()) > self.motion_threshold
+
+    def summary(self) -> str:
+        total = sum(self.time_in.values()) or 1.0
+        return (
+            f"full {self.time_in['full']:.0f} s ({self.time_in['full'] / total:.0%}), "
+            f"attract {self.time_in['attract']:.0f} s ({self.time_in['attract'] / total:.0%}), "
+            f"{self.transitions} switches"
+        )
@@ -0,0 +1,159 @@
+"""Headless scaling benchmark for the AR Catcher frame loop.
+
+Measures how the per-frame cost of the game logic and rendering grows with
+the number of falling objects, floating popups and explosion particles. No
+camera is opened and hand detection is not run; two synthetic fingertips
+sweep the screen so collision tests run against every object.
+
+Usage::
+
+    python -m ar_catcher.benchmark
+    python -m ar_catcher.benchmark --objects 100 250 500 1000 --frames 300
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from ar_catcher.detector import HandResult
+from ar_catcher.frame_pool import FrameArena
+from ar_catcher.game import Game
+from ar_catcher.objects import ObjectType
+
+
+STAGES = ("update", "collision", "objects", "particles", "ui", "popups", "explosions")
+
+
+class _NoHands:
+    """Tracker stand-in so building the game does not load MediaPipe's model."""
+
+    motion_gate = None
+
+    def __init__(self) -> None:
+        self.arena = FrameArena()
+
+    def detect(self, frame_bgr, pixel_space: bool = True) -> HandResult:
+        return HandResult.empty(pixel_space)
+
+
+def _timed(timings: Dict[str, float], stage: str, fn, *args) -> None:
+    start = time.perf_counter()
+    fn(*args)
+    timings[stage] += time.perf_counter() - start
+
+
+def measure(
+    game: Game,
+    objects: int,
+    popups: int,
+    explosions: int,
+    frames: int,
+    dt: float = 1 / 30,
+) -> Dict[str, float]:
+    """Return the mean milliseconds per frame spent in every stage."""
+    rng = random.Random(0)
+    background = np.full((game.height, game.width, 3), 90, dtype=np.uint8)
+    frame = background.copy()
+
+    game.objects.clear()
+    game.popups.clear()
+    game.explosions.clear()
+    game.spawn_interval = math.inf  # the benchmark keeps the counts fixed itself
+    game.winner = None
+
+    def refill() -> None:
+        missing = objects - len(game.objects)
+        if missing > 0:
+            batch = game.spawner.burst(missing)
+            for obj in batch:
+                obj.y = rng.uniform(0, game.height)
+            game.objects.extend(batch)
+
+    for i in range(popups):
+        game._add_popup(rng.randrange(game.width), rng.randrange(game.height), f"+{i % 5 + 1}", (0, 255, 0))
+    while len(game.explosions) < explosions:
+        game._create_explosion(rng.randrange(game.width), rng.randrange(game.height), ObjectType.BOMB)
+    if explosions:
+        game.explosions._ttl[: len(game.explosions)] = math.inf
+
+    timings = {stage: 0.0 for stage in STAGES}
+    for f in range(frames):
+        refill()
+        for pop in game.popups:
+            pop["life"] = 0.0
+        np.copyto(frame, background)
+
+        # Fingertips circling the screen so collisions actually happen
+        angle = f * 0.05
+        tips = np.array(
+            [
+                (game.width * (0.5 + 0.4 * math.cos(angle)), game.height * (0.5 + 0.4 * math.sin(angle))),
+                (game.width * (0.5 - 0.4 * math.cos(angle)), game.height * (0.5 - 0.4 * math.sin(angle))),
+            ],
+            dtype=np.float32,
+        )
+
+        _timed(timings, "update", game._update_world, dt)
+        _timed(timings, "collision", game._detect_collisions, tips)
+        game.winner = None
+        game.scores = [0, 0]
+
+        start = time.perf_counter()
+        for obj in game.objects:
+            game._draw_object_with_effects(frame, obj)
+        timings["objects"] += time.perf_counter() - start
+
+        _timed(timings, "particles", game._update_and_draw_particles, frame, dt)
+        _timed(timings, "ui", game._draw_enhanced_ui, frame)
+        _timed(timings, "popups", game._update_and_draw_popups, frame, dt)
+        _timed(timings, "explosions", game._update_and_draw_explosions, frame, dt)
+        # Popups and explosions spawned by collisions would skew the sweep
+        del game.popups[popups:]
+        if len(game.explosions) > explosions:
+            game.explosions.count = explosions
+
+    return {stage: total / frames * 1000.0 for stage, total in timings.items()}
+
+
+def _sweep(game: Game, label: str, values: Sequence[int], frames: int, **fixed) -> None:
+    print(f"\n{label} sweep ({', '.join(f'{k}={v}' for k, v in fixed.items())})")
+    print(f"{label:>10} " + " ".join(f"{s:>10}" for s in STAGES) + f" {'total':>10}")
+    totals: List[float] = []
+    for n in values:
+        result = measure(game, frames=frames, **{**fixed, label: n})
+        total = sum(result.values())
+        totals.append(total)
+        print(f"{n:>10} " + " ".join(f"{result[s]:>10.3f}" for s in STAGES) + f" {total:>10.3f}")
+    if len(values) > 1:
+        slope = np.polyfit(np.asarray(values, dtype=np.float64), totals, 1)[0]
+        print(f"  marginal cost: {slope * 1000:.2f} µs per additional {label[:-1]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AR Catcher scaling benchmark (ms per frame)")
+    parser.add_argument("--objects", type=int, nargs="+", default=[0, 50, 100, 200, 500, 1000])
+    parser.add_argument("--popups", type=int, nargs="+", default=[0, 10, 25, 50])
+    parser.add_argument("--explosions", type=int, nargs="+", default=[0, 100, 500, 2000])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    game = Game(args.width, args.height, tracker=_NoHands())
+    _sweep(game, "objects", args.objects, args.frames, popups=0, explosions=0)
+    _sweep(game, "popups", args.popups, args.frames, objects=200, explosions=0)
+    _sweep(game, "explosions", args.explosions, args.frames, objects=200, popups=0)
+
+    n = 100_000
+    start = time.perf_counter()
+    for i in range(n):
+        game.events.emit("catch", player=i & 1, type="APPLE", points=1, combo=2)
+    print(f"\nevent emit: {(time.perf_counter() - start) / n * 1e6:.2f} µs per event")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import cv2
 import os  # Added for environment variable support
+import time
 
 
 class Camera:
@@ -24,6 +25,8 @@ class Camera:
             self.src = self._auto_detect(auto_scan_range)
 
         self.cap = None
+        self.frame_shape = None  # (h, w, c) of the camera frames once opened
+        self.last_timestamp = 0.0  # time.monotonic() when the last frame arrived
 
     # ---------------------------------------------------------------------
     # Private helpers
@@ -59,6 +62,7 @@ class Camera:
         # Test if we can actually read frames
         ret, test_frame = self.cap.read()
         if ret and test_frame is not None:
+            self.frame_shape = test_frame.shape
             print('✅ Camera stream established successfully')
             print(f'📷 Using camera index {self.src}')
         else:
@@ -71,10 +75,24 @@ class Camera:
             self.cap.release()
         cv2.destroyAllWindows()
 
-    def read(self):
+    @property
+    def fps(self) -> float:
+        """Native frame rate reported by the driver (``0.0`` when unknown)."""
+        if self.cap is None:
+            return 0.0
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        return fps if 0 < fps < 1000 else 0.0
+
+    def read(self, out=None):
+        """Return the next frame, decoding into *out* when a buffer is given.
+
+        The monotonic time at which the frame arrived is kept in
+        ``last_timestamp`` for latency measurements.
+        """
         if self.cap is None:
             raise RuntimeError("Camera not initialized")
-        ret, frame = self.cap.read()
+        ret, frame = self.cap.read(out) if out is not None else self.cap.read()
+        self.last_timestamp = time.monotonic()
         if not ret:
             raise RuntimeError("Failed to read frame from camera")
         return frame
@@ -1,5 +1,78 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
 import cv2
 import mediapipe as mp
+import numpy as np
+
+from ar_catcher.frame_pool import FrameArena
+from ar_catcher.motion import MotionGate
+
+
+NUM_LANDMARKS = 21
+
+# Pairs of landmark indices forming the hand skeleton, as an (E, 2) array so a
+# whole skeleton can be gathered with a single fancy-index.
+_CONNECTIONS = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.intp)
+
+
+@dataclass
+class HandResult:
+    """Landmarks of every detected hand packed into NumPy arrays.
+
+    ``landmarks`` has shape ``(hands, 21, 3)`` and holds ``(x, y, z)`` either
+    normalized to ``[0, 1]`` or scaled to pixels (``pixel_space``).
+    ``handedness`` is ``0`` for a left hand and ``1`` for a right hand, and
+    ``scores`` is MediaPipe's handedness confidence for each hand.
+    """
+
+    landmarks: np.ndarray
+    handedness: np.ndarray
+    scores: np.ndarray
+    pixel_space: bool = False
+
+    @classmethod
+    def empty(cls, pixel_space: bool = False) -> "HandResult":
+        return cls(
+            np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32),
+            np.empty(0, dtype=np.int8),
+            np.empty(0, dtype=np.float32),
+            pixel_space,
+        )
+
+    def __len__(self) -> int:
+        return self.landmarks.shape[0]
+
+    def limit(self, max_hands: int) -> "HandResult":
+        """Return a view holding at most the first ``max_hands`` hands."""
+        if len(self) <= max_hands:
+            return self
+        return HandResult(
+            self.landmarks[:max_hands],
+            self.handedness[:max_hands],
+            self.scores[:max_hands],
+            self.pixel_space,
+        )
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Return the ``(x0, y0, x1, y1)`` box around all hands, or ``None``."""
+        if not len(self):
+            return None
+        xy = self.landmarks[:, :, :2].reshape(-1, 2)
+        x0, y0 = xy.min(axis=0)
+        x1, y1 = xy.max(axis=0)
+        return float(x0), float(y0), float(x1), float(y1)
+
+    def points(self, landmark_id: int) -> np.ndarray:
+        """Return the ``(hands, 2)`` x/y positions of one landmark."""
+        return self.landmarks[:, landmark_id, :2]
+
+    def to_pixels(self, frame_width: int, frame_height: int) -> "HandResult":
+        """Return a copy scaled to pixel coordinates (z scales with width)."""
+        if self.pixel_space:
+            return self
+        scale = np.array([frame_width, frame_height, frame_width], dtype=np.float32)
+        return HandResult(self.landmarks * scale, self.handedness, self.scores, True)
 
 
 class HandTracker:
@@ -12,6 +85,8 @@ class HandTracker:
         max_num_hands: int = 2,
         detection_confidence: float = 0.7,
         tracking_confidence: float = 0.6,
+        motion_gate: Optional[MotionGate] = None,
+        arena: Optional[FrameArena] = None,
     ) -> None:
         self._mp_hands = mp.solutions.hands
         self._hands = self._mp_hands.Hands(
@@ -21,10 +96,65 @@ class HandTracker:
         )
         self._mp_drawing = mp.solutions.drawing_utils
 
+        # Optional gate reusing the last (normalized) result on static frames
+        self.motion_gate = motion_gate
+        self._last_hands = HandResult.empty()
+
+        # Reused buffers (the RGB copy handed to MediaPipe lives here)
+        self.arena = arena if arena is not None else FrameArena()
+
     def process(self, frame_bgr):
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        frame_rgb = cv2.cvtColor(
+            frame_bgr, cv2.COLOR_BGR2RGB, dst=self.arena.like("rgb", frame_bgr)
+        )
         return self._hands.process(frame_rgb)
 
+    def detect(self, frame_bgr, pixel_space: bool = True) -> HandResult:
+        """Run detection and return every hand as a single :class:`HandResult`.
+
+        With a ``motion_gate`` the previous result is returned unchanged when
+        the gate finds nothing moved since the last inference.
+        """
+        gate = self.motion_gate
+        if gate is not None and gate.should_skip(frame_bgr, self._last_hands.bounds()):
+            hands = self._last_hands
+        else:
+            hands = self._infer(frame_bgr)
+        if pixel_space:
+            h, w = frame_bgr.shape[:2]
+            hands = hands.to_pixels(w, h)
+        return hands
+
+    def _infer(self, frame_bgr) -> HandResult:
+        """Run MediaPipe on *frame_bgr* and remember the (normalized) result."""
+        hands = self.to_arrays(self.process(frame_bgr))
+        self._last_hands = hands
+        return hands
+
+    @staticmethod
+    def to_arrays(results) -> HandResult:
+        """Pack MediaPipe ``results`` into normalized NumPy arrays."""
+        if not results.multi_hand_landmarks:
+            return HandResult.empty()
+
+        landmarks = np.array(
+            [
+                [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                for hand in results.multi_hand_landmarks
+            ],
+            dtype=np.float32,
+        )
+        n = landmarks.shape[0]
+        handedness = np.zeros(n, dtype=np.int8)
+        scores = np.ones(n, dtype=np.float32)
+        for i, hand_class in enumerate(results.multi_handedness or ()):
+            if i >= n:
+                break
+            top = hand_class.classification[0]
+            handedness[i] = 1 if top.label == "Right" else 0
+            scores[i] = top.score
+        return HandResult(landmarks, handedness, scores)
+
     def draw(self, frame_bgr, results):
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
@@ -34,14 +164,188 @@ class HandTracker:
                     self._mp_hands.HAND_CONNECTIONS,
                 )
 
+    @staticmethod
+    def draw_arrays(
+        frame_bgr: np.ndarray,
+        hands: HandResult,
+        colors: Sequence[Tuple[int, int, int]],
+        thickness: int = 2,
+        radius: int = 2,
+    ) -> None:
+        """Draw pixel-space skeletons; hand ``i`` uses ``colors[i % len(colors)]``."""
+        if not len(hands):
+            return
+        if not hands.pixel_space:
+            h, w = frame_bgr.shape[:2]
+            hands = hands.to_pixels(w, h)
+
+        pts = hands.landmarks[:, :, :2].astype(np.int32)
+        for i, hand_pts in enumerate(pts):
+            color = colors[i % len(colors)]
+            cv2.polylines(frame_bgr, list(hand_pts[_CONNECTIONS]), False, color, thickness)
+            for x, y in hand_pts:
+                cv2.circle(frame_bgr, (int(x), int(y)), radius, color, -1)
+
     @staticmethod
     def landmarks_to_pixels(landmarks, frame_width: int, frame_height: int):
-        """Convert normalized landmarks to pixel (x, y) list."""
-        pixels = []
-        for lm in landmarks.landmark:
-            px, py = int(lm.x * frame_width), int(lm.y * frame_height)
-            pixels.append((px, py))
-        return pixels
+        """Convert normalized landmarks to an ``(21, 2)`` int array of pixel (x, y)."""
+        coords = np.array([(lm.x, lm.y) for lm in landmarks.landmark], dtype=np.float32)
+        return (coords * (frame_width, frame_height)).astype(np.int32)
+
+
+class HybridHandTracker(HandTracker):
+    """HandTracker that only runs MediaPipe every few frames.
+
+    A full landmark detection runs every ``detect_every`` frames, or earlier
+    when the hand confidence drops below ``min_score`` or the flow loses the
+    hand. In between, the key joints are propagated with pyramidal
+    Lucas-Kanade optical flow computed on a small grayscale crop around the
+    hands; the remaining joints follow the median motion of their hand.
+
+    With a ``motion_gate``, a due detection is skipped while the scene is
+    static and the hands keep their current (tracked) position.
+    """
+
+    # Wrist, finger tips and the index/middle MCP joints.
+    KEY_JOINTS = np.array([0, 4, 5, 8, 9, 12, 16, 20], dtype=np.intp)
+
+    def __init__(
+        self,
+        detect_every: int = 3,
+        min_score: float = 0.8,
+        roi_padding: int = 48,
+        min_tracked_ratio: float = 0.6,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.detect_every = max(1, detect_every)
+        self.min_score = min_score
+        self.roi_padding = roi_padding
+        self.min_tracked_ratio = min_tracked_ratio
+        self._lk_params = dict(
+            winSize=(15, 15),
+            maxLevel=2,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03),
+        )
+
+        self._last: HandResult = HandResult.empty(pixel_space=True)
+        self._prev_gray: np.ndarray | None = None
+        self._prev_origin: Tuple[int, int] = (0, 0)
+        self._frames_since_detect = 0
 
+        # Counters for reporting the inference savings
+        self.detections = 0
+        self.tracked_frames = 0
+        self.gate_skips = 0
+
+    @property
+    def inference_ratio(self) -> float:
+        """Fraction of frames that ran a full MediaPipe inference."""
+        total = self.detections + self.tracked_frames + self.gate_skips
+        return self.detections / total if total else 1.0
+
+    def reset(self) -> None:
+        """Drop the tracked hands so the next frame runs a full detection."""
+        self._last = HandResult.empty(pixel_space=True)
+        self._prev_gray = None
+
+    def detect(self, frame_bgr, pixel_space: bool = True) -> HandResult:
+        hands = None
+        if not self._needs_detection():
+            hands = self._track(frame_bgr)
+        if hands is None:
+            h, w = frame_bgr.shape[:2]
+            if self._gate_allows_skip(frame_bgr, w, h):
+                # Nothing moved: keep the hands where the flow last put them
+                hands = self._last
+                self.gate_skips += 1
+            else:
+                hands = self._infer(frame_bgr).to_pixels(w, h)
+                self._frames_since_detect = 0
+                self.detections += 1
+        else:
+            self._frames_since_detect += 1
+            self.tracked_frames += 1
+
+        self._last = hands
+        self._store_roi(frame_bgr, hands)
+
+        if pixel_space:
+            return hands
+        h, w = frame_bgr.shape[:2]
+        scale = np.array([w, h, w], dtype=np.float32)
+        return HandResult(hands.landmarks / scale, hands.handedness, hands.scores)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _gate_allows_skip(self, frame_bgr, frame_width: int, frame_height: int) -> bool:
+        gate = self.motion_gate
+        if gate is None:
+            return False
+        bounds = self._last.bounds()
+        if bounds is not None:
+            x0, y0, x1, y1 = bounds
+            bounds = (x0 / frame_width, y0 / frame_height, x1 / frame_width, y1 / frame_height)
+        return gate.should_skip(frame_bgr, bounds)
+
+    def _needs_detection(self) -> bool:
+        return (
+            not len(self._last)
+            or self._prev_gray is None
+            or self._frames_since_detect + 1 >= self.detect_every
+            or float(self._last.scores.min()) < self.min_score
+        )
+
+    def _roi_bounds(self, frame_shape, hands: HandResult) -> Tuple[int, int, int, int]:
+        """Padded bounding box (x0, y0, x1, y1) of all hands, clipped to the frame."""
+        h, w = frame_shape[:2]
+        xy = hands.landmarks[:, :, :2].reshape(-1, 2)
+        x0, y0 = np.floor(xy.min(axis=0)).astype(int) - self.roi_padding
+        x1, y1 = np.ceil(xy.max(axis=0)).astype(int) + self.roi_padding
+        return max(0, x0), max(0, y0), min(w, x1), min(h, y1)
+
+    def _store_roi(self, frame_bgr, hands: HandResult) -> None:
+        if not len(hands):
+            self._prev_gray = None
+            return
+        x0, y0, x1, y1 = self._roi_bounds(frame_bgr.shape, hands)
+        if x1 - x0 < 8 or y1 - y0 < 8:
+            self._prev_gray = None
+            return
+        self._prev_gray = cv2.cvtColor(frame_bgr[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        self._prev_origin = (x0, y0)
+
+    def _track(self, frame_bgr) -> HandResult | None:
+        """Propagate the last hands with optical flow, or ``None`` to force detection."""
+        x0, y0 = self._prev_origin
+        ph, pw = self._prev_gray.shape
+        roi = frame_bgr[y0 : y0 + ph, x0 : x0 + pw]
+        if roi.shape[:2] != (ph, pw):
+            return None
+        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+
+        origin = np.array([x0, y0], dtype=np.float32)
+        key_xy = self._last.landmarks[:, self.KEY_JOINTS, :2]  # (hands, K, 2)
+        p0 = (key_xy - origin).reshape(-1, 1, 2).astype(np.float32)
+        p1, status, _err = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, p0, None, **self._lk_params
+        )
+        if p1 is None:
+            return None
 
+        n_hands, n_keys = key_xy.shape[:2]
+        good = status.reshape(n_hands, n_keys).astype(bool)
+        if (good.mean(axis=1) < self.min_tracked_ratio).any():
+            return None
 
+        flow = p1.reshape(n_hands, n_keys, 2) - (key_xy - origin)
+        landmarks = self._last.landmarks.copy()
+        for i in range(n_hands):
+            # Joints without their own flow vector follow the hand's median motion
+            median = np.median(flow[i][good[i]], axis=0)
+            landmarks[i, :, :2] += median
+            keys = self.KEY_JOINTS[good[i]]
+            landmarks[i, keys, :2] += flow[i][good[i]] - median
+        return HandResult(landmarks, self._last.handedness, self._last.scores, True)
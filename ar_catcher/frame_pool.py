@@ -0,0 +1,90 @@
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class FrameArena:
+    """Preallocated, reused image buffers for every stage of the frame pipeline.
+
+    Each stage asks for its buffer by name (``"resized"``, ``"frame"``,
+    ``"rgb"``, ``"overlay"`` …) and gets the same array back every frame as
+    long as shape and dtype do not change; OpenCV writes into it through its
+    ``dst=`` argument. A new array is only allocated on the first request or
+    on a shape change, and every such allocation is counted per frame, so
+    after warm-up :attr:`frame_allocations` should stay at zero.
+
+    With ``trace_memory`` the arena additionally records, via
+    :mod:`tracemalloc`, the peak of transient memory allocated inside each
+    frame. NumPy reports its buffers to tracemalloc, so a stray full-size
+    array anywhere in the loop shows up there even if it bypassed the arena.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self._buffers: Dict[str, np.ndarray] = {}
+        self.frames = 0
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.last_allocation_frame = 0
+
+        self.trace_memory = trace_memory
+        self.max_transient_bytes = 0
+        self.last_transient_bytes = 0
+        self._frame_start_bytes = 0
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Return the buffer registered under *name*, (re)allocating if needed."""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != tuple(shape) or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocations += 1
+            self.frame_allocations += 1
+            self.last_allocation_frame = self.frames
+        return buf
+
+    def like(self, name: str, array: np.ndarray) -> np.ndarray:
+        """Return the *name* buffer with the shape and dtype of *array*."""
+        return self.get(name, array.shape, array.dtype)
+
+    def copy(self, name: str, array: np.ndarray) -> np.ndarray:
+        """Copy *array* into the *name* buffer (a reusable ``array.copy()``)."""
+        buf = self.like(name, array)
+        np.copyto(buf, array)
+        return buf
+
+    def begin_frame(self) -> None:
+        """Mark the start of a new frame and reset the per-frame counters."""
+        if self.trace_memory and self.frames:
+            current, peak = tracemalloc.get_traced_memory()
+            self.last_transient_bytes = max(0, peak - self._frame_start_bytes)
+            # Ignore the warm-up frames that legitimately fill the arena
+            if self.frame_allocations == 0:
+                self.max_transient_bytes = max(self.max_transient_bytes, self.last_transient_bytes)
+            tracemalloc.reset_peak()
+            self._frame_start_bytes = current
+        self.frames += 1
+        self.frame_allocations = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    @property
+    def steady_frames(self) -> int:
+        """Frames in a row (up to now) that did not allocate a new buffer."""
+        return self.frames - self.last_allocation_frame
+
+    def summary(self, frame_bytes: Optional[int] = None) -> str:
+        text = (
+            f"{len(self._buffers)} buffers ({self.nbytes / 1e6:.1f} MB), "
+            f"{self.allocations} allocations, last in frame {self.last_allocation_frame}, "
+            f"{self.steady_frames} allocation-free frames since"
+        )
+        if self.trace_memory:
+            text += f", peak transient {self.max_transient_bytes / 1e3:.0f} kB/frame"
+            if frame_bytes:
+                text += f" ({self.max_transient_bytes / frame_bytes:.2f} full frames)"
+        return text
@@ -1,17 +1,27 @@
+import argparse
+import dataclasses
 import cv2
 import time
-import random
 from pathlib import Path
 import numpy as np
-import mediapipe as mp
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
 
 from PIL import Image, ImageDraw, ImageFont
 
+from ar_catcher.asset_bundle import FONT_SIZES, AssetBundle, load_bundle
+from ar_catcher.attract import AttractMode
 from ar_catcher.camera import Camera
-from ar_catcher.detector import HandTracker
+from ar_catcher.detector import HandResult, HandTracker, HybridHandTracker
+from ar_catcher.events import EventLog, JSONLWriter, SQLiteWriter
+from ar_catcher.frame_pool import FrameArena
+from ar_catcher.latency import LatencyTracker
+from ar_catcher.modes import GAME_MODES, GameMode, load_modes
+from ar_catcher.motion import MotionGate
 from ar_catcher.objects import GameObject, ObjectSpawner, ObjectType
-from ar_catcher.sprite_manager import blit_alpha, SpriteManager
+from ar_catcher.pacing import LATE_POLICIES, FrameScheduler
+from ar_catcher.particles import BurstParticles, ParticleField
+from ar_catcher.recorder import FrameSink, MJPEGStreamSink, VideoFileSink
+from ar_catcher.sprite_manager import blit_mask, blit_premultiplied, SpriteManager
 
 
 class Game:
@@ -26,11 +36,40 @@ class Game:
     )
     _font_cache: dict[int, ImageFont.FreeTypeFont] = {}
 
-    def __init__(self, width: int = 1280, height: int = 720):
+    # Glow ring around special objects: (radius scale, BGR color, thickness)
+    GLOW_RINGS: dict = {
+        ObjectType.GOLDEN_FRUIT: (1.5, (0, 215, 255), 3),  # Golden glow
+        ObjectType.SHIELD: (1.3, (0, 255, 255), 2),  # Shield glow
+        ObjectType.MEGA_BOMB: (1.4, (0, 0, 255), 2),  # Danger glow
+        ObjectType.CLUSTER_BOMB: (1.4, (0, 255, 255), 2),
+    }
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        tracker: Optional[HandTracker] = None,
+        sinks: Sequence[FrameSink] = (),
+        particle_count: int = 80,
+        mode: GameMode = GAME_MODES["classic"],
+        latency_report: Optional[float] = None,
+        target_fps: Optional[float] = None,
+        late_policy: str = "skip_render",
+        attract: Optional[AttractMode] = None,
+        events: Optional[EventLog] = None,
+    ):
         self.width = width
         self.height = height
-        self.tracker = HandTracker()
-        self.spawner = ObjectSpawner(width, height)
+        # Any HandTracker works; HybridHandTracker trades inference for optical flow.
+        self.tracker = tracker if tracker is not None else HandTracker()
+        # Per-stage frame buffers, shared with the tracker so one set of
+        # allocation counters covers the whole pipeline.
+        self.arena: FrameArena = self.tracker.arena
+        # Optional recording/streaming outputs fed with every presented frame
+        self.sinks: List[FrameSink] = list(sinks)
+        # Match analytics (kept in memory only unless given a writer)
+        self.events: EventLog = events if events is not None else EventLog()
+        self.spawner = ObjectSpawner(width, height, table=mode.spawn_table)
         self.objects: List[GameObject] = []
         # Two-player scoreboard
         self.scores: List[int] = [0, 0]
@@ -41,19 +80,55 @@ class Game:
         self.shield_timers: List[float] = [0.0, 0.0]  # Shield duration
         self.combo_multipliers: List[int] = [1, 1]  # Score multipliers
         self.combo_timers: List[float] = [0.0, 0.0]  # Combo duration
+        self.combo_lengths: List[int] = [0, 0]  # Catches in the current combo
         
         # Game state
         self.game_time = 0.0  # Track total game time
         
         # Transient visual elements ------------------------------------------------
         self.popups: List[dict] = []  # each: {x, y, text, color, life, ttl, scale}
-        self.particles: List[dict] = []  # ambient background particles
-        self.explosions: List[dict] = []  # explosion effects
-        self._init_particles(count=80)  # More particles for better atmosphere
-        self.last_spawn = 0.0
-        self.spawn_interval = 0.8  # Faster spawning for more action
+        self.particles = ParticleField(width, height, count=particle_count)  # ambient background
+        self.explosions = BurstParticles()  # explosion effects
+        self._sprite_cache: dict = {}  # (type, sprite, radius) -> premultiplied sprite
+        # Capture → detection → collision → present timings of recent frames
+        self.latency = LatencyTracker()
+        self.latency_report = latency_report  # seconds between live reports
+        self._last_latency_report = time.monotonic()
+        # Frame pacing; ``None`` caps at the camera's native rate, 0 = uncapped
+        self.target_fps = target_fps
+        self.scheduler = FrameScheduler(target_fps, late_policy)
+        self._full_fps: Optional[float] = None
+        # Low-power attract mode while nobody plays (None = always full mode)
+        self.attract = attract
+        # Baked sprites and glyph atlases (python -m ar_catcher.asset_bundle)
+        self.assets: Optional[AssetBundle] = load_bundle()
+        self._glyph_atlases: dict = {}
+        self._text_sprites: dict = {}  # (text, size) -> popup coverage mask
+        if self.assets is not None:
+            SpriteManager.use_bundle(self.assets)
+            for size in FONT_SIZES:
+                atlas = self.assets.glyph_atlas(size)
+                if atlas is not None:
+                    self._glyph_atlases[size] = atlas
+        self.mode = mode
+        self.last_spawn = float("-inf")  # game_time of the last spawn; first one is immediate
+        self.spawn_interval = mode.spawn_interval  # 0.8 s in classic mode for more action
 
     def run(self):
+        self.events.start()
+        try:
+            for sink in self.sinks:
+                sink.start()
+            self._run()
+        finally:
+            for sink in self.sinks:
+                sink.close()
+                print(f"🎥 {sink.summary()}")
+            self.events.close()
+            if self.events.writer is not None:
+                print(f"📊 Event log: {self.events.summary()}")
+
+    def _run(self):
         # Use USB webcam on index 1 by default. Adjust if your system assigns a
         # different index.
         with Camera(src=1) as cam:
@@ -63,113 +138,262 @@ class Game:
                 "AR Catcher", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN
             )
 
-            prev_time = time.time()
+            if self.target_fps is None:
+                self.scheduler.set_target(cam.fps or 30.0)
+            self._full_fps = self.scheduler.target_fps
+            # Recordings play back at the rate frames are produced
+            for sink in self.sinks:
+                sink.set_fps(self._full_fps or cam.fps or 30.0)
 
             # Countdown before match starts -------------------------------------
             self._countdown(cam)
+            self.scheduler.reset()
+            self.events.emit("match_start", mode=self.mode.name)
 
             while True:
-                frame = cam.read()
-                frame = cv2.resize(frame, (self.width, self.height))
-                # Mirror correction: flip horizontally so movement matches screen direction
-                frame = cv2.flip(frame, 1)
-
-                curr_time = time.time()
-                dt = curr_time - prev_time
-                prev_time = curr_time
-                
-                self.game_time += dt
-
-                # Update difficulty and spawn objects
-                self.spawner.update_difficulty(dt)
-                if curr_time - self.last_spawn > self.spawn_interval:
-                    self.objects.append(self.spawner.spawn())
-                    self.last_spawn = curr_time
-
-                # Update objects
-                for obj in self.objects:
-                    obj.update(dt)
-
-                # Remove off-screen objects
-                self.objects = [o for o in self.objects if not o.is_off_screen(self.height)]
-
-                # Update power-ups
-                self._update_power_ups(dt)
+                self.arena.begin_frame()
+                tick = self.scheduler.begin_frame()
+                frame = self._read_frame(cam)
+                self.latency.begin(cam.last_timestamp)
 
                 # Hand detection -------------------------------------------------
-                results = self.tracker.process(frame)
-                # (x, y, player_id)
-                hand_pixels: List[Tuple[int, int, int]] = []
-
-                if results.multi_hand_landmarks:
-                    for pid, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                        if pid > 1:  # support max two players
-                            break
-                        pixels = HandTracker.landmarks_to_pixels(
-                            hand_landmarks, self.width, self.height
-                        )
-                        tip_x, tip_y = pixels[HandTracker.INDEX_TIP_ID]
-                        hand_pixels.append((tip_x, tip_y, pid))
-
-                        # Custom colored skeleton per player
-                        mp.solutions.drawing_utils.draw_landmarks(
-                            frame,
-                            hand_landmarks,
-                            self.tracker._mp_hands.HAND_CONNECTIONS,
-                            mp.solutions.drawing_utils.DrawingSpec(color=self.PLAYER_COLORS[pid], thickness=2, circle_radius=2),
-                            mp.solutions.drawing_utils.DrawingSpec(color=self.PLAYER_COLORS[pid], thickness=2),
-                        )
-
-                # Collision detection --------------------------------------------
-                for hx, hy, pid in hand_pixels:
-                    for obj in self.objects:
-                        dx, dy = hx - obj.x, hy - obj.y
-                        if (dx * dx + dy * dy) <= obj.radius * obj.radius:
-                            self._handle_collision(obj, pid, hx, hy)
-                            break
+                # Hand index doubles as player id; support max two players.
+                hands = self._detect_hands(frame)
+                self.latency.stamp("detection")
+                if self.attract is not None and self.attract.update(len(hands) > 0):
+                    self._switch_power_mode()
+
+                if self._attract_active:
+                    self._draw_attract_screen(frame)
+                    self._show(frame)
+                    key = cv2.waitKey(1) & 0xFF
+                    self.latency.end()
+                    if key == ord("q"):
+                        break
+                    self.scheduler.wait()
+                    continue
 
-                # Draw objects with enhanced effects
-                for obj in self.objects:
-                    self._draw_object_with_effects(frame, obj)
+                HandTracker.draw_arrays(frame, hands, self.PLAYER_COLORS)
 
-                # ---------------- Ambient background particles -------------------
-                self._update_and_draw_particles(frame, dt)
+                # Simulation and collision detection, one fixed step at a time so
+                # catch-up steps spawn on schedule and fast objects cannot pass
+                # through a fingertip between steps
+                tips = hands.points(HandTracker.INDEX_TIP_ID)
+                for _ in range(tick.steps):
+                    self._update_world(tick.dt)
+                    self._detect_collisions(tips)
+                    if self.winner is not None:
+                        break
+                self.latency.stamp("collision")
 
-                # ------------------- UI: Enhanced two-player score boxes --------
-                self._draw_enhanced_ui(frame)
-
-                # Floating pop-ups -----------------------------------------------
-                self._update_and_draw_popups(frame, dt)
-                
-                # Explosion effects
-                self._update_and_draw_explosions(frame, dt)
+                if tick.render:
+                    self._render(frame, tick.render_dt)
 
                 # Victory condition overlay --------------------------------------
                 if self.winner is not None:
                     # Mostrar pantalla de victoria
                     self._show_victory_screen(frame)
 
+                    if self.winner == -1:
+                        # Quit from the pause screen: not a finished match
+                        self.events.emit(
+                            "match_abort",
+                            scores=list(self.scores),
+                            duration=round(self.game_time, 2),
+                        )
+                    else:
+                        self.events.emit(
+                            "match_end",
+                            winner=self.winner,
+                            scores=list(self.scores),
+                            duration=round(self.game_time, 2),
+                        )
+
                     # Pequeña pausa para que los jugadores vean el resultado
-                    cv2.imshow("AR Catcher", frame)
+                    self._show(frame)
                     cv2.waitKey(1500)
 
                     # Reiniciar estado del juego y lanzar una nueva cuenta atrás
                     self._reset_game_state()
                     self._countdown(cam)
+                    self.scheduler.reset()
+                    self.events.emit("match_start", mode=self.mode.name)
 
                     # Continuar sin salir del bucle principal
                     continue
 
-                cv2.imshow("AR Catcher", frame)
+                if tick.render:
+                    self._show(frame)
                 key = cv2.waitKey(1) & 0xFF
+                # HighGUI paints the window inside waitKey
+                if tick.render:
+                    self.latency.stamp("present")
+                self.latency.end()
+                self._report_latency()
                 if key == ord("q"):
                     break
                 elif key == ord("p"):
                     # Pause functionality
                     self._pause_game(frame)
+                    self.scheduler.reset()
+
+                self.scheduler.wait()
 
         cv2.destroyAllWindows()
 
+        if isinstance(self.tracker, HybridHandTracker):
+            print(
+                f"🖐️ Hand inference ran on {self.tracker.inference_ratio:.0%} of frames "
+                f"({self.tracker.detections} detections, {self.tracker.tracked_frames} tracked, "
+                f"{self.tracker.gate_skips} skipped by the motion gate)"
+            )
+        if self.tracker.motion_gate is not None:
+            print(f"💤 Motion gate {self.tracker.motion_gate.summary()}")
+        print(f"🧮 Frame arena: {self.arena.summary(self.width * self.height * 3)}")
+        print(f"⏱️ Latency {self.latency.summary()}")
+        print(f"🎞️ Pacing: {self.scheduler.summary()}")
+        if self.attract is not None:
+            print(f"😴 Attract mode: {self.attract.summary()}")
+        print(f"🌀 Sprite transform cache: {SpriteManager.transform_summary()}")
+
+    def _report_latency(self) -> None:
+        """Print the rolling latency percentiles every ``latency_report`` seconds."""
+        if not self.latency_report:
+            return
+        now = time.monotonic()
+        if now - self._last_latency_report >= self.latency_report:
+            self._last_latency_report = now
+            print(f"⏱️ {self.latency.summary()}")
+
+    # --------------------------- Attract mode ---------------------------
+    @property
+    def _attract_active(self) -> bool:
+        return self.attract is not None and self.attract.active
+
+    def _detect_hands(self, frame) -> HandResult:
+        """Detect up to two hands; throttled and downscaled in attract mode."""
+        if not self._attract_active:
+            return self.tracker.detect(frame).limit(2)
+        if not self.attract.should_detect(frame):
+            return HandResult.empty(pixel_space=True)
+        scale = self.attract.detect_scale
+        size = (int(self.width * scale), int(self.height * scale))
+        small = cv2.resize(
+            frame, size, dst=self.arena.get("attract", (size[1], size[0], 3)), interpolation=cv2.INTER_AREA
+        )
+        return self.tracker.detect(small, pixel_space=False).to_pixels(self.width, self.height).limit(2)
+
+    def _switch_power_mode(self) -> None:
+        """Apply the frame cap and reset trackers after an attract-mode switch."""
+        active = self.attract.active
+        self.scheduler.set_target(self.attract.fps if active else self._full_fps)
+        self.scheduler.reset()
+        # Tracking state refers to the other detection resolution
+        if isinstance(self.tracker, HybridHandTracker):
+            self.tracker.reset()
+        if self.tracker.motion_gate is not None:
+            self.tracker.motion_gate.reset()
+        print("😴 No players, entering attract mode" if active else "🖐️ Player detected, resuming")
+
+    def _draw_attract_screen(self, frame) -> None:
+        """Minimal idle screen: dimmed camera view and an invitation to play."""
+        cv2.convertScaleAbs(frame, frame, 0.5)
+        self._draw_text_modern(
+            frame,
+            "Show your hand to play!",
+            (self.width // 2, self.height // 2),
+            54,
+            (255, 255, 255),
+            center=True,
+        )
+
+    def _read_frame(self, cam) -> np.ndarray:
+        """Grab the next camera frame, resized and mirrored into arena buffers."""
+        shape = (self.height, self.width, 3)
+        raw = cam.read(out=self.arena.get("capture", cam.frame_shape))
+        resized = cv2.resize(raw, (self.width, self.height), dst=self.arena.get("resized", shape))
+        # Mirror correction: flip horizontally so movement matches screen direction
+        return cv2.flip(resized, 1, dst=self.arena.get("frame", shape))
+
+    def _update_world(self, dt: float) -> None:
+        """Advance the game clock by *dt*, then spawn, move and cull objects."""
+        self.game_time += dt
+
+        # Update difficulty and spawn objects (on game time, so pauses and
+        # catch-up steps keep the spawn rate)
+        self.spawner.update_difficulty(dt)
+        if self.game_time - self.last_spawn > self.spawn_interval:
+            count = self.mode.burst_size
+            if self.mode.max_objects is not None:
+                count = min(count, self.mode.max_objects - len(self.objects))
+            if count > 0:
+                batch = self.spawner.burst(count, self.mode.burst_spread)
+                self.objects.extend(batch)
+                for obj in batch:
+                    self.events.emit("spawn", type=obj.object_type.name)
+            self.last_spawn = self.game_time
+
+        # Update objects
+        for obj in self.objects:
+            obj.update(dt)
+
+        # Remove off-screen objects
+        self.objects = [o for o in self.objects if not o.is_off_screen(self.height)]
+
+        # Update power-ups
+        self._update_power_ups(dt)
+
+    def _render(self, frame, dt: float) -> None:
+        """Draw objects, effects and HUD on top of the camera *frame*."""
+        # Draw objects with enhanced effects
+        for obj in self.objects:
+            self._draw_object_with_effects(frame, obj)
+
+        # ---------------- Ambient background particles -------------------
+        self._update_and_draw_particles(frame, dt)
+
+        # ------------------- UI: Enhanced two-player score boxes --------
+        self._draw_enhanced_ui(frame)
+
+        # Floating pop-ups -----------------------------------------------
+        self._update_and_draw_popups(frame, dt)
+
+        # Explosion effects
+        self._update_and_draw_explosions(frame, dt)
+
+    def _show(self, frame) -> None:
+        """Present *frame* on screen and hand it to the output sinks."""
+        for sink in self.sinks:
+            sink.submit(frame)
+        cv2.imshow("AR Catcher", frame)
+
+    def _detect_collisions(self, tips: np.ndarray) -> None:
+        """Resolve collisions between ``(players, 2)`` fingertips and objects.
+
+        Each fingertip catches at most one object per frame, and an object
+        caught by Player 1 is no longer available to Player 2.
+        """
+        if not self.objects or not len(tips):
+            return
+
+        objects = list(self.objects)
+        centers = np.array([(o.x, o.y) for o in objects], dtype=np.float32)
+        radii = np.array([o.radius for o in objects], dtype=np.float32)
+
+        tips = tips.astype(np.int32)
+        delta = tips[:, None, :] - centers[None, :, :]
+        hits = (delta * delta).sum(axis=2) <= radii * radii  # (players, objects)
+
+        caught: set[int] = set()
+        for pid in range(len(tips)):
+            for idx in np.flatnonzero(hits[pid]):
+                if idx in caught:
+                    continue
+                caught.add(idx)
+                hx, hy = int(tips[pid, 0]), int(tips[pid, 1])
+                self._handle_collision(objects[idx], pid, hx, hy)
+                break
+
     def _handle_collision(self, obj: GameObject, player_id: int, x: int, y: int):
         """Handle collision between player and game object."""
         # Remove the object
@@ -179,6 +403,7 @@ class Game:
         if obj.object_type in [ObjectType.BOMB, ObjectType.MEGA_BOMB, ObjectType.CLUSTER_BOMB]:
             if self.player_shields[player_id]:
                 # Shield protects from bombs
+                self.events.emit("shield_block", player=player_id, type=obj.object_type.name)
                 self._add_popup(x, y, "SHIELDED!", (255, 255, 0), scale=1.5)
                 self.player_shields[player_id] = False
                 self.shield_timers[player_id] = 0.0
@@ -189,8 +414,10 @@ class Game:
                 # Apply bomb effects
                 score_change = obj.score_value
                 self.scores[player_id] += score_change
+                self.events.emit("bomb_hit", player=player_id, type=obj.object_type.name, points=score_change)
                 
                 # Reset combo on bomb hit
+                self._end_combo(player_id, "bomb")
                 self.combo_multipliers[player_id] = 1
                 self.combo_timers[player_id] = 0.0
                 
@@ -214,6 +441,7 @@ class Game:
             # Activate shield power-up
             self.player_shields[player_id] = True
             self.shield_timers[player_id] = 8.0  # 8 seconds duration
+            self.events.emit("shield_pickup", player=player_id)
             self._add_popup(x, y, "SHIELD!", (255, 255, 0), scale=1.5)
             
             # Create power-up aura effect
@@ -225,6 +453,14 @@ class Game:
             self.scores[player_id] += bonus_score
             self.combo_multipliers[player_id] = min(5, self.combo_multipliers[player_id] + 1)
             self.combo_timers[player_id] = 5.0  # 5 seconds to maintain combo
+            self.combo_lengths[player_id] += 1
+            self.events.emit(
+                "catch",
+                player=player_id,
+                type=obj.object_type.name,
+                points=bonus_score,
+                combo=self.combo_multipliers[player_id],
+            )
             
             self._add_popup(x, y, f"+{bonus_score}", (255, 215, 0), scale=1.8)
             
@@ -240,6 +476,14 @@ class Game:
             # Extend combo
             self.combo_multipliers[player_id] = min(5, self.combo_multipliers[player_id] + 1)
             self.combo_timers[player_id] = 5.0
+            self.combo_lengths[player_id] += 1
+            self.events.emit(
+                "catch",
+                player=player_id,
+                type=obj.object_type.name,
+                points=combo_score,
+                combo=self.combo_multipliers[player_id],
+            )
             
             popup_text = f"+{combo_score}"
             popup_color = self.PLAYER_COLORS[player_id]
@@ -261,111 +505,137 @@ class Game:
                 self.shield_timers[i] -= dt
                 if self.shield_timers[i] <= 0:
                     self.player_shields[i] = False
+                    self.events.emit("shield_expired", player=i)
             
             # Update combo timers
             if self.combo_timers[i] > 0:
                 self.combo_timers[i] -= dt
                 if self.combo_timers[i] <= 0:
+                    self._end_combo(i, "timeout")
                     self.combo_multipliers[i] = 1
 
+    def _end_combo(self, player_id: int, reason: str) -> None:
+        """Log the length of *player_id*'s running combo and restart it."""
+        if self.combo_lengths[player_id]:
+            self.events.emit(
+                "combo_end",
+                player=player_id,
+                length=self.combo_lengths[player_id],
+                multiplier=self.combo_multipliers[player_id],
+                reason=reason,
+            )
+            self.combo_lengths[player_id] = 0
+
     def _draw_object_with_effects(self, frame, obj: GameObject):
         """Draw objects with enhanced visual effects."""
-        sprite_bgr, alpha = SpriteManager.get(obj.sprite_name, obj.radius * 2)
-        
-        # Add glow effects for special objects
-        if obj.object_type == ObjectType.GOLDEN_FRUIT:
-            # Golden glow effect
-            glow_radius = int(obj.radius * 1.5)
-            cv2.circle(frame, (int(obj.x), int(obj.y)), glow_radius, (0, 215, 255), 3)
-        elif obj.object_type == ObjectType.SHIELD:
-            # Shield glow effect
-            glow_radius = int(obj.radius * 1.3)
-            cv2.circle(frame, (int(obj.x), int(obj.y)), glow_radius, (0, 255, 255), 2)
-        elif obj.object_type in [ObjectType.MEGA_BOMB, ObjectType.CLUSTER_BOMB]:
-            # Danger glow effect
-            glow_radius = int(obj.radius * 1.4)
-            color = (0, 0, 255) if obj.object_type == ObjectType.MEGA_BOMB else (0, 255, 255)
-            cv2.circle(frame, (int(obj.x), int(obj.y)), glow_radius, color, 2)
-        
-        blit_alpha(frame, sprite_bgr, alpha, (int(obj.x), int(obj.y)))
+        pos = (int(obj.x), int(obj.y))
+        if obj.animated:
+            # Spinning/pulsing sprites come from the transform frame cache; the
+            # (rotation-invariant) glow ring is a separate cached sprite.
+            ring = self._glow_ring(obj)
+            if ring is not None:
+                blit_premultiplied(frame, *ring, pos)
+            premul, inv_alpha = SpriteManager.get_transformed(
+                obj.sprite_name, obj.radius * 2, obj.angle, obj.scale
+            )
+        else:
+            premul, inv_alpha = self._object_sprite(obj)
+        blit_premultiplied(frame, premul, inv_alpha, pos)
+
+    def _object_sprite(self, obj: GameObject):
+        """Return the cached premultiplied sprite of *obj*, glow ring included."""
+        key = (obj.object_type, obj.sprite_name, obj.radius)
+        entry = self._sprite_cache.get(key)
+        if entry is None:
+            entry = SpriteManager.get_premultiplied(obj.sprite_name, obj.radius * 2)
+            glow = self.GLOW_RINGS.get(obj.object_type)
+            if glow is not None:
+                entry = self._with_glow_ring(*entry, obj.radius, *glow)
+            self._sprite_cache[key] = entry
+        return entry
+
+    def _glow_ring(self, obj: GameObject):
+        """Return the cached glow ring of *obj* alone, or ``None``."""
+        glow = self.GLOW_RINGS.get(obj.object_type)
+        if glow is None:
+            return None
+        key = (obj.object_type, None, obj.radius)
+        entry = self._sprite_cache.get(key)
+        if entry is None:
+            entry = self._render_glow_ring(obj.radius, *glow)
+            self._sprite_cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _render_glow_ring(radius: int, scale: float, color, thickness: int):
+        """Premultiplied glow ring of ``radius * scale`` pixels.
+
+        Thick ``cv2.circle`` outlines are slow to rasterize, so special objects
+        get their ring drawn once and blitted (or baked into the sprite).
+        """
+        ring_radius = int(radius * scale)
+        size = 2 * (ring_radius + thickness + 1)
+        c = size // 2
+        ring = np.zeros((size, size, 3), dtype=np.uint8)
+        ring_alpha = np.zeros((size, size), dtype=np.uint8)
+        cv2.circle(ring, (c, c), ring_radius, color, thickness)
+        cv2.circle(ring_alpha, (c, c), ring_radius, 255, thickness)
+        return ring, cv2.merge([cv2.bitwise_not(ring_alpha)] * 3)
+
+    @classmethod
+    def _with_glow_ring(cls, premul, inv_alpha, radius: int, scale: float, color, thickness: int):
+        """Composite *premul* over its glow ring into a single sprite."""
+        ring, ring_inv = cls._render_glow_ring(radius, scale, color, thickness)
+        c = ring.shape[0] // 2
+
+        # Sprite over ring (premultiplied "over" operator)
+        h, w = premul.shape[:2]
+        top = c - h // 2
+        roi = ring[top : top + h, top : top + w]
+        cv2.multiply(roi, inv_alpha, dst=roi, scale=1 / 255)
+        cv2.add(roi, premul, dst=roi)
+        inv_roi = ring_inv[top : top + h, top : top + w]
+        cv2.multiply(inv_roi, inv_alpha, dst=inv_roi, scale=1 / 255)
+        return ring, ring_inv
 
     def _create_explosion(self, x: int, y: int, bomb_type: ObjectType):
         """Create explosion particle effect."""
         particle_count = 15 if bomb_type == ObjectType.MEGA_BOMB else 10
-        for _ in range(particle_count):
-            self.explosions.append({
-                "x": x + random.uniform(-20, 20),
-                "y": y + random.uniform(-20, 20),
-                "vx": random.uniform(-100, 100),
-                "vy": random.uniform(-150, -50),
-                "life": 0.0,
-                "ttl": random.uniform(0.5, 1.0),
-                "size": random.randint(2, 6),
-                "color": (0, 0, 255) if bomb_type == ObjectType.MEGA_BOMB else (0, 255, 255)
-            })
+        color = (0, 0, 255) if bomb_type == ObjectType.MEGA_BOMB else (0, 255, 255)
+        self.explosions.emit(
+            x, y, particle_count,
+            spread=20, vx_range=(-100, 100), vy_range=(-150, -50),
+            ttl_range=(0.5, 1.0), size_range=(2, 6), color=color,
+        )
 
     def _create_shield_break_effect(self, x: int, y: int):
         """Create shield break visual effect."""
-        for _ in range(8):
-            self.explosions.append({
-                "x": x + random.uniform(-15, 15),
-                "y": y + random.uniform(-15, 15),
-                "vx": random.uniform(-80, 80),
-                "vy": random.uniform(-100, -30),
-                "life": 0.0,
-                "ttl": random.uniform(0.8, 1.2),
-                "size": random.randint(3, 8),
-                "color": (255, 255, 0)  # Yellow for shield
-            })
+        self.explosions.emit(
+            x, y, 8,
+            spread=15, vx_range=(-80, 80), vy_range=(-100, -30),
+            ttl_range=(0.8, 1.2), size_range=(3, 8), color=(255, 255, 0),  # Yellow for shield
+        )
 
     def _create_power_up_effect(self, x: int, y: int, color: Tuple[int, int, int]):
         """Create power-up activation effect."""
-        for _ in range(12):
-            self.explosions.append({
-                "x": x + random.uniform(-25, 25),
-                "y": y + random.uniform(-25, 25),
-                "vx": random.uniform(-60, 60),
-                "vy": random.uniform(-80, -20),
-                "life": 0.0,
-                "ttl": random.uniform(1.0, 1.5),
-                "size": random.randint(2, 5),
-                "color": color
-            })
+        self.explosions.emit(
+            x, y, 12,
+            spread=25, vx_range=(-60, 60), vy_range=(-80, -20),
+            ttl_range=(1.0, 1.5), size_range=(2, 5), color=color,
+        )
 
     def _create_sparkle_effect(self, x: int, y: int, color: Tuple[int, int, int]):
         """Create sparkle effect for golden items."""
-        for _ in range(6):
-            self.explosions.append({
-                "x": x + random.uniform(-20, 20),
-                "y": y + random.uniform(-20, 20),
-                "vx": random.uniform(-40, 40),
-                "vy": random.uniform(-60, -10),
-                "life": 0.0,
-                "ttl": random.uniform(0.6, 1.0),
-                "size": random.randint(1, 4),
-                "color": color
-            })
+        self.explosions.emit(
+            x, y, 6,
+            spread=20, vx_range=(-40, 40), vy_range=(-60, -10),
+            ttl_range=(0.6, 1.0), size_range=(1, 4), color=color,
+        )
 
     def _update_and_draw_explosions(self, frame, dt: float):
         """Update and draw explosion effects."""
-        remain = []
-        for exp in self.explosions:
-            exp["life"] += dt
-            if exp["life"] > exp["ttl"]:
-                continue
-                
-            # Update position
-            exp["x"] += exp["vx"] * dt
-            exp["y"] += exp["vy"] * dt
-            
-            # Draw particle
-            alpha = 1.0 - (exp["life"] / exp["ttl"])
-            size = int(exp["size"] * alpha)
-            if size > 0:
-                cv2.circle(frame, (int(exp["x"]), int(exp["y"])), size, exp["color"], -1)
-            
-            remain.append(exp)
-        self.explosions = remain
+        self.explosions.update(dt)
+        self.explosions.draw(frame)
 
     def _draw_enhanced_ui(self, frame):
         """Draw enhanced UI with power-up indicators."""
@@ -402,15 +672,8 @@ class Game:
 
     def _pause_game(self, frame):
         """Pause the game and show pause screen."""
-        pause_overlay = frame.copy()
-        cv2.rectangle(
-            pause_overlay,
-            (0, 0),
-            (self.width, self.height),
-            (0, 0, 0),
-            -1,
-        )
-        cv2.addWeighted(pause_overlay, 0.8, frame, 0.2, 0, frame)
+        # 80 % black overlay == keep 20 % of the frame
+        cv2.convertScaleAbs(frame, frame, 0.2)
         
         self._draw_text_modern(
             frame,
@@ -429,7 +692,7 @@ class Game:
             center=True,
         )
         
-        cv2.imshow("AR Catcher", frame)
+        self._show(frame)
         while True:
             key = cv2.waitKey(1) & 0xFF
             if key == ord("p"):
@@ -442,38 +705,10 @@ class Game:
     # Helper methods for visual effects
     # ---------------------------------------------------------------------
 
-    def _init_particles(self, count: int = 40) -> None:
-        """Initialize a background particle field."""
-        for _ in range(count):
-            self.particles.append(
-                {
-                    "x": random.uniform(0, self.width),
-                    "y": random.uniform(0, self.height),
-                    "radius": random.randint(1, 3),
-                    "speed": random.uniform(20, 40),
-                    "alpha": random.uniform(0.05, 0.15),
-                    "color": (255, 255, 255),
-                }
-            )
-
     def _update_and_draw_particles(self, frame, dt: float) -> None:
-        """Move particles downward; wrap to top when leaving screen."""
-        overlay = frame.copy()
-        for p in self.particles:
-            p["y"] += p["speed"] * dt
-            if p["y"] - p["radius"] > self.height:
-                p["y"] = -p["radius"]
-                p["x"] = random.uniform(0, self.width)
-
-            cv2.circle(
-                overlay,
-                (int(p["x"]), int(p["y"])),
-                p["radius"],
-                p["color"],
-                -1,
-            )
-
-        cv2.addWeighted(overlay, 0.15, frame, 0.85, 0, frame)
+        """Scroll the pre-rendered particle layers and blend them into *frame*."""
+        self.particles.update(dt)
+        self.particles.draw(frame)
 
     # --------------------------- Floating popups -------------------------
     def _add_popup(self, x: int, y: int, text: str, color: Tuple[int, int, int], scale: float = 1.0) -> None:
@@ -481,11 +716,11 @@ class Game:
             {
                 "x": x,
                 "y": y,
-                "text": text,
                 "color": color,
                 "life": 0.0,
                 "ttl": 1.0,  # seconds
-                "scale": scale,
+                # Rasterized once here; the animation only moves and fades it
+                "sprite": self._text_sprite(text, int(30 * scale)),
             }
         )
 
@@ -501,24 +736,15 @@ class Game:
             y_off = int(progress * -40)
             alpha = 1.0 - progress  # fade out
 
-            overlay = frame.copy()
-            # Apply scale to font size
-            font_size = int(30 * pop.get("scale", 1.0))
-            self._draw_text_modern(
-                overlay,
-                pop["text"],
-                (int(pop["x"]), int(pop["y"] + y_off)),
-                font_size,
-                pop["color"],
-            )
-            cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+            mask, left, top = pop["sprite"]
+            blit_mask(frame, mask, pop["color"], (pop["x"] + left, pop["y"] + y_off + top), alpha)
             remain.append(pop)
 
         self.popups = remain
 
     # --------------------------- Screen flash ----------------------------
     def _flash_screen(self, frame, color: Tuple[int, int, int]) -> None:
-        overlay = frame.copy()
+        overlay = self.arena.like("overlay", frame)
         overlay[:] = color
         cv2.addWeighted(overlay, 0.4, frame, 0.6, 0, frame)
 
@@ -533,6 +759,29 @@ class Game:
         self._font_cache[size] = font
         return font
 
+    def _text_sprite(self, text: str, size: int) -> Tuple[np.ndarray, int, int]:
+        """Coverage mask of *text* and its ``(left, top)`` offset from the pen origin.
+
+        Memoized: popups keep showing the same few strings ("+1", "-2",
+        "SHIELDED!"), so each is rasterized once per size.
+        """
+        key = (text, size)
+        sprite = self._text_sprites.get(key)
+        if sprite is None:
+            atlas = self._glyph_atlases.get(size)
+            if atlas is not None and atlas.covers(text):
+                sprite = atlas.render(text)
+            else:
+                font = self._get_font(size)
+                left, top, right, bottom = font.getbbox(text)
+                image = Image.new("L", (max(1, right - left), max(1, bottom - top)))
+                ImageDraw.Draw(image).text((-left, -top), text, font=font, fill=255)
+                sprite = (np.asarray(image, dtype=np.uint8), left, top)
+            if len(self._text_sprites) >= 256:
+                self._text_sprites.clear()
+            self._text_sprites[key] = sprite
+        return sprite
+
     def _draw_text_modern(
         self,
         frame,
@@ -541,31 +790,50 @@ class Game:
         size: int,
         color: Tuple[int, int, int] = (255, 255, 255),
         center: bool = False,
+        alpha: float = 1.0,
     ) -> None:
-        """Draw anti-aliased text using Pillow for modern look."""
+        """Draw anti-aliased text using Pillow for modern look.
+
+        Text of a size baked into the asset bundle is composed from its glyph
+        atlas instead. Otherwise only the rectangle covered by the text goes through Pillow; with
+        ``alpha < 1`` the text is blended into that rectangle only.
+        """
+        atlas = self._glyph_atlases.get(size)
+        if atlas is not None and atlas.covers(text):
+            # Pre-rasterized glyphs from the asset bundle: no FreeType work
+            x, y = pos
+            if center:
+                left, top, right, bottom = atlas.getbbox(text)
+                x -= (right - left) // 2
+                y -= (bottom - top) // 2
+            atlas.draw(frame, text, (x, y), color, alpha)
+            return
+
         b, g, r = color  # convert to RGB
         rgb_color = (r, g, b)
-
-        # Create transparent canvas
-        img_pil = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(img_pil)
         font = self._get_font(size)
 
         x, y = pos
+        left, top, right, bottom = font.getbbox(text)
         if center:
-            # Pillow >= 8 provides textbbox; fall back to textsize otherwise
-            if hasattr(draw, "textbbox"):
-                bbox = draw.textbbox((0, 0), text, font=font)
-                w = bbox[2] - bbox[0]
-                h = bbox[3] - bbox[1]
-                x -= w // 2
-                y -= h // 2
-            else:
-                w, h = draw.textsize(text, font=font)  # type: ignore[arg-type]
-
-        draw.text((x, y), text, font=font, fill=rgb_color)
-
-        frame[:] = cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
+            x -= (right - left) // 2
+            y -= (bottom - top) // 2
+
+        # Text rectangle (with a small margin for anti-aliasing), clipped
+        x0, y0 = max(0, x + left - 2), max(0, y + top - 2)
+        x1, y1 = min(frame.shape[1], x + right + 2), min(frame.shape[0], y + bottom + 2)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        roi = frame[y0:y1, x0:x1]
+        img_pil = Image.fromarray(cv2.cvtColor(roi, cv2.COLOR_BGR2RGB))
+        ImageDraw.Draw(img_pil).text((x - x0, y - y0), text, font=font, fill=rgb_color)
+        rendered = cv2.cvtColor(np.asarray(img_pil), cv2.COLOR_RGB2BGR)
+
+        if alpha >= 1.0:
+            roi[:] = rendered
+        else:
+            cv2.addWeighted(rendered, alpha, roi, 1 - alpha, 0, roi)
 
     # -------------------------- Glass panels -----------------------------
     def _draw_glass_panel(self, frame, top_left: Tuple[int, int], size: Tuple[int, int]) -> None:
@@ -574,8 +842,7 @@ class Game:
 
         # Extract region, blur it, and merge back for frosted effect
         roi = frame[y : y + h, x : x + w]
-        blurred = cv2.GaussianBlur(roi, (15, 15), 0)
-        frame[y : y + h, x : x + w] = blurred
+        cv2.GaussianBlur(roi, (15, 15), 0, dst=roi)
 
         # Neon outline
         cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 255, 255), 1)
@@ -584,22 +851,19 @@ class Game:
     def _countdown(self, cam) -> None:
         """Display 3-2-1-GO before the main loop."""
         for text in ["3", "2", "1", "GO"]:
-            frame = cam.read()
-            frame = cv2.resize(frame, (self.width, self.height))
-            frame = cv2.flip(frame, 1)
+            frame = self._read_frame(cam)
 
-            overlay = frame.copy()
             self._draw_text_modern(
-                overlay,
+                frame,
                 text,
                 (self.width // 2, self.height // 2),
                 120,
                 (255, 255, 255),
                 center=True,
+                alpha=0.8,
             )
-            cv2.addWeighted(overlay, 0.8, frame, 0.2, 0, frame)
 
-            cv2.imshow("AR Catcher", frame)
+            self._show(frame)
             cv2.waitKey(800)
 
 
@@ -618,23 +882,18 @@ class Game:
         self.shield_timers = [0.0, 0.0]
         self.combo_multipliers = [1, 1]
         self.combo_timers = [0.0, 0.0]
+        self.combo_lengths = [0, 0]
 
         # Reiniciar generador de objetos
         self.spawner.reset()
-        self.last_spawn = 0.0
+        self.last_spawn = float("-inf")
         self.game_time = 0.0
 
     def _show_victory_screen(self, frame):
         """Show the victory screen and wait for key press."""
-        victory_overlay = frame.copy()
-        cv2.rectangle(
-            victory_overlay,
-            (0, self.height // 2 - 60),
-            (self.width, self.height // 2 + 60),
-            (0, 0, 0),
-            -1,
-        )
-        cv2.addWeighted(victory_overlay, 0.7, frame, 0.3, 0, frame)
+        # 70 % black band across the middle of the screen
+        band = frame[self.height // 2 - 60 : self.height // 2 + 61]
+        cv2.convertScaleAbs(band, band, 0.3)
         
         msg = f"PLAYER {self.winner + 1} WINS!"
         self._draw_text_modern(
@@ -646,7 +905,7 @@ class Game:
             center=False,
         )
         
-        cv2.imshow("AR Catcher", frame)
+        self._show(frame)
         cv2.waitKey(3000)  # show for 3 seconds
 
 
@@ -655,5 +914,134 @@ class Game:
 # -------------------------------------------------------------------------
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AR Catcher")
+    parser.add_argument(
+        "--detect-every",
+        type=int,
+        default=1,
+        help="Run full hand detection every N frames and track fingertips "
+        "with optical flow in between (default: 1 = detect every frame)",
+    )
+    parser.add_argument(
+        "--motion-gate",
+        action="store_true",
+        help="Reuse the previous hand detection while the scene is static",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record the match into segmented video files inside DIR",
+    )
+    parser.add_argument(
+        "--segment-seconds",
+        type=float,
+        default=60.0,
+        help="Length of each recorded video segment (default: 60)",
+    )
+    parser.add_argument(
+        "--stream",
+        metavar="PORT",
+        type=int,
+        help="Serve a spectator MJPEG stream on http://0.0.0.0:PORT/",
+    )
+    parser.add_argument(
+        "--particles",
+        type=int,
+        default=80,
+        help="Number of ambient background particles (default: 80)",
+    )
+    parser.add_argument(
+        "--trace-alloc",
+        action="store_true",
+        help="Track per-frame transient memory with tracemalloc (slower)",
+    )
+    parser.add_argument(
+        "--mode",
+        default="classic",
+        help="Game mode: classic, frenzy or one from --modes-file (default: classic)",
+    )
+    parser.add_argument(
+        "--modes-file",
+        metavar="JSON",
+        help="JSON file with extra game modes and spawn-table overrides",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        help="Override the number of objects spawned per burst",
+    )
+    parser.add_argument(
+        "--latency",
+        metavar="SECONDS",
+        type=float,
+        help="Print rolling motion-to-photon latency percentiles every SECONDS",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        help="Target frame rate (default: the camera's native rate, 0 = uncapped)",
+    )
+    parser.add_argument(
+        "--late-policy",
+        choices=LATE_POLICIES,
+        default="skip_render",
+        help="What to do with frames that miss their deadline (default: skip_render)",
+    )
+    parser.add_argument(
+        "--idle-after",
+        metavar="SECONDS",
+        type=float,
+        default=30.0,
+        help="Enter low-power attract mode after SECONDS without hands (0 = never, default: 30)",
+    )
+    parser.add_argument(
+        "--events",
+        metavar="PATH",
+        help="Log match events: a directory for rotating JSONL files, or a .db/.sqlite file",
+    )
+    args = parser.parse_args()
+
+    modes = dict(GAME_MODES)
+    if args.modes_file:
+        modes.update(load_modes(args.modes_file))
+    if args.mode not in modes:
+        parser.error(f"unknown mode {args.mode!r} (choose from {', '.join(sorted(modes))})")
+    mode = modes[args.mode]
+    if args.burst is not None:
+        mode = dataclasses.replace(mode, burst_size=args.burst)
+
+    sinks: List[FrameSink] = []
+    if args.record:
+        sinks.append(VideoFileSink(args.record, segment_seconds=args.segment_seconds))
+    if args.stream:
+        sinks.append(MJPEGStreamSink(port=args.stream))
+
+    events = None
+    if args.events:
+        if args.events.endswith((".db", ".sqlite")):
+            events = EventLog(SQLiteWriter(args.events))
+        else:
+            events = EventLog(JSONLWriter(args.events))
+
+    gate = MotionGate() if args.motion_gate else None
+    arena = FrameArena(trace_memory=args.trace_alloc)
+    if args.detect_every > 1:
+        tracker = HybridHandTracker(detect_every=args.detect_every, motion_gate=gate, arena=arena)
+    else:
+        tracker = HandTracker(motion_gate=gate, arena=arena)
+    Game(
+        tracker=tracker,
+        sinks=sinks,
+        particle_count=args.particles,
+        mode=mode,
+        latency_report=args.latency,
+        target_fps=args.fps,
+        late_policy=args.late_policy,
+        attract=AttractMode(idle_after=args.idle_after) if args.idle_after > 0 else None,
+        events=events,
+    ).run()
+
+
 if __name__ == "__main__":
-    Game().run()
+    main()
@@ -0,0 +1,69 @@
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# span name -> (start event, end event)
+PIPELINE_SPANS: Dict[str, Tuple[str, str]] = {
+    "capture→detection": ("capture", "detection"),
+    "detection→collision": ("detection", "collision"),
+    "capture→present": ("capture", "present"),
+}
+
+
+class LatencyTracker:
+    """Rolling motion-to-photon latency statistics of the frame pipeline.
+
+    Every frame is stamped with :func:`time.monotonic` at a few pipeline
+    events (``capture`` from the camera, then ``detection``, ``collision``,
+    ``present``). When a frame ends, the time between the start and end
+    event of every span is pushed into a ring buffer of the last ``window``
+    frames, from which percentiles are computed on demand.
+    """
+
+    def __init__(self, window: int = 300, spans: Optional[Dict[str, Tuple[str, str]]] = None) -> None:
+        self.spans = dict(PIPELINE_SPANS if spans is None else spans)
+        self.window = window
+        self._samples = np.full((len(self.spans), window), np.nan)
+        self._cursor = 0
+        self.frames = 0
+        self._stamps: Dict[str, float] = {}
+
+    def begin(self, capture_time: Optional[float] = None) -> None:
+        """Start a frame captured at *capture_time* (default: now)."""
+        self._stamps.clear()
+        self._stamps["capture"] = time.monotonic() if capture_time is None else capture_time
+
+    def stamp(self, event: str, t: Optional[float] = None) -> None:
+        self._stamps[event] = time.monotonic() if t is None else t
+
+    def end(self) -> None:
+        """Record the spans of the current frame (missing events are skipped)."""
+        if not self._stamps:
+            return
+        col = self._cursor
+        for row, (start, end) in enumerate(self.spans.values()):
+            t0, t1 = self._stamps.get(start), self._stamps.get(end)
+            self._samples[row, col] = t1 - t0 if t0 is not None and t1 is not None else np.nan
+        self._cursor = (col + 1) % self.window
+        self.frames += 1
+        self._stamps.clear()
+
+    def percentiles(self, q: Sequence[float] = (50, 95, 99)) -> Dict[str, Dict[str, float]]:
+        """Span name -> ``{"p50": ms, ...}`` over the rolling window."""
+        result: Dict[str, Dict[str, float]] = {}
+        for name, row in zip(self.spans, self._samples):
+            values = row[~np.isnan(row)]
+            if values.size:
+                ms = np.percentile(values, q) * 1000.0
+                result[name] = {f"p{p:g}": float(v) for p, v in zip(q, ms)}
+        return result
+
+    def summary(self) -> str:
+        parts = []
+        for name, stats in self.percentiles().items():
+            parts.append(f"{name} " + "/".join(f"{v:.1f}" for v in stats.values()))
+        if not parts:
+            return "no frames measured"
+        return "p50/p95/p99 ms: " + ", ".join(parts)
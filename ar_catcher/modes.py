@@ -0,0 +1,68 @@
+import dataclasses
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from ar_catcher.objects import SPAWN_TABLE, ObjectType, SpawnRule
+
+
+@dataclass(frozen=True)
+class GameMode:
+    """Spawning parameters of a game mode.
+
+    Every ``spawn_interval`` seconds ``burst_size`` objects are spawned,
+    spread over ``burst_spread`` pixels above the top edge so a burst rains
+    down instead of arriving as a single row. ``max_objects`` caps the number
+    of objects alive at once (``None`` = unlimited). ``spawn_table``
+    replaces the default :data:`SPAWN_TABLE` of the spawner.
+    """
+
+    name: str
+    spawn_interval: float = 0.8
+    burst_size: int = 1
+    burst_spread: float = 0.0
+    max_objects: Optional[int] = None
+    spawn_table: Optional[Dict[ObjectType, SpawnRule]] = field(default=None, compare=False)
+
+
+GAME_MODES: Dict[str, GameMode] = {
+    "classic": GameMode("classic"),
+    # Stress/"frenzy" event: ~200+ objects on screen at a time
+    "frenzy": GameMode(
+        "frenzy",
+        spawn_interval=1.0,
+        burst_size=40,
+        burst_spread=360.0,
+        max_objects=600,
+    ),
+}
+
+
+def load_modes(path: str | Path) -> Dict[str, GameMode]:
+    """Read extra game modes from a JSON file.
+
+    The file maps mode names to :class:`GameMode` fields. An optional
+    ``"spawns"`` object overrides rows of the default spawn table by type
+    name, e.g.::
+
+        {"bombs-only": {"burst_size": 5,
+                        "spawns": {"APPLE": {"weight": 0}, "BOMB": {"velocity": [300, 400], "spin": 360}}}}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    modes: Dict[str, GameMode] = {}
+    for name, options in data.items():
+        options = dict(options)
+        spawns = options.pop("spawns", None)
+        table = None
+        if spawns:
+            table = dict(SPAWN_TABLE)
+            for type_name, overrides in spawns.items():
+                obj_type = ObjectType[type_name.upper()]
+                if "velocity" in overrides:
+                    overrides = {**overrides, "velocity": tuple(overrides["velocity"])}
+                table[obj_type] = dataclasses.replace(table[obj_type], **overrides)
+        modes[name] = GameMode(name, spawn_table=table, **options)
+    return modes
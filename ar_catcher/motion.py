@@ -0,0 +1,116 @@
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Cheap frame-difference test deciding whether hand inference can be skipped.
+
+    Every frame is shrunk to a ``width``-pixel-wide grayscale thumbnail and
+    compared with the thumbnail of the last frame that ran inference. The
+    previous detection is reused when both
+
+    * the fraction of changed pixels over the whole scene is below
+      ``scene_threshold``, and
+    * the fraction of changed pixels inside the (padded) hand region is below
+      ``region_threshold``.
+
+    A pixel counts as changed when it differs by more than
+    ``pixel_threshold`` grey levels. After ``max_skipped`` consecutive skips
+    inference is forced so slow drift cannot hide a change forever.
+    """
+
+    def __init__(
+        self,
+        width: int = 64,
+        pixel_threshold: int = 12,
+        scene_threshold: float = 0.01,
+        region_threshold: float = 0.02,
+        region_padding: float = 0.1,
+        max_skipped: int = 15,
+    ) -> None:
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.scene_threshold = scene_threshold
+        self.region_threshold = region_threshold
+        self.region_padding = region_padding
+        self.max_skipped = max_skipped
+
+        self._reference: Optional[np.ndarray] = None
+        self._small_bgr: Optional[np.ndarray] = None
+        self._consecutive = 0
+
+        # Counters
+        self.checks = 0
+        self.skipped = 0
+
+    @property
+    def inferences(self) -> int:
+        return self.checks - self.skipped
+
+    @property
+    def skip_ratio(self) -> float:
+        return self.skipped / self.checks if self.checks else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"skipped {self.skipped}/{self.checks} inferences "
+            f"({self.skip_ratio:.0%})"
+        )
+
+    def reset(self) -> None:
+        """Force inference on the next frame."""
+        self._reference = None
+        self._consecutive = 0
+
+    def should_skip(self, frame_bgr: np.ndarray, hand_bbox=None) -> bool:
+        """Return ``True`` when the previous detection can be reused for *frame_bgr*.
+
+        ``hand_bbox`` is the ``(x0, y0, x1, y1)`` box around the previously
+        detected hands in normalized ``[0, 1]`` coordinates, or ``None`` when
+        no hand was visible.
+        """
+        self.checks += 1
+        small = self._thumbnail(frame_bgr)
+
+        if self._is_static(small, hand_bbox) and self._consecutive < self.max_skipped:
+            self._consecutive += 1
+            self.skipped += 1
+            return True
+
+        # Inference will run on this frame: it becomes the new reference.
+        self._reference = small
+        self._consecutive = 0
+        return False
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _thumbnail(self, frame_bgr: np.ndarray) -> np.ndarray:
+        h, w = frame_bgr.shape[:2]
+        size = (self.width, max(1, round(h * self.width / w)))
+        if self._small_bgr is None or self._small_bgr.shape[:2] != size[::-1]:
+            self._small_bgr = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        cv2.resize(frame_bgr, size, dst=self._small_bgr, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(self._small_bgr, cv2.COLOR_BGR2GRAY)
+
+    def _is_static(self, small: np.ndarray, hand_bbox) -> bool:
+        if self._reference is None or self._reference.shape != small.shape:
+            return False
+
+        changed = cv2.absdiff(small, self._reference) > self.pixel_threshold
+        if changed.mean() > self.scene_threshold:
+            return False
+        if hand_bbox is None:
+            return True
+
+        h, w = small.shape
+        pad = self.region_padding
+        x0, y0, x1, y1 = hand_bbox
+        x0 = int(np.clip((x0 - pad) * w, 0, w - 1))
+        y0 = int(np.clip((y0 - pad) * h, 0, h - 1))
+        x1 = int(np.clip((x1 + pad) * w, x0 + 1, w))
+        y1 = int(np.clip((y1 + pad) * h, y0 + 1, h))
+        return changed[y0:y1, x0:x1].mean() <= self.region_threshold
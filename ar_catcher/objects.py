@@ -1,8 +1,11 @@
+import math
 import random
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
+import numpy as np
+
 from .sprite_manager import SpriteManager
 
 
@@ -28,13 +31,33 @@ class GameObject:
     object_type: ObjectType
     score_value: int
     special_effect: Optional[str] = None
+    angle: float = 0.0  # degrees
+    angular_velocity: float = 0.0  # degrees per second
+    pulse: float = 0.0  # relative size change of the pulse animation
+    age: float = 0.0
+
+    PULSE_HZ = 2.0
 
     @property
     def sprite(self) -> Tuple:
         return SpriteManager.get(self.sprite_name)
 
+    @property
+    def animated(self) -> bool:
+        return bool(self.angular_velocity or self.pulse)
+
+    @property
+    def scale(self) -> float:
+        """Current draw scale of the pulse animation (the hit radius is unchanged)."""
+        if not self.pulse:
+            return 1.0
+        return 1.0 + self.pulse * math.sin(2.0 * math.pi * self.PULSE_HZ * self.age)
+
     def update(self, dt: float):
         self.y += self.velocity_y * dt
+        self.age += dt
+        if self.angular_velocity:
+            self.angle = (self.angle + self.angular_velocity * dt) % 360.0
 
         # Add some horizontal movement for more dynamic gameplay
         if self.object_type in [ObjectType.CLUSTER_BOMB, ObjectType.MEGA_BOMB]:
@@ -44,13 +67,96 @@ class GameObject:
         return self.y - self.radius > screen_height
 
 
+@dataclass(frozen=True)
+class SpawnRule:
+    """How often and how fast an object type spawns.
+
+    ``group`` decides what ``weight`` means: ``"bomb"`` types share the
+    spawner's ``bomb_spawn_rate`` in proportion to their weights, ``"bonus"``
+    weights are absolute probabilities, and ``"fruit"`` types split whatever
+    probability is left. The radius always comes from :class:`ObjectType`.
+    Objects spin at up to ``spin`` degrees per second either way and pulse
+    by ``pulse`` of their size.
+    """
+
+    group: str
+    weight: float
+    velocity: Tuple[float, float]
+    spin: float = 0.0
+    pulse: float = 0.0
+
+
+SPAWN_TABLE: Dict[ObjectType, SpawnRule] = {
+    ObjectType.BOMB: SpawnRule("bomb", 0.5, (120, 220), spin=120.0),
+    ObjectType.CLUSTER_BOMB: SpawnRule("bomb", 0.3, (200, 280), spin=240.0),  # Faster but smaller
+    ObjectType.MEGA_BOMB: SpawnRule("bomb", 0.2, (80, 150), spin=60.0),  # Slower but bigger
+    ObjectType.GOLDEN_FRUIT: SpawnRule("bonus", 0.05, (100, 180), pulse=0.1),  # 5% chance
+    ObjectType.SHIELD: SpawnRule("bonus", 0.03, (150, 220)),  # 3% chance
+    ObjectType.APPLE: SpawnRule("fruit", 1.0, (120, 220)),
+    ObjectType.ORANGE: SpawnRule("fruit", 1.0, (120, 220)),
+    ObjectType.POKEBALL: SpawnRule("fruit", 1.0, (120, 220)),
+}
+
+
 class ObjectSpawner:
-    def __init__(self, screen_width: int, screen_height: int):
+    """Spawns falling objects following a :data:`SPAWN_TABLE`.
+
+    The table is flattened into per-type arrays once, and the cumulative
+    distribution over types is only recomputed when ``bomb_spawn_rate``
+    changes, so drawing a batch of objects is a single vectorized sample.
+    """
+
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        table: Optional[Dict[ObjectType, SpawnRule]] = None,
+        seed: Optional[int] = None,
+    ):
         self.sw = screen_width
         self.sh = screen_height
         self.difficulty_timer = 0.0
+        self._rng = np.random.default_rng(seed)
+
+        table = SPAWN_TABLE if table is None else table
+        self._types = list(table)
+        rules = list(table.values())
+        self._groups = np.array([rule.group for rule in rules])
+        self._weights = np.array([rule.weight for rule in rules], dtype=np.float64)
+        velocity = np.array([rule.velocity for rule in rules], dtype=np.float64).reshape(-1, 2)
+        self._vel_low = velocity[:, 0]
+        self._vel_span = velocity[:, 1] - velocity[:, 0]
+        self._spin = np.array([rule.spin for rule in rules], dtype=np.float64)
+        self._pulse = [rule.pulse for rule in rules]
+        self._radii = [t.value[1] for t in self._types]
+        self._cdf = np.ones(len(rules))
         self.bomb_spawn_rate = 0.4  # Start with 40% bomb chance
 
+    @property
+    def bomb_spawn_rate(self) -> float:
+        return self._bomb_spawn_rate
+
+    @bomb_spawn_rate.setter
+    def bomb_spawn_rate(self, rate: float) -> None:
+        self._bomb_spawn_rate = rate
+        self._cdf = self._cumulative(rate)
+
+    def _cumulative(self, bomb_rate: float) -> np.ndarray:
+        """Cumulative spawn distribution over ``self._types`` for *bomb_rate*."""
+        probs = np.zeros_like(self._weights)
+        bonus = self._groups == "bonus"
+        probs[bonus] = self._weights[bonus]
+        remaining = 1.0 - probs.sum()
+        for group, mass in (("bomb", bomb_rate), ("fruit", remaining - bomb_rate)):
+            mask = self._groups == group
+            total = self._weights[mask].sum()
+            if total > 0:
+                probs[mask] = self._weights[mask] / total * max(mass, 0.0)
+        cdf = np.cumsum(probs)
+        if cdf[-1] <= 0:
+            raise ValueError("Spawn table gives every object type a zero probability")
+        return cdf / cdf[-1]
+
     def update_difficulty(self, dt: float):
         """Increase difficulty over time."""
         self.difficulty_timer += dt
@@ -59,56 +165,46 @@ class ObjectSpawner:
             self.bomb_spawn_rate = min(0.7, self.bomb_spawn_rate + 0.05)
             self.difficulty_timer = 0.0
 
-    def spawn(self):
-        x = random.randint(20, self.sw - 20)
-        y = -20
-
-        # Determine object type based on probabilities
-        rand_val = random.random()
-
-        if rand_val < self.bomb_spawn_rate:
-            # Bomb types with different probabilities
-            bomb_rand = random.random()
-            if bomb_rand < 0.5:
-                obj_type = ObjectType.BOMB
-            elif bomb_rand < 0.8:
-                obj_type = ObjectType.CLUSTER_BOMB
-            else:
-                obj_type = ObjectType.MEGA_BOMB
-        elif rand_val < self.bomb_spawn_rate + 0.05:  # 5% chance for golden fruit
-            obj_type = ObjectType.GOLDEN_FRUIT
-        elif rand_val < self.bomb_spawn_rate + 0.08:  # 3% chance for shield
-            obj_type = ObjectType.SHIELD
-        else:
-            # Regular fruits
-            obj_type = random.choice([ObjectType.APPLE, ObjectType.ORANGE, ObjectType.POKEBALL])
-
-        # Set properties based on object type
-        if obj_type == ObjectType.MEGA_BOMB:
-            radius = 35
-            velocity = random.uniform(80, 150)  # Slower but bigger
-        elif obj_type == ObjectType.CLUSTER_BOMB:
-            radius = 22
-            velocity = random.uniform(200, 280)  # Faster but smaller
-        elif obj_type == ObjectType.GOLDEN_FRUIT:
-            radius = 30
-            velocity = random.uniform(100, 180)
-        elif obj_type == ObjectType.SHIELD:
-            radius = 25
-            velocity = random.uniform(150, 220)
-        else:
-            radius = obj_type.value[1]
-            velocity = random.uniform(120, 220)
-
-        return GameObject(
-            x=x,
-            y=y,
-            radius=radius,
-            velocity_y=velocity,
-            sprite_name=obj_type.value[0],
-            object_type=obj_type,
-            score_value=obj_type.value[2]
-        )
+    def spawn(self) -> GameObject:
+        return self.spawn_batch(1)[0]
+
+    def spawn_batch(self, n: int, y_spread: float = 0.0) -> List[GameObject]:
+        """Spawn *n* objects, staggered up to ``y_spread`` pixels above the screen.
+
+        Types, positions, velocities and spins of the whole batch come from
+        one ``(n, 5)`` uniform sample.
+        """
+        if n <= 0:
+            return []
+        u = self._rng.random((n, 5))
+        kinds = np.minimum(np.searchsorted(self._cdf, u[:, 0], side="right"), len(self._types) - 1)
+        xs = (20 + u[:, 1] * (self.sw - 39)).astype(np.int64)  # randint(20, sw - 20)
+        ys = -20 - u[:, 2] * y_spread
+        velocities = self._vel_low[kinds] + u[:, 3] * self._vel_span[kinds]
+        spins = (2.0 * u[:, 4] - 1.0) * self._spin[kinds]
+
+        objects = []
+        columns = zip(kinds.tolist(), xs.tolist(), ys.tolist(), velocities.tolist(), spins.tolist())
+        for kind, x, y, velocity, spin in columns:
+            obj_type = self._types[kind]
+            objects.append(
+                GameObject(
+                    x=x,
+                    y=y,
+                    radius=self._radii[kind],
+                    velocity_y=velocity,
+                    sprite_name=obj_type.value[0],
+                    object_type=obj_type,
+                    score_value=obj_type.value[2],
+                    angular_velocity=spin,
+                    pulse=self._pulse[kind],
+                )
+            )
+        return objects
+
+    def burst(self, n: int, y_spread: float = 0.0) -> List[GameObject]:
+        """Spawn *n* objects staggered up to ``y_spread`` pixels above the screen."""
+        return self.spawn_batch(n, y_spread)
 
     # ------------------------------------------------------------------
     # Reinicio
@@ -0,0 +1,160 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+LATE_POLICIES = ("skip_render", "catch_up")
+
+
+@dataclass
+class FrameTick:
+    """What the loop should do this frame.
+
+    ``steps`` simulation updates of ``dt`` seconds each, then a render if
+    ``render`` is set; ``render_dt`` is the time elapsed since the last
+    rendered frame (for animations that only advance while drawing).
+    """
+
+    dt: float
+    steps: int = 1
+    render: bool = True
+    render_dt: float = 0.0
+
+
+class FrameScheduler:
+    """Pace a frame loop at ``target_fps`` on the monotonic clock.
+
+    Every frame has a deadline one period after the previous one. :meth:`wait`
+    sleeps until it (coarse ``time.sleep``, then a short spin for the last
+    ``spin`` seconds so wake-up jitter stays well under a millisecond), and
+    on-time frames advance the simulation by exactly one period, so dt-based
+    motion does not jitter with the loop.
+
+    A frame that starts one or more whole periods late is handled by
+    ``late_policy``:
+
+    * ``"skip_render"``: simulate the elapsed time in one step and skip
+      drawing this frame (never two frames in a row);
+    * ``"catch_up"``: run up to ``max_catch_up`` fixed-period simulation
+      steps, then render once.
+
+    Without a target (``target_fps`` ``None`` or ``0``) the loop is not
+    throttled and ``dt`` is the measured frame time.
+    """
+
+    def __init__(
+        self,
+        target_fps: Optional[float] = None,
+        late_policy: str = "skip_render",
+        max_catch_up: int = 4,
+        spin: float = 0.002,
+        window: int = 300,
+    ) -> None:
+        if late_policy not in LATE_POLICIES:
+            raise ValueError(f"Unknown late-frame policy: {late_policy}")
+        self.late_policy = late_policy
+        self.max_catch_up = max_catch_up
+        self.spin = spin
+        self.set_target(target_fps)
+
+        self._intervals = np.full(window, np.nan)
+        self._cursor = 0
+        self.frames = 0
+        self.late_frames = 0
+        self.skipped_renders = 0
+        self.catch_up_steps = 0
+        self.sleep_time = 0.0
+        self._started = time.monotonic()
+        self.reset()
+
+    def set_target(self, target_fps: Optional[float]) -> None:
+        self.target_fps = target_fps or None
+        self.period = 1.0 / target_fps if target_fps else 0.0
+
+    def reset(self) -> None:
+        """Forget the deadline, e.g. after a blocking countdown or pause."""
+        self._deadline: Optional[float] = None
+        self._last_start: Optional[float] = None
+        self._render_dt = 0.0
+        self._skipped_last = False
+
+    def begin_frame(self, now: Optional[float] = None) -> FrameTick:
+        """Start a frame and decide how to simulate and whether to render it.
+
+        *now* replaces the monotonic clock reading (e.g. in tests).
+        """
+        now = time.monotonic() if now is None else now
+        measured = self.period if self._last_start is None else now - self._last_start
+        if self._last_start is not None:
+            self._intervals[self._cursor] = measured
+            self._cursor = (self._cursor + 1) % len(self._intervals)
+        self._last_start = now
+        self.frames += 1
+
+        if not self.period:
+            tick = FrameTick(measured)
+        else:
+            if self._deadline is None:
+                self._deadline = now
+            lateness = now - self._deadline
+            missed = int(lateness // self.period) if lateness > 0 else 0
+            self._deadline += (missed + 1) * self.period
+
+            if missed == 0:
+                tick = FrameTick(self.period)
+            elif self.late_policy == "catch_up":
+                steps = min(missed + 1, self.max_catch_up)
+                self.late_frames += 1
+                self.catch_up_steps += steps - 1
+                tick = FrameTick(self.period, steps=steps)
+            else:
+                self.late_frames += 1
+                render = self._skipped_last
+                if not render:
+                    self.skipped_renders += 1
+                tick = FrameTick((missed + 1) * self.period, render=render)
+
+        self._render_dt += tick.dt * tick.steps
+        self._skipped_last = not tick.render
+        if tick.render:
+            tick.render_dt, self._render_dt = self._render_dt, 0.0
+        return tick
+
+    def wait(self) -> None:
+        """Sleep until the next frame's deadline (no-op when uncapped or late)."""
+        if self._deadline is None:
+            return
+        start = time.monotonic()
+        remaining = self._deadline - start
+        if remaining <= 0:
+            return
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.monotonic() < self._deadline:
+            pass
+        self.sleep_time += time.monotonic() - start
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    @property
+    def fps(self) -> float:
+        """Mean frame rate over the recent window."""
+        values = self._intervals[~np.isnan(self._intervals)]
+        return 1.0 / values.mean() if values.size else 0.0
+
+    def summary(self) -> str:
+        values = self._intervals[~np.isnan(self._intervals)] * 1000.0
+        if not values.size:
+            return "no frames paced"
+        target = f"{self.target_fps:g} FPS target" if self.target_fps else "uncapped"
+        idle = self.sleep_time / max(1e-9, time.monotonic() - self._started)
+        return (
+            f"{self.fps:.1f} FPS ({target}), frame time "
+            f"mean {values.mean():.1f} ± {values.std():.1f} ms, p95 {np.percentile(values, 95):.1f} ms; "
+            f"{self.late_frames} late frames, {self.skipped_renders} renders skipped, "
+            f"{self.catch_up_steps} catch-up steps, {idle:.0%} of the time asleep"
+        )
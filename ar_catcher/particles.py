@@ -0,0 +1,181 @@
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class ParticleField:
+    """Ambient background particles rendered once and scrolled every frame.
+
+    Particles are split across a few depth layers, each drifting down at its
+    own speed. Every layer is rasterized a single time into a coverage mask
+    that is stored sparsely (flat index and weight of every lit pixel). Per
+    frame a layer only advances an integer row offset, and the blend touches
+    just the lit pixels, so the cost depends on how many pixels the particles
+    cover, not on the particle count or the frame size.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        count: int = 80,
+        layer_speeds: Sequence[float] = (22.0, 30.0, 38.0),
+        radius_range: Tuple[int, int] = (1, 3),
+        opacity: float = 0.15,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        seed: Optional[int] = None,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.count = count
+        self.opacity = opacity
+        self.color = np.array(color, dtype=np.uint16)
+        self.speeds = np.asarray(layer_speeds, dtype=np.float64)
+        self.offsets = np.zeros(len(self.speeds), dtype=np.float64)
+
+        rng = np.random.default_rng(seed)
+        weight_scale = opacity * 256.0 / 255.0
+        # Per layer: flat pixel indices (sorted, row-major) and fixed-point
+        # (x/256) blend weights of every lit pixel.
+        self._indices = []
+        self._weights = []
+        for n in np.array_split(np.arange(count), len(self.speeds)):
+            mask = self._rasterize(rng, len(n), radius_range)
+            flat = np.flatnonzero(mask)
+            self._indices.append(flat.astype(np.intp))
+            weights = np.round(mask.ravel()[flat] * weight_scale).astype(np.uint16)
+            self._weights.append(weights[:, None])
+
+    @property
+    def lit_pixels(self) -> int:
+        return int(sum(idx.size for idx in self._indices))
+
+    def update(self, dt: float) -> None:
+        """Scroll every layer downwards by ``speed * dt`` pixels."""
+        self.offsets = (self.offsets + self.speeds * dt) % self.height
+
+    def draw(self, frame: np.ndarray) -> None:
+        """Blend the particles into *frame* (in-place, frame must be C-contiguous)."""
+        pixels = frame.reshape(-1, 3)
+        # Same memory seen as one 3-byte item per pixel: scattering whole
+        # pixels this way is much faster than 2-D fancy assignment.
+        pixel_items = pixels.view("V3").reshape(-1)
+        total = self.height * self.width
+        for idx, weights, offset in zip(self._indices, self._weights, self.offsets):
+            if not idx.size:
+                continue
+            # Scrolling down by ``shift`` rows is a constant flat offset; the
+            # pixels pushed past the bottom (a sorted tail) wrap to the top.
+            shift = int(offset) * self.width
+            rolled = idx + shift
+            rolled[np.searchsorted(idx, total - shift):] -= total
+
+            px = np.take(pixels, rolled, axis=0).astype(np.uint16)
+            px += ((self.color - px) * weights) >> 8
+            np.put(pixel_items, rolled, px.astype(np.uint8).view("V3").reshape(-1))
+
+    def _rasterize(self, rng: np.random.Generator, n: int, radius_range: Tuple[int, int]) -> np.ndarray:
+        mask = np.zeros((self.height, self.width), dtype=np.uint8)
+        xs = rng.integers(0, self.width, n)
+        ys = rng.integers(0, self.height, n)
+        radii = rng.integers(radius_range[0], radius_range[1] + 1, n)
+        for x, y, r in zip(xs, ys, radii):
+            cv2.circle(mask, (int(x), int(y)), int(r), 255, -1)
+            # Particles crossing an edge continue on the opposite side when wrapping
+            if y + r >= self.height:
+                cv2.circle(mask, (int(x), int(y) - self.height), int(r), 255, -1)
+            elif y - r < 0:
+                cv2.circle(mask, (int(x), int(y) + self.height), int(r), 255, -1)
+        return mask
+
+
+class BurstParticles:
+    """Short-lived explosion/sparkle particles stored as parallel NumPy arrays.
+
+    Emitting appends a batch of particles, and ``update`` advances and culls
+    all of them with a handful of vectorized operations, so many simultaneous
+    explosions cost little more than drawing their dots.
+    """
+
+    def __init__(self, capacity: int = 256, seed: Optional[int] = None) -> None:
+        self._rng = np.random.default_rng(seed)
+        self.count = 0
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        n: int,
+        spread: float,
+        vx_range: Tuple[float, float],
+        vy_range: Tuple[float, float],
+        ttl_range: Tuple[float, float],
+        size_range: Tuple[int, int],
+        color: Tuple[int, int, int],
+    ) -> None:
+        """Spawn *n* particles around ``(x, y)``; ``size_range`` is inclusive."""
+        if self.count + n > len(self._ttl):
+            self._allocate(max(2 * len(self._ttl), self.count + n))
+        rng = self._rng
+        s = slice(self.count, self.count + n)
+        self._pos[s, 0] = x + rng.uniform(-spread, spread, n)
+        self._pos[s, 1] = y + rng.uniform(-spread, spread, n)
+        self._vel[s, 0] = rng.uniform(*vx_range, n)
+        self._vel[s, 1] = rng.uniform(*vy_range, n)
+        self._life[s] = 0.0
+        self._ttl[s] = rng.uniform(*ttl_range, n)
+        self._size[s] = rng.integers(size_range[0], size_range[1] + 1, n)
+        self._color[s] = color
+        self.count += n
+
+    def update(self, dt: float) -> None:
+        """Age every particle, drop the expired ones and move the rest."""
+        n = self.count
+        if not n:
+            return
+        self._life[:n] += dt
+        alive = self._life[:n] <= self._ttl[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            n = keep.size
+            for arr in (self._pos, self._vel, self._life, self._ttl, self._size, self._color):
+                arr[:n] = arr[keep]
+            self.count = n
+        self._pos[:n] += self._vel[:n] * dt
+
+    def draw(self, frame: np.ndarray) -> None:
+        """Draw the particles as filled dots shrinking over their lifetime."""
+        n = self.count
+        if not n:
+            return
+        fade = 1.0 - self._life[:n] / self._ttl[:n]
+        sizes = (self._size[:n] * fade).astype(np.int32)
+        visible = np.flatnonzero(sizes > 0)
+        pts = self._pos[visible].astype(np.int32).tolist()
+        colors = self._color[visible].tolist()
+        for (x, y), r, color in zip(pts, sizes[visible].tolist(), colors):
+            cv2.circle(frame, (x, y), r, color, -1)
+
+    def _allocate(self, capacity: int) -> None:
+        n = self.count
+        old = getattr(self, "_ttl", None)
+        arrays = {
+            "_pos": np.zeros((capacity, 2), dtype=np.float32),
+            "_vel": np.zeros((capacity, 2), dtype=np.float32),
+            "_life": np.zeros(capacity, dtype=np.float32),
+            "_ttl": np.ones(capacity, dtype=np.float32),
+            "_size": np.zeros(capacity, dtype=np.float32),
+            "_color": np.zeros((capacity, 3), dtype=np.uint8),
+        }
+        for name, arr in arrays.items():
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
@@ -0,0 +1,304 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class FrameSink(ABC):
+    """Background consumer of composed frames.
+
+    ``submit`` copies the frame into a recycled buffer and hands it to a
+    worker thread through a bounded queue; it never blocks the game loop.
+    When the queue is full the ``drop_policy`` decides which frame is lost:
+    ``"oldest"`` replaces the oldest queued frame (lowest latency), ``"newest"``
+    discards the incoming one (no gaps inside already-queued runs).
+
+    Subclasses implement :meth:`_open`, which runs on the caller's thread in
+    :meth:`start` so that setup errors (say, a port already in use) reach the
+    caller, and :meth:`_consume` and :meth:`_close`, which run on the worker
+    thread.
+    """
+
+    def __init__(self, max_queue: int = 8, drop_policy: str = "oldest") -> None:
+        if drop_policy not in {"oldest", "newest"}:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.drop_policy = drop_policy
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, float]]]" = queue.Queue(max_queue)
+        self._free: List[np.ndarray] = []
+        self._free_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics (written by one thread each, read by anyone)
+        self.submitted = 0
+        self.dropped = 0
+        self.encoded = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Game-loop side
+    # ------------------------------------------------------------------
+
+    def start(self) -> "FrameSink":
+        self._open()
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, frame: np.ndarray) -> None:
+        """Queue a copy of *frame* for encoding without waiting."""
+        self.submitted += 1
+        buf = self._take_buffer(frame)
+        np.copyto(buf, frame)
+        item = (buf, time.monotonic())
+
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        if self.drop_policy == "newest":
+            self._recycle(buf)
+        else:
+            try:
+                old = self._queue.get_nowait()
+                if old is not None:
+                    self._recycle(old[0])
+                self._queue.put_nowait(item)
+            except (queue.Empty, queue.Full):
+                self._recycle(buf)
+        self.dropped += 1
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush queued frames and stop the worker."""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        self._thread = None
+
+    def set_fps(self, fps: float) -> None:
+        """Tell the sink the nominal frame rate of the frames it will receive."""
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "submitted": self.submitted,
+            "encoded": self.encoded,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+            "lag_ms": self.last_lag * 1000.0,
+            "mean_lag_ms": self._lag_total / self.encoded * 1000.0 if self.encoded else 0.0,
+            "max_lag_ms": self.max_lag * 1000.0,
+        }
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (
+            f"{type(self).__name__}: {s['encoded']}/{s['submitted']} frames encoded, "
+            f"{s['dropped']} dropped, lag mean {s['mean_lag_ms']:.1f} ms / max {s['max_lag_ms']:.1f} ms"
+        )
+
+    def __enter__(self) -> "FrameSink":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Buffer recycling
+    # ------------------------------------------------------------------
+
+    def _take_buffer(self, frame: np.ndarray) -> np.ndarray:
+        with self._free_lock:
+            while self._free:
+                buf = self._free.pop()
+                if buf.shape == frame.shape and buf.dtype == frame.dtype:
+                    return buf
+        return np.empty_like(frame)
+
+    def _recycle(self, buf: np.ndarray) -> None:
+        with self._free_lock:
+            self._free.append(buf)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                frame, submitted_at = item
+                try:
+                    self._consume(frame)
+                finally:
+                    self._recycle(frame)
+                lag = time.monotonic() - submitted_at
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+                self._lag_total += lag
+                self.encoded += 1
+        finally:
+            self._close()
+
+    def _open(self) -> None:
+        pass
+
+    @abstractmethod
+    def _consume(self, frame: np.ndarray) -> None:
+        """Encode or send one frame (worker thread)."""
+
+    def _close(self) -> None:
+        pass
+
+
+class VideoFileSink(FrameSink):
+    """Write frames to a series of fixed-length video segments.
+
+    Segments are named ``<prefix>_<start time>_<n>.mp4`` inside *directory*
+    and hold ``segment_seconds`` worth of frames at the nominal ``fps``, which
+    the game sets to its pacing rate through :meth:`set_fps` before the first
+    frame.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        fps: float = 30.0,
+        segment_seconds: float = 60.0,
+        prefix: str = "match",
+        fourcc: str = "mp4v",
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.segment_seconds = segment_seconds
+        self.set_fps(fps)
+        self.prefix = prefix
+        self.fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self.segments: List[Path] = []
+        self._writer: Optional[cv2.VideoWriter] = None
+        self._segment_frames = 0
+        self._session = time.strftime("%Y%m%d-%H%M%S")
+
+    def set_fps(self, fps: float) -> None:
+        self.fps = fps
+        self.frames_per_segment = max(1, int(round(fps * self.segment_seconds)))
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _consume(self, frame: np.ndarray) -> None:
+        if self._writer is None or self._segment_frames >= self.frames_per_segment:
+            self._roll(frame.shape[1], frame.shape[0])
+        self._writer.write(frame)
+        self._segment_frames += 1
+
+    def _roll(self, width: int, height: int) -> None:
+        if self._writer is not None:
+            self._writer.release()
+        path = self.directory / f"{self.prefix}_{self._session}_{len(self.segments):03d}.mp4"
+        self._writer = cv2.VideoWriter(str(path), self.fourcc, self.fps, (width, height))
+        self.segments.append(path)
+        self._segment_frames = 0
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+
+class MJPEGStreamSink(FrameSink):
+    """Serve frames as an MJPEG stream on ``http://host:port/``.
+
+    Frames are JPEG-encoded on the worker thread; each connected client gets
+    the most recent encoded frame and simply misses the ones it was too slow
+    for, so a slow spectator screen cannot back up the encoder.
+    """
+
+    def __init__(
+        self,
+        port: int = 8080,
+        host: str = "0.0.0.0",
+        quality: int = 80,
+        max_width: Optional[int] = 960,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.host = host
+        self.port = port
+        self.quality = quality
+        self.max_width = max_width
+        self._jpeg: Optional[bytes] = None
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._running = False
+
+    def _open(self) -> None:
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self.send_response(200)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+                self.end_headers()
+                seen = -1
+                try:
+                    while sink._running:
+                        with sink._cond:
+                            sink._cond.wait_for(lambda: sink._seq != seen or not sink._running, 1.0)
+                            jpeg, seen = sink._jpeg, sink._seq
+                        if jpeg is None:
+                            continue
+                        self.wfile.write(
+                            b"--frame\r\nContent-Type: image/jpeg\r\n"
+                            + f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                            + jpeg
+                            + b"\r\n"
+                        )
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, *args) -> None:  # keep the console quiet
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._running = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        print(f"📺 Spectator stream on http://{self.host}:{self.port}/")
+
+    def _consume(self, frame: np.ndarray) -> None:
+        if self.max_width and frame.shape[1] > self.max_width:
+            scale = self.max_width / frame.shape[1]
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+        if not ok:
+            return
+        with self._cond:
+            self._jpeg = buf.tobytes()
+            self._seq += 1
+            self._cond.notify_all()
+
+    def _close(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
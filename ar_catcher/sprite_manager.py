@@ -1,6 +1,8 @@
+import math
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 import cv2
 import numpy as np
@@ -8,6 +10,12 @@ import numpy as np
 
 ASSETS_DIR = Path(__file__).resolve().parent / "assets" / "sprites"
 
+# Precomputed transform frames: rotations in 360/ANGLE_STEPS degree steps and
+# these scale factors. Objects snap to the nearest frame.
+ANGLE_STEPS = 32
+SCALE_STEP = 0.05
+SCALE_STEPS: Tuple[float, ...] = tuple(1.0 + SCALE_STEP * i for i in range(-3, 4))
+
 
 def load_png(path: Path):
     """Load a PNG with alpha channel."""
@@ -25,8 +33,31 @@ def load_png(path: Path):
         return img, alpha
 
 
+def premultiply(bgr: np.ndarray, alpha: np.ndarray):
+    """Return ``(bgr * alpha, 255 - alpha)`` as uint8 3-channel images for fast blits."""
+    a = np.clip(np.round(alpha * 255.0), 0, 255).astype(np.uint8)
+    a3 = cv2.merge([a, a, a])
+    premul = cv2.multiply(bgr, a3, scale=1 / 255)
+    return premul, cv2.bitwise_not(a3)
+
+
 class SpriteManager:
     _cache: Dict[str, tuple] = {}
+    _premultiplied: Dict[Tuple[str, int], tuple] = {}
+    _bundle = None  # optional baked AssetBundle, see ar_catcher.asset_bundle
+
+    # Rotated/scaled frames, least recently used first, bounded by bytes
+    _transformed: "OrderedDict[Tuple[str, int, int, int], tuple]" = OrderedDict()
+    _transformed_bytes = 0
+    transform_budget = 64 * 1024 * 1024
+    transform_hits = 0
+    transform_misses = 0
+
+    @classmethod
+    def use_bundle(cls, bundle) -> None:
+        """Serve premultiplied sprites from a baked bundle when it has them."""
+        cls._bundle = bundle
+        cls._premultiplied.clear()
 
     @classmethod
     def get(cls, name: str, size: int | None = None):
@@ -51,6 +82,127 @@ class SpriteManager:
         cls._cache[cache_key] = (bgr_resized, alpha_resized)
         return cls._cache[cache_key]
 
+    @classmethod
+    def get_premultiplied(cls, name: str, size: int):
+        """Return ``(premultiplied_bgr, inverse_alpha)`` of a ``size`` x ``size`` sprite."""
+        key = (name, size)
+        entry = cls._premultiplied.get(key)
+        if entry is None:
+            if cls._bundle is not None:
+                entry = cls._bundle.sprite(name, size)
+            if entry is None:
+                entry = premultiply(*cls.get(name, size))
+            cls._premultiplied[key] = entry
+        return entry
+
+    @classmethod
+    def get_transformed(cls, name: str, size: int, angle: float = 0.0, scale: float = 1.0):
+        """Premultiplied sprite rotated by *angle* degrees and scaled by *scale*.
+
+        Both are snapped to the nearest precomputed step (``ANGLE_STEPS``,
+        ``SCALE_STEPS``). Frames are rendered on first use and kept in an LRU
+        cache limited to ``transform_budget`` bytes, so a spinning or pulsing
+        object costs one dictionary lookup and one blit per frame.
+        """
+        angle_idx = int(round(angle * ANGLE_STEPS / 360.0)) % ANGLE_STEPS
+        mid = len(SCALE_STEPS) // 2
+        scale_idx = min(max(int(round((scale - 1.0) / SCALE_STEP)) + mid, 0), len(SCALE_STEPS) - 1)
+        if angle_idx == 0 and scale_idx == mid:
+            return cls.get_premultiplied(name, size)
+
+        key = (name, size, angle_idx, scale_idx)
+        entry = cls._transformed.get(key)
+        if entry is not None:
+            cls._transformed.move_to_end(key)
+            cls.transform_hits += 1
+            return entry
+
+        cls.transform_misses += 1
+        entry = cls._render_transformed(name, size, angle_idx * 360.0 / ANGLE_STEPS, SCALE_STEPS[scale_idx])
+        cls._transformed[key] = entry
+        cls._transformed_bytes += entry[0].nbytes + entry[1].nbytes
+        while cls._transformed_bytes > cls.transform_budget and len(cls._transformed) > 1:
+            _, (premul, inv_alpha) = cls._transformed.popitem(last=False)
+            cls._transformed_bytes -= premul.nbytes + inv_alpha.nbytes
+        return entry
+
+    @classmethod
+    def _render_transformed(cls, name: str, size: int, angle: float, scale: float):
+        premul, inv_alpha = cls.get_premultiplied(name, size)
+        # Canvas large enough for the rotated corners
+        side = int(math.ceil(size * scale * math.sqrt(2)))
+        matrix = cv2.getRotationMatrix2D((size / 2, size / 2), angle, scale)
+        matrix[:, 2] += (side - size) / 2
+        # Warping premultiplied colour avoids dark fringes at the edges
+        rotated = cv2.warpAffine(premul, matrix, (side, side), flags=cv2.INTER_LINEAR)
+        alpha = cv2.warpAffine(cv2.bitwise_not(inv_alpha[..., 0]), matrix, (side, side), flags=cv2.INTER_LINEAR)
+        # Crop the empty margin, symmetrically so the frame stays centred
+        x, y, w, h = cv2.boundingRect(alpha)
+        c = side / 2
+        half = int(math.ceil(max(c - x, x + w - c, c - y, y + h - c, 1)))
+        lo, hi = max(0, int(c) - half), min(side, int(c) + half)
+        rotated, alpha = rotated[lo:hi, lo:hi].copy(), alpha[lo:hi, lo:hi]
+        inv = cv2.bitwise_not(alpha)
+        return rotated, cv2.merge([inv, inv, inv])
+
+    @classmethod
+    def transform_summary(cls) -> str:
+        lookups = cls.transform_hits + cls.transform_misses
+        hit_rate = cls.transform_hits / lookups if lookups else 0.0
+        return (
+            f"{len(cls._transformed)} frames ({cls._transformed_bytes / 1e6:.1f} MB), "
+            f"{hit_rate:.1%} hit rate"
+        )
+
+
+def blit_premultiplied(dst: np.ndarray, premul: np.ndarray, inv_alpha: np.ndarray, pos) -> None:
+    """Draw a premultiplied sprite centred at *pos*: ``dst = premul + dst * (1 - alpha)``.
+
+    Sprites partially outside *dst* are clipped.
+    """
+    h, w = premul.shape[:2]
+    x0 = int(pos[0] - w / 2)
+    y0 = int(pos[1] - h / 2)
+
+    # Clip against the destination
+    sx0, sy0 = max(0, -x0), max(0, -y0)
+    sx1, sy1 = min(w, dst.shape[1] - x0), min(h, dst.shape[0] - y0)
+    if sx1 <= sx0 or sy1 <= sy0:
+        return
+
+    roi = dst[y0 + sy0 : y0 + sy1, x0 + sx0 : x0 + sx1]
+    cv2.multiply(roi, inv_alpha[sy0:sy1, sx0:sx1], dst=roi, scale=1 / 255)
+    cv2.add(roi, premul[sy0:sy1, sx0:sx1], dst=roi)
+
+
+def blit_mask(
+    dst: np.ndarray,
+    mask: np.ndarray,
+    color: Tuple[int, int, int],
+    top_left: Tuple[int, int],
+    opacity: float = 1.0,
+) -> None:
+    """Paint *color* through a uint8 coverage *mask* whose corner is at *top_left*.
+
+    ``dst = dst * (1 - a) + color * a`` with ``a = mask * opacity / 255``;
+    the mask is clipped against *dst*.
+    """
+    gx0, gy0 = int(top_left[0]), int(top_left[1])
+    x0, y0 = max(0, gx0), max(0, gy0)
+    x1 = min(dst.shape[1], gx0 + mask.shape[1])
+    y1 = min(dst.shape[0], gy0 + mask.shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    m = mask[y0 - gy0 : y1 - gy0, x0 - gx0 : x1 - gx0]
+    if opacity < 1.0:
+        m = cv2.convertScaleAbs(m, alpha=opacity)
+    m3 = cv2.merge([m, m, m])
+    roi = dst[y0:y1, x0:x1]
+    tint = cv2.multiply(np.full_like(roi, color), m3, scale=1 / 255)
+    cv2.multiply(roi, cv2.bitwise_not(m3), dst=roi, scale=1 / 255)
+    cv2.add(roi, tint, dst=roi)
+
 
 def blit_alpha(dst: np.ndarray, sprite_bgr: np.ndarray, alpha: np.ndarray, pos):
     """Draw sprite on dst at pos (center) using alpha blending."""
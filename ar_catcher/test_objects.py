@@ -0,0 +1,101 @@
+"""Spawn distribution of the table-driven ObjectSpawner and game-mode overrides."""
+import json
+
+import pytest
+
+from ar_catcher.modes import load_modes
+from ar_catcher.objects import SPAWN_TABLE, ObjectSpawner, ObjectType
+
+
+def _shares(spawner: ObjectSpawner, n: int = 100_000) -> dict:
+    types = [obj.object_type for obj in spawner.spawn_batch(n)]
+    return {t: types.count(t) / n for t in ObjectType}
+
+
+def test_default_table_split():
+    shares = _shares(ObjectSpawner(1280, 720, seed=0))
+    # 40 % bombs split 5:3:2, 5 % golden fruit, 3 % shields, 52 % plain fruit
+    expected = {
+        ObjectType.BOMB: 0.20,
+        ObjectType.CLUSTER_BOMB: 0.12,
+        ObjectType.MEGA_BOMB: 0.08,
+        ObjectType.GOLDEN_FRUIT: 0.05,
+        ObjectType.SHIELD: 0.03,
+        ObjectType.APPLE: 0.52 / 3,
+        ObjectType.ORANGE: 0.52 / 3,
+        ObjectType.POKEBALL: 0.52 / 3,
+    }
+    for obj_type, share in expected.items():
+        assert shares[obj_type] == pytest.approx(share, abs=0.006), obj_type
+
+
+def test_bomb_rate_change_moves_fruit_share():
+    spawner = ObjectSpawner(1280, 720, seed=0)
+    spawner.bomb_spawn_rate = 0.7
+    shares = _shares(spawner)
+    bombs = shares[ObjectType.BOMB] + shares[ObjectType.CLUSTER_BOMB] + shares[ObjectType.MEGA_BOMB]
+    assert bombs == pytest.approx(0.7, abs=0.006)
+    assert shares[ObjectType.SHIELD] == pytest.approx(0.03, abs=0.003)
+    spawner.reset()
+    assert spawner.bomb_spawn_rate == 0.4
+
+
+def test_batch_follows_table_ranges():
+    spawner = ObjectSpawner(640, 480, seed=1)
+    objects = spawner.spawn_batch(2000, y_spread=100.0)
+    assert len(objects) == 2000 and spawner.spawn_batch(0) == []
+    for obj in objects:
+        rule = SPAWN_TABLE[obj.object_type]
+        assert rule.velocity[0] <= obj.velocity_y <= rule.velocity[1]
+        assert abs(obj.angular_velocity) <= rule.spin
+        assert obj.radius == obj.object_type.value[1]
+        assert 20 <= obj.x <= 620 and -120 <= obj.y <= -20
+
+
+def test_seeded_spawners_agree():
+    a = [(o.object_type, o.x, o.velocity_y) for o in ObjectSpawner(640, 480, seed=3).spawn_batch(50)]
+    b = [(o.object_type, o.x, o.velocity_y) for o in ObjectSpawner(640, 480, seed=3).spawn_batch(50)]
+    assert a == b
+
+
+def test_load_modes_overrides_spawn_rows(tmp_path):
+    path = tmp_path / "modes.json"
+    path.write_text(
+        json.dumps(
+            {
+                "no-apples": {
+                    "burst_size": 5,
+                    "spawns": {"apple": {"weight": 0}, "BOMB": {"velocity": [300, 400], "spin": 360}},
+                }
+            }
+        )
+    )
+    mode = load_modes(path)["no-apples"]
+    assert mode.burst_size == 5
+    assert mode.spawn_table[ObjectType.BOMB].velocity == (300, 400)
+    # Untouched rows and the default table itself are unchanged
+    assert mode.spawn_table[ObjectType.ORANGE] == SPAWN_TABLE[ObjectType.ORANGE]
+    assert SPAWN_TABLE[ObjectType.APPLE].weight == 1.0
+
+    spawner = ObjectSpawner(1280, 720, table=mode.spawn_table, seed=0)
+    shares = _shares(spawner, 50_000)
+    assert shares[ObjectType.APPLE] == 0.0
+    assert shares[ObjectType.ORANGE] == pytest.approx(0.26, abs=0.008)
+    bombs = [o for o in spawner.spawn_batch(1000) if o.object_type is ObjectType.BOMB]
+    assert bombs and all(300 <= o.velocity_y <= 400 for o in bombs)
+
+
+def test_all_zero_table_is_rejected(tmp_path):
+    path = tmp_path / "modes.json"
+    path.write_text(json.dumps({"empty": {"spawns": {t.name: {"weight": 0} for t in ObjectType}}}))
+    mode = load_modes(path)["empty"]
+    with pytest.raises(ValueError):
+        ObjectSpawner(1280, 720, table=mode.spawn_table)
+    # A zero bomb rate is fine while other groups keep some weight
+    spawner = ObjectSpawner(1280, 720, seed=0)
+    spawner.bomb_spawn_rate = 0.0
+    assert not {o.object_type for o in spawner.spawn_batch(1000)} & {
+        ObjectType.BOMB,
+        ObjectType.CLUSTER_BOMB,
+        ObjectType.MEGA_BOMB,
+    }
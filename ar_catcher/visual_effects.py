@@ -1,21 +1,33 @@
 import cv2
 import numpy as np
 import random
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+
+from ar_catcher.frame_pool import FrameArena
 
 
 class VisualEffects:
-    """Enhanced visual effects for better gaming experience."""
+    """Enhanced visual effects for better gaming experience.
+
+    Full-size scratch images (overlays, shaken/blurred copies) come from a
+    :class:`FrameArena`, so effects do not allocate a frame per call.
+    """
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, arena: Optional[FrameArena] = None):
         self.width = width
         self.height = height
+        self.arena = arena if arena is not None else FrameArena()
+        self._vignette_key: Optional[Tuple[int, int, float]] = None
+        self._vignette: Optional[np.ndarray] = None
         self.screen_shake = 0.0
         self.screen_shake_intensity = 0.0
         self.color_grading = 1.0  # Normal color intensity
         
     def apply_screen_shake(self, frame: np.ndarray, intensity: float = 0.0) -> np.ndarray:
-        """Apply screen shake effect for explosions and impacts."""
+        """Apply screen shake effect for explosions and impacts.
+
+        Returns the arena's ``"shake"`` buffer, valid until the next call.
+        """
         if intensity <= 0:
             return frame
             
@@ -28,13 +40,13 @@ class VisualEffects:
         
         # Apply shake transformation
         height, width = frame.shape[:2]
-        frame = cv2.warpAffine(frame, M, (width, height))
+        frame = cv2.warpAffine(frame, M, (width, height), dst=self.arena.like("shake", frame))
         
         return frame
     
     def apply_explosion_flash(self, frame: np.ndarray, color: Tuple[int, int, int], intensity: float = 0.3) -> np.ndarray:
         """Apply explosion flash effect with color grading."""
-        overlay = frame.copy()
+        overlay = self.arena.like("overlay", frame)
         overlay[:] = color
         
         # Apply flash with intensity
@@ -54,7 +66,7 @@ class VisualEffects:
         pulse = np.sin(danger_level * 10) * 0.1 * danger_level
         
         # Apply subtle color shift
-        overlay = frame.copy()
+        overlay = self.arena.like("overlay", frame)
         overlay[:] = (0, 0, int(50 * pulse))  # Subtle blue tint
         
         cv2.addWeighted(overlay, abs(pulse), frame, 1 - abs(pulse), 0, frame)
@@ -64,7 +76,7 @@ class VisualEffects:
     def create_trail_effect(self, frame: np.ndarray, x: int, y: int, color: Tuple[int, int, int], 
                            trail_length: int = 5) -> np.ndarray:
         """Create motion trail effect for fast-moving objects."""
-        overlay = frame.copy()
+        overlay = self.arena.copy("overlay", frame)
         
         for i in range(trail_length):
             alpha = (trail_length - i) / trail_length * 0.3
@@ -79,29 +91,32 @@ class VisualEffects:
     def apply_vignette(self, frame: np.ndarray, intensity: float = 0.2) -> np.ndarray:
         """Apply subtle vignette effect for cinematic look."""
         height, width = frame.shape[:2]
-        
-        # Create vignette mask
-        Y, X = np.ogrid[:height, :width]
-        center_x, center_y = width // 2, height // 2
-        radius = min(width, height) // 2
-        
-        # Calculate distance from center
-        dist_from_center = np.sqrt((X - center_x)**2 + (Y - center_y)**2)
-        
-        # Create smooth vignette
-        vignette = 1 - (dist_from_center / radius) * intensity
-        vignette = np.clip(vignette, 0, 1)
-        
-        # Apply vignette to all channels
-        for c in range(3):
-            frame[:, :, c] = frame[:, :, c] * vignette
+
+        # The mask only depends on size and intensity: build it once
+        key = (height, width, intensity)
+        if self._vignette_key != key:
+            Y, X = np.ogrid[:height, :width]
+            center_x, center_y = width // 2, height // 2
+            radius = min(width, height) // 2
+
+            # Calculate distance from center
+            dist_from_center = np.sqrt((X - center_x)**2 + (Y - center_y)**2)
+
+            # Create smooth vignette, stored as 3-channel 0..255 gain
+            vignette = np.clip(1 - (dist_from_center / radius) * intensity, 0, 1)
+            gain = np.round(vignette * 255).astype(np.uint8)
+            self._vignette = cv2.merge([gain, gain, gain])
+            self._vignette_key = key
+
+        # Apply vignette to all channels in one pass
+        cv2.multiply(frame, self._vignette, dst=frame, scale=1 / 255)
             
         return frame
     
     def create_power_up_aura(self, frame: np.ndarray, x: int, y: int, radius: int, 
                             color: Tuple[int, int, int], intensity: float = 0.5) -> np.ndarray:
         """Create power-up aura effect around special objects."""
-        overlay = frame.copy()
+        overlay = self.arena.copy("overlay", frame)
         
         # Create multiple concentric circles for aura effect
         for i in range(3):
@@ -127,7 +142,7 @@ class VisualEffects:
         kernel = np.zeros((kernel_size, kernel_size))
         kernel[kernel_size // 2, :] = 1.0 / kernel_size
         
-        blurred = cv2.filter2D(frame, -1, kernel)
+        blurred = cv2.filter2D(frame, -1, kernel, dst=self.arena.like("blur", frame))
         
         # Blend with original
         cv2.addWeighted(blurred, blur_strength, frame, 1 - blur_strength, 0, frame)
@@ -136,7 +151,7 @@ class VisualEffects:
     
     def create_score_flash(self, frame: np.ndarray, score: int, color: Tuple[int, int, int]) -> np.ndarray:
         """Create score flash effect when points are earned."""
-        overlay = frame.copy()
+        overlay = self.arena.copy("overlay", frame)
         
         # Create score text overlay
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -1,153 +1,113 @@
-import cv2
-import mediapipe as mp
-import time
+"""Command-line entry point of the Rock-Paper-Scissors game (see ``src.engine``)."""
 import argparse
-from src.game import get_computer_choice, get_winner
-from src.hand_gesture import get_hand_gesture
-from src.ui import display_ui
-from src.animations import display_winner_animation
-from src.assets import load_images
-from src.sounds import load_sounds, play_sound
+import socket
 
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(
-    static_image_mode=False,
-    max_num_hands=1,
-    min_detection_confidence=0.7,
-    min_tracking_confidence=0.5,
-)
-mp_drawing = mp.solutions.drawing_utils
-
-# Load images and sounds
-images = load_images()
-sounds = load_sounds()
+from src.engine import RPSGame
+from src.events import EventLog, JSONLWriter, SQLiteWriter
+from src.profiles import OpponentStore
 
 # ---------------------------------------------------------------------------
 # CLI arguments
 # ---------------------------------------------------------------------------
 
 
-parser = argparse.ArgumentParser(description='Rock-Paper-Scissors AI')
-parser.add_argument(
-    '--difficulty',
-    '-d',
-    default='normal',
-    help='AI difficulty: easy | medium | hard (default: normal = medium)',
-)
-args = parser.parse_args()
-
-# Map "normal" → "medium" for the underlying AI while keeping the label the
-# user passed for display purposes.
-difficulty_cli = args.difficulty.lower()
-game_difficulty = 'medium' if difficulty_cli == 'normal' else difficulty_cli
-
-# Use the USB webcam on index 1 by default. Adjust as required for your
-# system (e.g., 0 for built-in or virtual cameras).
-cap = cv2.VideoCapture(1)
-
-# Game state
-scores = {'player': 0, 'computer': 0}
-player_choice = 'unknown'
-computer_choice = 'unknown'
-winner = 'unknown'
-last_gesture_time = time.time()
-round_start_time = time.time()
-show_countdown = True
-countdown_sound_played = {3: False, 2: False, 1: False}
-
-while cap.isOpened():
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    # Flip the frame horizontally for a later selfie-view display
-    # and convert the BGR image to RGB.
-    image = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
-
-    # To improve performance, optionally mark the image as not writeable to
-    # pass by reference.
-    image.flags.writeable = False
-    results = hands.process(image)
-
-    # Draw the hand annotations on the image.
-    image.flags.writeable = True
-    image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
-    # Countdown timer
-    if show_countdown:
-        elapsed_time = time.time() - round_start_time
-        countdown = 3 - int(elapsed_time)
-        if countdown > 0:
-            cv2.putText(
-                image,
-                str(countdown),
-                (
-                    image.shape[1] // 2 - 50,
-                    image.shape[0] // 2 + 50,
-                ),
-                cv2.FONT_HERSHEY_TRIPLEX,
-                4,
-                (255, 255, 255),
-                5,
-            )
-            if not countdown_sound_played[countdown]:
-                play_sound(sounds.get('countdown'))
-                countdown_sound_played[countdown] = True
-        else:
-            show_countdown = False
-            last_gesture_time = time.time()
-            countdown_sound_played = {3: False, 2: False, 1: False} # Reset for next round
-
-    if results.multi_hand_landmarks:
-        for hand_landmarks in results.multi_hand_landmarks:
-            mp_drawing.draw_landmarks(
-                image,
-                hand_landmarks,
-                mp_hands.HAND_CONNECTIONS,
-            )
-
-            # Recognize the gesture after the countdown
-            if (not show_countdown and 
-                    time.time() - last_gesture_time > 1):
-                player_choice = get_hand_gesture(hand_landmarks)
-
-                if player_choice != 'unknown':
-                    computer_choice = get_computer_choice(difficulty=game_difficulty)
-                    winner = get_winner(player_choice, computer_choice)
-
-                    if winner == 'player':
-                        scores['player'] += 1
-                        play_sound(sounds.get('win'))
-                    elif winner == 'computer':
-                        scores['computer'] += 1
-                        play_sound(sounds.get('lose'))
-                    
-                    display_winner_animation(image, winner)
-                    
-                    # Reset for the next round
-                    round_start_time = time.time()
-                    show_countdown = True
-
-                last_gesture_time = time.time()
-
-    # Display the UI
-    display_ui(
-        image,
-        player_choice,
-        computer_choice,
-        winner,
-        scores,
-        images,
-        difficulty=difficulty_cli,
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Rock-Paper-Scissors AI')
+    parser.add_argument(
+        '--difficulty',
+        '-d',
+        default='normal',
+        help='AI difficulty: easy | medium | hard | expert (default: normal = medium)',
     )
+    parser.add_argument(
+        '--motion-gate',
+        action='store_true',
+        help='Reuse the previous hand detection while the scene is static',
+    )
+    parser.add_argument(
+        '--learned-gestures',
+        action='store_true',
+        help='Recognize gestures with the experimental landmark classifier instead of the finger rules',
+    )
+    parser.add_argument(
+        '--latency',
+        metavar='SECONDS',
+        type=float,
+        help='Print rolling motion-to-photon latency percentiles every SECONDS',
+    )
+    parser.add_argument(
+        '--fps',
+        type=float,
+        help="Target frame rate (default: the camera's native rate, 0 = uncapped)",
+    )
+    parser.add_argument(
+        '--idle-after',
+        metavar='SECONDS',
+        type=float,
+        default=30.0,
+        help='Enter low-power attract mode after SECONDS without hands (0 = never, default: 30)',
+    )
+    parser.add_argument(
+        '--native-ui',
+        action='store_true',
+        help='Show the 1280x720 game screen at full size instead of scaling it to the camera frame',
+    )
+    parser.add_argument(
+        '--events',
+        metavar='PATH',
+        help='Log rounds: a directory for rotating JSONL files, or a .db/.sqlite file',
+    )
+    parser.add_argument(
+        '--profiles',
+        metavar='PATH',
+        help='Resume and save the AI\'s model of each player in this .npy store',
+    )
+    parser.add_argument(
+        '--player',
+        default=socket.gethostname(),
+        help='Profile name in --profiles (default: this kiosk\'s host name)',
+    )
+    parser.add_argument(
+        '--camera',
+        type=int,
+        default=1,
+        help='Camera device index (default: 1)',
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.profiles and not args.player:
+        parser.error('--player must not be empty')
+    if not args.events:
+        events = EventLog()
+    elif args.events.endswith(('.db', '.sqlite')):
+        events = EventLog(SQLiteWriter(args.events))
+    else:
+        events = EventLog(JSONLWriter(args.events))
+
+    game = RPSGame(
+        args.difficulty,
+        camera_index=args.camera,
+        motion_gate=args.motion_gate,
+        learned_gestures=args.learned_gestures,
+        target_fps=args.fps,
+        idle_after=args.idle_after,
+        events=events,
+        profiles=OpponentStore(args.profiles) if args.profiles else None,
+        player=args.player,
+        latency_every=args.latency,
+        native_ui=args.native_ui,
+    )
+    try:
+        game.run()
+    finally:
+        game.shutdown()
+    for line in game.summary():
+        print(line)
 
-    # Show the image
-    cv2.imshow('Rock, Paper, Scissors', image)
-
-    # Break the loop when 'ESC' is pressed
-    if cv2.waitKey(5) & 0xFF == 27:
-        break
 
-cap.release()
-cv2.destroyAllWindows()
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@ from collections import Counter, deque
 import random
 from typing import Deque, List
 
+import numpy as np
+
 # Move constants
 MOVES: List[str] = ['rock', 'paper', 'scissors']
 
@@ -12,6 +14,18 @@ COUNTER_MOVE = {
     'scissors': 'rock',
 }
 
+MOVE_INDEX = {mv: i for i, mv in enumerate(MOVES)}
+
+DIFFICULTIES = ('easy', 'medium', 'hard', 'expert')
+
+
+def _context_code(recent: np.ndarray, modulus: int) -> int:
+    """Base-3 code of the *recent* moves (oldest first), most recent lowest."""
+    code = 0
+    for m in np.asarray(recent).tolist():
+        code = code * 3 + m
+    return code % modulus
+
 
 def _most_common_move(history: Deque[str]) -> str:
     """Return the most frequent move in *history* (random tie-break)."""
@@ -48,21 +62,279 @@ def _predict_next_move_markov(history: Deque[str]) -> str:
     return random.choice(top)
 
 
-def smart_choice(history: Deque[str] | None = None, difficulty: str = 'medium') -> str:
+class NGramPredictor:
+    """Online n-gram model of the player's moves.
+
+    ``counts`` stacks one table per context length ``n`` in ``0..order-1``
+    (``n = 0`` is the plain move frequency): rows ``offset[n]`` to
+    ``offset[n] + 3**n`` count how often each move followed every context of
+    the player's previous ``n`` moves. The last ``order - 1`` moves are kept
+    as one base-3 integer, so observing a move increments one cell per table
+    and predicting reads one row per table: both are O(order) however long
+    the session lasts, and the memory used is fixed (39 counters for the
+    default order of 3).
+
+    The model runs ``games`` independent sessions side by side, one per
+    leading axis entry; :meth:`observe_batch` and :meth:`predict_batch` work
+    on move-index arrays, while :meth:`observe` and :meth:`predict` are the
+    single-game API the engine uses.
+    """
+
+    def __init__(self, order: int = 3, games: int = 1, seed: int | None = None) -> None:
+        if order < 1:
+            raise ValueError(f'order must be at least 1, got {order}')
+        self.order = order
+        self.games = games
+        self._rng = np.random.default_rng(seed)
+        self._modulus = 3 ** np.arange(order)
+        self._offset = np.concatenate(([0], np.cumsum(self._modulus)[:-1]))
+        self._context_len = np.arange(order)
+        self._game = np.arange(games)[:, None]
+        self.counts = np.zeros((games, int(self._modulus.sum()), 3), dtype=np.int64)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything, e.g. when a new player steps in."""
+        self.counts.fill(0)
+        self._context = np.zeros(self.games, dtype=np.int64)  # previous moves in base 3, most recent lowest
+        self.seen = 0
+
+    def warm_start(self, counts: np.ndarray, recent: np.ndarray) -> None:
+        """Resume a single-game model from saved state.
+
+        Args:
+            counts: ``(rows, 3)`` counts laid out like ``counts[0]``; tables
+                of longer contexts than this model's order are ignored.
+            recent: The player's latest move indices, oldest first.
+        """
+        self.reset()
+        rows = min(self.counts.shape[1], len(counts))
+        self.counts[0, :rows] = counts[:rows]
+        self.seen = int(counts[0].sum())
+        self._context[0] = _context_code(recent[max(0, len(recent) - (self.order - 1)) :], self._modulus[-1])
+
+    def observe_batch(self, moves: np.ndarray) -> None:
+        """Record one player move index per game."""
+        known = self._context_len <= self.seen
+        rows = self._offset[known] + self._context[:, None] % self._modulus[known]
+        self.counts[self._game, rows, moves[:, None]] += 1
+        self._context = (self._context * 3 + moves) % self._modulus[-1]
+        self.seen += 1
+
+    def predict_batch(self, max_order: int | None = None) -> np.ndarray:
+        """Most likely next move index of every game.
+
+        The longest context (up to *max_order* moves, including the one
+        being predicted) that has been followed by any move wins; ties are
+        broken at random and an empty model predicts a random move.
+        """
+        top = self.order if max_order is None else min(max_order, self.order)
+        rows = self._offset[:top] + self._context[:, None] % self._modulus[:top]
+        table = self.counts[self._game, rows]  # (games, top, 3)
+        usable = (table.max(axis=2) > 0) & (self._context_len[:top] <= self.seen)
+        longest = top - 1 - np.argmax(usable[:, ::-1], axis=1)
+        chosen = table[self._game[:, 0], longest]
+        ties = chosen == chosen.max(axis=1, keepdims=True)
+        return np.argmax(np.where(ties, self._rng.random(chosen.shape), -1.0), axis=1)
+
+    def observe(self, move: str, computer_move: str | None = None) -> None:
+        """Record the player's *move* (``unknown`` moves are ignored).
+
+        *computer_move* is accepted for parity with
+        :meth:`EnsemblePredictor.observe` and ignored.
+        """
+        m = MOVE_INDEX.get(move)
+        if m is not None:
+            self.observe_batch(np.array([m]))
+
+    def predict(self, max_order: int | None = None) -> str:
+        """Most likely next player move (see :meth:`predict_batch`)."""
+        return MOVES[int(self.predict_batch(max_order)[0])]
+
+
+class EnsemblePredictor:
+    """Many predictors scored online; the best-scoring one picks the move.
+
+    Every round the base predictors guess the player's next move:
+
+    * one n-gram model per order ``1..max_order`` (no backoff: each order is
+      its own predictor, falling back to the decayed frequency while its
+      context is unseen);
+    * the move frequency decayed by ``freq_decay`` per round;
+    * win-stay/lose-shift: a player who won repeats their move, one who lost
+      switches to what would have beaten the computer, one who tied moves
+      on to the next move.
+
+    Each guess yields three strategies: the counter to the guess, plus two
+    meta-strategies that assume the player saw the counter coming (and
+    countered it, or countered the counter to it). Every strategy's payoff
+    (+1 win, 0 tie, -1 loss) is added to an exponentially decayed score and
+    the best current score picks the computer's move.
+
+    All counts, guesses and scores live in NumPy arrays with a leading
+    ``games`` axis (see :class:`NGramPredictor`), so both :meth:`choose` and
+    :meth:`observe` are a handful of vectorized operations (a few tens of
+    microseconds) however many rounds are played.
+    """
+
+    def __init__(
+        self,
+        max_order: int = 5,
+        decay: float = 0.9,
+        freq_decay: float = 0.9,
+        games: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        if max_order < 1:
+            raise ValueError(f'max_order must be at least 1, got {max_order}')
+        self.max_order = max_order
+        self.decay = decay
+        self.freq_decay = freq_decay
+        self.games = games
+        self._rng = np.random.default_rng(seed)
+
+        # All n-gram tables in one array, laid out as in NGramPredictor
+        self._modulus = 3 ** np.arange(max_order)
+        self._offset = np.concatenate(([0], np.cumsum(self._modulus)[:-1]))
+        self._context_len = np.arange(max_order)
+        self._game = np.arange(games)[:, None]
+        self._counts = np.zeros((games, int(self._modulus.sum()), 3))
+        self._freq = np.zeros((games, 3))
+        self.n_predictors = max_order + 2
+        self._shift = np.arange(3)  # 0 = counter, 1 and 2 = meta-strategies
+        self.scores = np.zeros((games, self.n_predictors * 3))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything, e.g. when a new player steps in."""
+        self._counts.fill(0.0)
+        self._freq.fill(0.0)
+        self.scores.fill(0.0)
+        self._context = np.zeros(self.games, dtype=np.int64)  # previous moves in base 3, most recent lowest
+        self._wsls = np.full(self.games, -1)  # -1 = no previous round
+        self._moves: np.ndarray | None = None
+        self.seen = 0
+
+    def warm_start(self, counts: np.ndarray, recent: np.ndarray) -> None:
+        """Resume a single-game model from saved counts and recent moves.
+
+        The decayed frequency is rebuilt from *recent*; strategy scores
+        start from zero (see :meth:`NGramPredictor.warm_start`).
+        """
+        self.reset()
+        rows = min(self._counts.shape[1], len(counts))
+        self._counts[0, :rows] = counts[:rows]
+        self.seen = int(counts[0].sum())
+        self._context[0] = _context_code(recent[max(0, len(recent) - (self.max_order - 1)) :], self._modulus[-1])
+        recent = np.asarray(recent, dtype=np.int64)
+        weights = self.freq_decay ** np.arange(len(recent))[::-1]
+        self._freq[0] = np.bincount(recent, weights, minlength=3)
+
+    def _guesses(self) -> np.ndarray:
+        """``(games, n_predictors)`` predicted player moves."""
+        freq = self._freq[:, None, :]
+        rows = np.empty((self.games, self.n_predictors, 3))
+        rows[:, : self.max_order] = self._counts[self._game, self._offset + self._context[:, None] % self._modulus]
+        rows[:, self.max_order :] = freq
+        wsls = self._wsls >= 0
+        rows[wsls, -1] = np.eye(3)[self._wsls[wsls]]
+        rows = np.where(rows.sum(axis=2, keepdims=True) == 0.0, freq, rows)
+        # Counts tie exactly; the tiny noise breaks ties at random
+        return np.argmax(rows + self._rng.random(rows.shape) * 1e-6, axis=2)
+
+    def _strategy_moves(self) -> np.ndarray:
+        if self._moves is None:
+            guesses = self._guesses()[:, :, None]
+            self._moves = ((guesses + 1 + self._shift) % 3).reshape(self.games, -1)
+        return self._moves
+
+    def choose_batch(self) -> np.ndarray:
+        """Move index of every game's best-scoring strategy (random tie-break)."""
+        moves = self._strategy_moves()
+        ties = self.scores == self.scores.max(axis=1, keepdims=True)
+        best = np.argmax(np.where(ties, self._rng.random(ties.shape), -1.0), axis=1)
+        return moves[self._game[:, 0], best]
+
+    def observe_batch(self, moves: np.ndarray, computer_moves: np.ndarray | None = None) -> None:
+        """Score every strategy against each game's player move and learn from it."""
+        m = moves
+        # (c - m) % 3 is 1 when strategy move c wins and 2 when it loses
+        payoff = (self._strategy_moves() - m[:, None] + 1) % 3 - 1
+        self.scores *= self.decay
+        self.scores += payoff
+
+        known = self._context_len <= self.seen
+        rows = self._offset[known] + self._context[:, None] % self._modulus[known]
+        self._counts[self._game, rows, m[:, None]] += 1.0
+        self._freq *= self.freq_decay
+        self._freq[self._game[:, 0], m] += 1.0
+
+        if computer_moves is None:
+            self._wsls.fill(-1)
+        else:
+            c = computer_moves
+            won, lost = (m - c) % 3 == 1, (c - m) % 3 == 1
+            # Won: stay; lost: shift to what beats the computer; tie: move on
+            self._wsls = np.where(won, m, np.where(lost, (c + 1) % 3, (m + 1) % 3))
+
+        self._context = (self._context * 3 + m) % self._modulus[-1]
+        self.seen += 1
+        self._moves = None
+
+    def choose(self) -> str:
+        """Computer move of the best-scoring strategy (random tie-break)."""
+        return MOVES[int(self.choose_batch()[0])]
+
+    def observe(self, move: str, computer_move: str | None = None) -> None:
+        """Score every strategy against the player's *move* and learn from it.
+
+        Args:
+            move: The player's move (``unknown`` moves are ignored).
+            computer_move: What the computer played, for win-stay/lose-shift.
+        """
+        m = MOVE_INDEX.get(move)
+        if m is None:
+            return
+        c = MOVE_INDEX.get(computer_move)
+        self.observe_batch(np.array([m]), None if c is None else np.array([c]))
+
+
+def smart_choice(
+    history: Deque[str] | None = None,
+    difficulty: str = 'medium',
+    predictor: NGramPredictor | EnsemblePredictor | None = None,
+) -> str:
     """Return the computer's move based on difficulty.
 
     Difficulty levels:
     • easy   – random
     • medium – counters the most common player move
     • hard   – Markov prediction + counter
+    • expert – best-scoring strategy of an :class:`EnsemblePredictor`
+
+    With a *predictor* the prediction is read from its running counts
+    instead of being recomputed from *history*; the caller feeds it every
+    player move with its ``observe`` method. *expert* needs an
+    :class:`EnsemblePredictor` (one is built from *history* otherwise).
     """
     difficulty = difficulty.lower()
-    if difficulty not in {'easy', 'medium', 'hard'}:
+    if difficulty not in DIFFICULTIES:
         raise ValueError(f'Unknown difficulty: {difficulty}')
 
-    if history is None or difficulty == 'easy':
+    if difficulty == 'easy' or (history is None and predictor is None):
         return random.choice(MOVES)
 
+    if difficulty == 'expert':
+        if not isinstance(predictor, EnsemblePredictor):
+            predictor = EnsemblePredictor()
+            for mv in history or ():
+                predictor.observe(mv)
+        return predictor.choose()
+
+    if predictor is not None:
+        predicted = predictor.predict(1 if difficulty == 'medium' else None)
+        return COUNTER_MOVE[predicted]
+
     if difficulty == 'medium':
         predicted = _most_common_move(history)
     else:
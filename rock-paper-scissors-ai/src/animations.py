@@ -1,15 +1,15 @@
 import cv2
 import time
 
-def display_winner_animation(image, winner):
+def draw_winner_banner(image, winner):
     """
-    Display a winner animation on the image.
+    Draw the winner of the round centred on the image (nothing on a tie).
 
     Args:
         image: The image to draw on.
         winner: The winner of the round.
     """
-    if winner != 'tie':
+    if winner in ('player', 'computer'):
         text = f'{winner.upper()} WINS!'
         font_scale = 2
         font = cv2.FONT_HERSHEY_TRIPLEX
@@ -47,6 +47,20 @@ def display_winner_animation(image, winner):
             2,
             cv2.LINE_AA,
         )
-        
+
+
+def display_winner_animation(image, winner):
+    """
+    Display a winner animation on the image, blocking for a second.
+
+    The game loop draws :func:`draw_winner_banner` during its result phase
+    instead, so that the camera keeps running.
+
+    Args:
+        image: The image to draw on.
+        winner: The winner of the round.
+    """
+    if winner != 'tie':
+        draw_winner_banner(image, winner)
         cv2.imshow('Rock, Paper, Scissors', image)
         cv2.waitKey(1000)
@@ -1,6 +1,13 @@
-import cv2
+import hashlib
 import os
 
+import cv2
+import numpy as np
+
+IMAGE_SIZE = (100, 100)  # icon slot of the HUD (see src.gui)
+CACHE_DIRNAME = '.cache'
+_FORMAT = b'premultiplied-bgra-fit'  # part of the cache key
+
 
 def _default_asset_dir() -> str:
     """Return absolute path to the *assets* directory."""
@@ -9,25 +16,100 @@ def _default_asset_dir() -> str:
     )
 
 
-def load_images(asset_dir: str | None = None):
+def _source_hash(paths: list[str], size: tuple[int, int]) -> str:
+    """Hash of the PNG files and target size; names the cache file."""
+    digest = hashlib.sha256(_FORMAT + repr(size).encode())
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def premultiply(image: np.ndarray, size: tuple[int, int] = IMAGE_SIZE) -> np.ndarray:
     """
-    Load and resize the images for the game.
+    Fit *image* into *size* and premultiply its colours by alpha.
+
+    The image keeps its aspect ratio and is centred on a transparent
+    background. Scaling happens on premultiplied colours, so transparent
+    pixels do not bleed dark fringes into the edges.
+
+    Args:
+        image: Grey, BGR or BGRA image.
+        size: ``(width, height)`` of the result.
+
+    Returns:
+        ``(height, width, 4)`` uint8 BGRA icon with premultiplied BGR.
+    """
+    if image.ndim == 2:
+        image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+    elif image.shape[2] == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+    pixels = image.astype(np.float32)
+    pixels[:, :, :3] *= pixels[:, :, 3:] / 255.0
+
+    width, height = size
+    scale = min(width / image.shape[1], height / image.shape[0])
+    fitted = (max(1, round(image.shape[1] * scale)), max(1, round(image.shape[0] * scale)))
+    pixels = cv2.resize(pixels, fitted, interpolation=cv2.INTER_AREA)
+
+    icon = np.zeros((height, width, 4), dtype=np.uint8)
+    x0 = (width - fitted[0]) // 2
+    y0 = (height - fitted[1]) // 2
+    icon[y0 : y0 + fitted[1], x0 : x0 + fitted[0]] = np.clip(pixels + 0.5, 0, 255)
+    return icon
+
+
+def load_images(asset_dir: str | None = None, use_cache: bool = True, size: tuple[int, int] = IMAGE_SIZE):
+    """
+    Load the images for the game as premultiplied icons of *size*.
+
+    Icons are baked once by :func:`premultiply` and cached in
+    ``<asset_dir>/.cache`` as an uncompressed ``.npz`` named after a hash of
+    the PNGs and the size, so later launches skip PNG decoding and scaling;
+    editing any PNG invalidates the cache.
 
     Args:
         asset_dir: The directory where the images are stored.
+        use_cache: Read and write the baked image cache.
+        size: ``(width, height)`` the icons are fitted into.
 
     Returns:
-        A dictionary of the loaded images.
+        A dictionary of ``(height, width, 4)`` premultiplied BGRA icons.
     """
     if asset_dir is None:
         asset_dir = _default_asset_dir()
 
-    images: dict[str, cv2.Mat] = {}
-    for filename in os.listdir(asset_dir):
-        if filename.endswith('.png'):
-            name = os.path.splitext(filename)[0]
-            path = os.path.join(asset_dir, filename)
-            image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
-            if image is not None:
-                images[name] = cv2.resize(image, (100, 100))
+    paths = sorted(
+        os.path.join(asset_dir, filename)
+        for filename in os.listdir(asset_dir)
+        if filename.endswith('.png')
+    )
+    cache_path = None
+    if use_cache:
+        cache_dir = os.path.join(asset_dir, CACHE_DIRNAME)
+        cache_path = os.path.join(cache_dir, f'images-{_source_hash(paths, size)}.npz')
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    return {name: cached[name] for name in cached.files}
+            except (OSError, ValueError):
+                pass
+
+    images: dict[str, np.ndarray] = {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if image is not None:
+            images[name] = premultiply(image, size)
+
+    if cache_path is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale in os.listdir(cache_dir):
+                if stale.startswith('images-'):
+                    os.remove(os.path.join(cache_dir, stale))
+            np.savez(cache_path, **images)
+        except OSError:
+            pass  # read-only install: just skip the cache
     return images
@@ -0,0 +1,112 @@
+"""Low-power attract mode for when nobody is playing."""
+from __future__ import annotations
+
+import time
+
+import cv2
+import numpy as np
+
+
+class AttractMode:
+    """Idle state entered after a while without any detected hand.
+
+    In attract mode hand detection should only run ``detect_hz`` times per
+    second on a frame downscaled by ``detect_scale`` and the loop should be
+    capped at ``fps``. A tiny thumbnail difference is checked on every frame
+    so that movement in front of the camera triggers a detection right away;
+    full mode resumes on the frame a hand is found.
+
+    Args:
+        idle_after: Seconds without hands before entering attract mode.
+        detect_hz: Detection rate while in attract mode.
+        detect_scale: Downscale factor of the frames detection runs on.
+        fps: Frame cap while in attract mode.
+        thumb_width: Width of the motion-check thumbnail in pixels.
+        motion_threshold: Mean grey-level change that counts as movement.
+    """
+
+    def __init__(
+        self,
+        idle_after: float = 30.0,
+        detect_hz: float = 4.0,
+        detect_scale: float = 0.5,
+        fps: float = 10.0,
+        thumb_width: int = 32,
+        motion_threshold: float = 6.0,
+    ) -> None:
+        self.idle_after = idle_after
+        self.detect_period = 1.0 / detect_hz
+        self.detect_scale = detect_scale
+        self.fps = fps
+        self.thumb_width = thumb_width
+        self.motion_threshold = motion_threshold
+
+        self.active = False
+        self.transitions = 0
+        self.time_in = {'full': 0.0, 'attract': 0.0}
+        self._last_hand: float | None = None
+        self._last_detect = 0.0
+        self._last_update: float | None = None
+        self._thumb: np.ndarray | None = None
+
+    @property
+    def mode(self) -> str:
+        return 'attract' if self.active else 'full'
+
+    def update(self, hands_found: bool, now: float | None = None) -> bool:
+        """Account time and switch modes.
+
+        Args:
+            hands_found: Whether this frame's detection found a hand.
+            now: Monotonic time of the frame (default: now).
+
+        Returns:
+            ``True`` when the mode changed on this frame.
+        """
+        now = time.monotonic() if now is None else now
+        if self._last_update is not None:
+            self.time_in[self.mode] += now - self._last_update
+        self._last_update = now
+        if self._last_hand is None or hands_found:
+            self._last_hand = now
+
+        idle = now - self._last_hand >= self.idle_after
+        if idle == self.active:
+            return False
+        self.active = idle
+        self.transitions += 1
+        self._thumb = None
+        return True
+
+    def should_detect(self, frame: np.ndarray, now: float | None = None) -> bool:
+        """Return whether detection should run on *frame*."""
+        if not self.active:
+            return True
+        now = time.monotonic() if now is None else now
+        if now - self._last_detect >= self.detect_period or self._moved(frame):
+            self._last_detect = now
+            return True
+        return False
+
+    def downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Return *frame* reduced to the attract-mode detection resolution."""
+        return cv2.resize(
+            frame, None, fx=self.detect_scale, fy=self.detect_scale, interpolation=cv2.INTER_AREA
+        )
+
+    def _moved(self, frame: np.ndarray) -> bool:
+        h, w = frame.shape[:2]
+        size = (self.thumb_width, max(1, self.thumb_width * h // w))
+        thumb = cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        previous, self._thumb = self._thumb, thumb
+        if previous is None:
+            return False
+        return float(cv2.absdiff(thumb, previous).mean()) > self.motion_threshold
+
+    def summary(self) -> str:
+        total = sum(self.time_in.values()) or 1.0
+        return (
+            f"full {self.time_in['full']:.0f} s ({self.time_in['full'] / total:.0%}), "
+            f"attract {self.time_in['attract']:.0f} s ({self.time_in['attract'] / total:.0%}), "
+            f'{self.transitions} switches'
+        )
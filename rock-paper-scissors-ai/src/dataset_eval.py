@@ -0,0 +1,383 @@
+"""Offline evaluation of gesture recognizers on labelled recordings.
+
+Run from the project root::
+
+    python -m src.dataset_eval DATASET [--classifier rules|model|module:attr]
+
+``DATASET`` holds one directory per label (``rock``, ``paper``,
+``scissors``; any other name, such as ``other``, counts as ``unknown``)
+with images and/or video clips; every frame is labelled by its directory.
+
+The tool works in two stages:
+
+1. **Extraction**: a process pool runs MediaPipe on every file (each worker
+   owns one tracker; videos are tracked, images detected independently) and
+   caches the landmarks of each file as ``.npz`` under
+   ``DATASET/.landmarks``, keyed by path, size and modification time, so
+   later runs skip decoding and inference entirely.
+2. **Classification**: the cached landmarks of the whole dataset are fed to
+   the classifier in one batch, then per-class precision/recall and a
+   confusion matrix are printed.
+
+Both stages report frames per second. Frames without a detected hand are
+counted per class but not classified.
+
+With ``--train`` the landmark classifier is fitted on the dataset instead:
+the finger rules and the classifier, cross-validated by file (hands of one
+clip are never both trained and scored on), are reported side by side, the
+``unknown`` hands calibrate the reject distance, and the model fitted on
+every file is saved (by default over ``assets/gesture_model.npy``).
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from .gesture import LABELS, N_FEATURES, UNKNOWN, GestureClassifier, hand_features
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+CACHE_DIRNAME = '.landmarks'
+CLASSES = [*LABELS, UNKNOWN]
+
+# (hands, 21, 3) landmarks in square-pixel units -> one gesture name per hand
+Classifier = Callable[[np.ndarray], Sequence[str]]
+
+
+def scan(root: str) -> list[tuple[str, str]]:
+    """``(path, label)`` of every image and video under *root*."""
+    files = []
+    for entry in sorted(os.listdir(root)):
+        directory = os.path.join(root, entry)
+        if entry.startswith('.') or not os.path.isdir(directory):
+            continue
+        label = entry.lower() if entry.lower() in LABELS else UNKNOWN
+        for dirpath, _, filenames in os.walk(directory):
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+                    files.append((os.path.join(dirpath, filename), label))
+    return files
+
+
+def _cache_path(cache_dir: str, path: str) -> str:
+    stat = os.stat(path)
+    key = f'{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}'
+    return os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest()[:24] + '.npz')
+
+
+# ---------------------------------------------------------------------------
+# Stage 1: landmark extraction (worker processes)
+# ---------------------------------------------------------------------------
+
+_trackers: dict[bool, object] = {}
+
+
+def _tracker(static: bool):
+    # One tracker per worker and mode; MediaPipe graphs are expensive to build
+    if static not in _trackers:
+        from .tracker import HandTracker
+
+        _trackers[static] = HandTracker(max_num_hands=1, static_image_mode=static)
+    return _trackers[static]
+
+
+def _frames(path: str):
+    if path.lower().endswith(IMAGE_EXTENSIONS):
+        image = cv2.imread(path, cv2.IMREAD_COLOR)
+        if image is not None:
+            yield image
+        return
+    cap = cv2.VideoCapture(path)
+    try:
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            yield frame
+    finally:
+        cap.release()
+
+
+def extract(path: str, cache_path: str) -> dict:
+    """Run the tracker on every frame of *path* and cache the landmarks.
+
+    The cache holds ``landmarks`` (``(frames, 21, 3)``, NaN where no hand was
+    found) and the frame ``aspect`` (width / height).
+
+    Returns:
+        ``frames`` and the ``decode`` and ``detect`` seconds spent.
+    """
+    static = path.lower().endswith(IMAGE_EXTENSIONS)
+    tracker = _tracker(static)
+    landmarks = []
+    aspect = 1.0
+    decode = detect = 0.0
+    start = time.perf_counter()
+    for frame in _frames(path):
+        t = time.perf_counter()
+        decode += t - start
+        aspect = frame.shape[1] / frame.shape[0]
+        hands = tracker.detect(frame)
+        landmarks.append(hands.landmarks[0] if len(hands) else np.full((21, 3), np.nan, dtype=np.float32))
+        start = time.perf_counter()
+        detect += start - t
+    if not static:
+        _trackers.pop(False).close()  # start the next clip without tracking state
+    array = np.stack(landmarks) if landmarks else np.empty((0, 21, 3), dtype=np.float32)
+    np.savez(cache_path, landmarks=array, aspect=np.float32(aspect))
+    return {'frames': len(array), 'decode': decode, 'detect': detect}
+
+
+def extract_all(
+    files: list[tuple[str, str]],
+    cache_dir: str,
+    workers: int | None = None,
+) -> tuple[list[np.ndarray], dict]:
+    """Landmarks (in square-pixel units) of every file, extracting uncached ones.
+
+    Returns:
+        One ``(frames, 21, 3)`` array per file and extraction statistics.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    caches = [_cache_path(cache_dir, path) for path, _ in files]
+    todo = [(path, cache) for (path, _), cache in zip(files, caches) if not os.path.exists(cache)]
+
+    stats = {'files': len(todo), 'frames': 0, 'decode': 0.0, 'detect': 0.0, 'wall': 0.0}
+    start = time.perf_counter()
+    if todo:
+        if workers == 1:
+            results = [extract(*job) for job in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(extract, *zip(*todo)))
+        for result in results:
+            for key in ('frames', 'decode', 'detect'):
+                stats[key] += result[key]
+    stats['wall'] = time.perf_counter() - start
+
+    arrays = []
+    for cache in caches:
+        with np.load(cache) as data:
+            landmarks = data['landmarks'].copy()
+            landmarks[:, :, 0] *= float(data['aspect'])
+        arrays.append(landmarks)
+    return arrays, stats
+
+
+# ---------------------------------------------------------------------------
+# Stage 2: bulk classification
+# ---------------------------------------------------------------------------
+
+
+def rules_classifier(landmarks: np.ndarray) -> list[str]:
+    from .hand_gesture import get_hand_gesture
+
+    return [get_hand_gesture(hand) for hand in landmarks]
+
+
+def model_classifier(landmarks: np.ndarray) -> list[str]:
+    return GestureClassifier.load().classify(landmarks)
+
+
+def load_classifier(name: str) -> Classifier:
+    """``rules``, ``model`` or a ``module:attribute`` callable."""
+    if name == 'rules':
+        return rules_classifier
+    if name == 'model':
+        return model_classifier
+    module, _, attr = name.partition(':')
+    if not attr:
+        raise ValueError(f'Expected rules, model or module:attribute, got {name!r}')
+    return getattr(importlib.import_module(module), attr)
+
+
+def confusion_matrix(truth: Sequence[str], predicted: Sequence[str]) -> np.ndarray:
+    """``(len(CLASSES), len(CLASSES))`` counts, true class by row."""
+    index = {name: k for k, name in enumerate(CLASSES)}
+    matrix = np.zeros((len(CLASSES), len(CLASSES)), dtype=np.int64)
+    np.add.at(matrix, ([index[t] for t in truth], [index.get(p, index[UNKNOWN]) for p in predicted]), 1)
+    return matrix
+
+
+def format_report(matrix: np.ndarray, detected: np.ndarray, frames: np.ndarray) -> str:
+    """Per-class precision/recall, detection rate and the confusion matrix."""
+    tp = np.diag(matrix)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        precision = tp / matrix.sum(axis=0)
+        recall = tp / matrix.sum(axis=1)
+    width = max(len(name) for name in CLASSES) + 2
+    lines = [f"{'class':<{width}} {'precision':>9} {'recall':>7} {'hands':>13}"]
+    for k, name in enumerate(CLASSES):
+        hands = f'{detected[k]}/{frames[k]}'
+        lines.append(f'{name:<{width}} {precision[k]:>9.1%} {recall[k]:>7.1%} {hands:>13}')
+    lines.append(f'accuracy {tp.sum() / max(1, matrix.sum()):.1%}')
+    lines.append('')
+    corner = 'true \\ predicted'
+    lines.append(f'{corner:<{len(corner) + 2}}' + ''.join(f'{name:>{width}}' for name in CLASSES))
+    for k, name in enumerate(CLASSES):
+        lines.append(f'{name:<{len(corner) + 2}}' + ''.join(f'{n:>{width}}' for n in matrix[k]))
+    return '\n'.join(lines)
+
+
+def evaluate(
+    arrays: list[np.ndarray],
+    labels: list[str],
+    classifier: Classifier,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Classify every detected hand in one batch.
+
+    Returns:
+        The confusion matrix, hands detected and frames per class, and the
+        classification time in seconds.
+    """
+    index = {name: k for k, name in enumerate(CLASSES)}
+    counts = np.array([len(a) for a in arrays])
+    landmarks = np.concatenate(arrays) if arrays else np.empty((0, 21, 3), dtype=np.float32)
+    truth = np.repeat([index[label] for label in labels], counts)
+    found = ~np.isnan(landmarks).any(axis=(1, 2))
+
+    start = time.perf_counter()
+    predicted = classifier(landmarks[found]) if found.any() else []
+    seconds = time.perf_counter() - start
+
+    matrix = confusion_matrix([CLASSES[k] for k in truth[found]], predicted)
+    detected = np.bincount(truth[found], minlength=len(CLASSES))
+    frames = np.bincount(truth, minlength=len(CLASSES))
+    return matrix, detected, frames, seconds
+
+
+# ---------------------------------------------------------------------------
+# Training the landmark classifier
+# ---------------------------------------------------------------------------
+
+
+def hand_feature_arrays(arrays: list[np.ndarray]) -> list[np.ndarray]:
+    """``(hands, N_FEATURES)`` features of the detected hands of every file."""
+    features = []
+    for landmarks in arrays:
+        hands = landmarks[~np.isnan(landmarks).any(axis=(1, 2))]
+        features.append(hand_features(hands) if len(hands) else np.empty((0, N_FEATURES), dtype=np.float32))
+    return features
+
+
+def fit(features: list[np.ndarray], labels: list[str]) -> GestureClassifier:
+    """Fit the classifier on the hands of every file, labelled by file.
+
+    Hands of ``unknown`` files calibrate the reject distance.
+
+    Raises:
+        ValueError: If a gesture has no hands to fit.
+    """
+    index = {name: k for k, name in enumerate(LABELS)}
+    y = np.concatenate([np.full(len(f), index.get(label, -1)) for f, label in zip(features, labels)])
+    x = np.concatenate(features) if features else np.empty((0, N_FEATURES), dtype=np.float32)
+    missing = [name for k, name in enumerate(LABELS) if not (y == k).any()]
+    if missing:
+        raise ValueError(f'No hands to fit {", ".join(missing)} on')
+    classifier = GestureClassifier.fit(x[y >= 0], y[y >= 0])
+    classifier.calibrate(x, y)
+    return classifier
+
+
+def cross_validate(features: list[np.ndarray], labels: list[str], folds: int = 5) -> list[list[str]]:
+    """Held-out gesture names of every file's hands, ``folds``-fold by file.
+
+    The files of each label are dealt round-robin into the folds, so every
+    fold holds about the same mix of labels.
+    """
+    seen: dict[str, int] = {}
+    fold = []
+    for label in labels:
+        fold.append(seen.get(label, 0) % folds)
+        seen[label] = seen.get(label, 0) + 1
+    predicted: list[list[str]] = [[] for _ in features]
+    for k in range(folds):
+        test = [i for i, f in enumerate(fold) if f == k]
+        if not test:
+            continue
+        train = [i for i, f in enumerate(fold) if f != k]
+        classifier = fit([features[i] for i in train], [labels[i] for i in train])
+        for i in test:
+            predicted[i] = [LABELS[j] if j >= 0 else UNKNOWN for j in classifier.predict(features[i]).tolist()]
+    return predicted
+
+
+def _train(arrays: list[np.ndarray], labels: list[str], folds: int, output: str | None) -> None:
+    """Report the rules and the cross-validated classifier, then fit and save it."""
+    matrix, detected, frames, _ = evaluate(arrays, labels, rules_classifier)
+    print('Finger rules')
+    print(format_report(matrix, detected, frames))
+
+    features = hand_feature_arrays(arrays)
+    predicted = cross_validate(features, labels, folds)
+    truth = [label for f, label in zip(features, labels) for _ in range(len(f))]
+    matrix = confusion_matrix(truth, [name for names in predicted for name in names])
+    print()
+    print(f'Landmark classifier ({folds}-fold cross-validation by file)')
+    print(format_report(matrix, detected, frames))
+
+    classifier = fit(features, labels)
+    classifier.save(output)
+    print()
+    print(f"Saved {output or 'assets/gesture_model.npy'} (reject distance {classifier.reject:.2f})")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Evaluate gesture recognition on labelled images and videos')
+    parser.add_argument('dataset', help='Directory with one sub-directory of recordings per label')
+    parser.add_argument(
+        '--classifier',
+        default='model',
+        help='rules, model (default) or a module:attribute callable taking (hands, 21, 3) landmarks',
+    )
+    parser.add_argument('--cache', help=f'Landmark cache directory (default: DATASET/{CACHE_DIRNAME})')
+    parser.add_argument('--workers', type=int, help='Extraction processes (default: one per CPU, 1 = no pool)')
+    parser.add_argument(
+        '--train',
+        action='store_true',
+        help='Fit the landmark classifier on the dataset and compare it with the finger rules',
+    )
+    parser.add_argument('--folds', type=int, default=5, help='Cross-validation folds with --train (default: 5)')
+    parser.add_argument('--output', help='Where --train saves the model (default: assets/gesture_model.npy)')
+    args = parser.parse_args(argv)
+    if args.folds < 2:
+        parser.error('--folds must be at least 2')
+
+    files = scan(args.dataset)
+    if not files:
+        parser.error(f'No images or videos found under {args.dataset}')
+    cache_dir = args.cache or os.path.join(args.dataset, CACHE_DIRNAME)
+    arrays, stats = extract_all(files, cache_dir, args.workers)
+    labels = [label for _, label in files]
+    if args.train:
+        _train(arrays, labels, args.folds, args.output)
+        return
+    classifier = load_classifier(args.classifier)
+    matrix, detected, frames, seconds = evaluate(arrays, labels, classifier)
+
+    print(format_report(matrix, detected, frames))
+    print()
+    if stats['files']:
+        frame_count = stats['frames']
+        print(
+            f"Extraction: {stats['files']} files, {frame_count} frames in {stats['wall']:.1f} s "
+            f"({frame_count / max(stats['wall'], 1e-9):.0f} FPS overall; per worker "
+            f"decode {frame_count / max(stats['decode'], 1e-9):.0f} FPS, "
+            f"detect {frame_count / max(stats['detect'], 1e-9):.0f} FPS)"
+        )
+    else:
+        print(f'Extraction: all {len(files)} files cached')
+    hands = int(detected.sum())
+    print(f'Classification ({args.classifier}): {hands} hands in {seconds * 1000:.1f} ms ({hands / max(seconds, 1e-9):,.0f} FPS)')
+
+
+if __name__ == '__main__':
+    main()
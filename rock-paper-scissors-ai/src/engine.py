@@ -0,0 +1,505 @@
+"""Importable Rock-Paper-Scissors game engine.
+
+:class:`RPSGame` owns the game state and has an explicit lifecycle:
+
+* constructing it is cheap and has no side effects;
+* :meth:`RPSGame.warm_up` loads images and sounds, builds the hand tracker
+  and runs one throw-away inference, so the first real frame does not pay
+  for MediaPipe's graph initialization (:meth:`RPSGame.run` also opens the
+  camera);
+* :meth:`RPSGame.step` advances the game by one camera frame and returns the
+  composed image; a :class:`~src.phases.RoundPhases` state machine decides
+  on which frames hand detection runs (see there);
+* :meth:`RPSGame.shutdown` releases whatever the game acquired itself, after
+  which it can be warmed up again.
+
+The camera, the hand tracker and the audio can be injected, so the engine can
+be benchmarked on recorded frames, run without a sound card (or, with an
+injected tracker, without MediaPipe) or embedded in another program.
+``main.py`` is only a command-line wrapper around :meth:`RPSGame.run`.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import cv2
+import numpy as np
+
+from .ai import MOVE_INDEX, EnsemblePredictor, NGramPredictor
+from .animations import draw_winner_banner
+from .attract import AttractMode
+from .events import EventLog
+from .game import get_computer_choice, get_winner
+from .gesture import GestureClassifier
+from .gui import CANVAS_SIZE, Compositor
+from .hand_gesture import get_hand_gesture
+from .hands import HandResult, draw_hands
+from .latency import LatencyTracker
+from .pacing import FrameScheduler
+from .phases import CAPTURE, COUNTDOWN, RESULT, RoundPhases
+from .profiles import OpponentStore
+from .ui import display_ui
+
+WINDOW_NAME = 'Rock, Paper, Scissors'
+ESC = 27
+
+
+class RPSGame:
+    """One Rock-Paper-Scissors session against the AI.
+
+    Args:
+        difficulty: ``easy``, ``medium``, ``hard``, ``expert`` or ``normal``
+            (= medium).
+        camera: ``cv2.VideoCapture``-like source used by :meth:`run`;
+            opened from ``camera_index`` on warm-up when omitted.
+        camera_index: Device index of the default camera.
+        tracker: Object with a ``detect(frame_bgr)`` method returning a
+            ``HandResult``; a MediaPipe ``HandTracker`` is built on warm-up
+            when omitted.
+        audio: Sound name -> object with a ``play()`` method (``{}`` mutes
+            the game); loaded with pygame on warm-up when omitted.
+        images: Image name -> premultiplied BGRA icon (see
+            :func:`src.assets.load_images`); loaded on warm-up when omitted.
+        motion_gate: Reuse the previous detection while the scene is static
+            (default tracker only).
+        gestures: Classifier of the player's hand; without one the finger
+            rules of ``get_hand_gesture`` are used.
+        learned_gestures: Load the shipped :class:`GestureClassifier` on
+            warm-up when *gestures* is omitted (experimental: it has only
+            been validated on synthetic hands so far).
+        target_fps: Frame cap of :meth:`run` (default: the camera's native
+            rate, ``0`` = uncapped).
+        idle_after: Seconds without hands before the low-power attract mode
+            (``0`` = never).
+        events: Round log; a memory-only :class:`EventLog` when omitted.
+        profiles: Store the AI's opponent model is resumed from and saved
+            to after every round.
+        player: Name of the player's profile in *profiles* (e.g. the
+            kiosk's name when players are anonymous).
+        phases: Round timing, detection duty cycle and gesture voting.
+        latency_every: Print latency percentiles every so many seconds.
+        native_ui: Return the 1280×720 composed canvas from :meth:`step`
+            instead of scaling it down to the camera frame's size.
+        display: Whether the game may open its own window.
+    """
+
+    def __init__(
+        self,
+        difficulty: str = 'normal',
+        *,
+        camera: Any = None,
+        camera_index: int = 1,
+        tracker: Any = None,
+        audio: dict[str, Any] | None = None,
+        images: dict[str, np.ndarray] | None = None,
+        motion_gate: bool = False,
+        gestures: GestureClassifier | None = None,
+        learned_gestures: bool = False,
+        target_fps: float | None = None,
+        idle_after: float = 30.0,
+        events: EventLog | None = None,
+        profiles: OpponentStore | None = None,
+        player: str = 'kiosk',
+        phases: RoundPhases | None = None,
+        latency_every: float | None = None,
+        native_ui: bool = False,
+        display: bool = True,
+    ) -> None:
+        # Map "normal" → "medium" for the underlying AI while keeping the
+        # label the user passed for display purposes.
+        self.difficulty_label = difficulty.lower()
+        self.difficulty = 'medium' if self.difficulty_label == 'normal' else self.difficulty_label
+        self.camera = camera
+        self.camera_index = camera_index
+        self.tracker = tracker
+        self.audio = audio
+        self.images = images
+        self.motion_gate = motion_gate
+        self.gestures = gestures
+        self.learned_gestures = learned_gestures
+        self.target_fps = target_fps
+        self.events = EventLog() if events is None else events
+        self.profiles = profiles
+        self.player = player
+        self.latency_every = latency_every
+        self.native_ui = native_ui
+        self.display = display
+
+        self.scheduler = FrameScheduler(target_fps)
+        self.latency = LatencyTracker()
+        self.predictor = EnsemblePredictor() if self.difficulty == 'expert' else NGramPredictor()
+        self.attract = AttractMode(idle_after=idle_after) if idle_after > 0 else None
+        self.phases = RoundPhases() if phases is None else phases
+        self.compositor = Compositor()
+
+        self.warm_up_time: float | None = None
+        self._ready = False
+        self._owned: set[str] = set()
+        self._gate = None
+        self._no_hands = self._hands = HandResult.empty()
+        self.reset()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def reset(self) -> None:
+        """Start a new match: clear scores and begin a countdown."""
+        self.scores = {'player': 0, 'computer': 0}
+        self.player_choice = 'unknown'
+        self.computer_choice = 'unknown'
+        self.winner = 'unknown'
+        self.round_number = 0
+        self._resume_player()
+        self._start_countdown()
+        self._last_latency_report = time.monotonic()
+
+    def _resume_player(self) -> None:
+        """Start the AI afresh, or from the player's saved profile."""
+        self.predictor.reset()
+        if self.profiles is None or not self._ready:
+            return
+        profile = self.profiles.start_session(self.player)
+        if profile.rounds:
+            self.predictor.warm_start(profile.counts, profile.history)
+
+    def _start_countdown(self) -> None:
+        self.phases.start(COUNTDOWN)
+        self._beeped = 0  # last countdown digit the sound was played for
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warm_up(self, frame_size: tuple[int, int] = (640, 480)) -> float:
+        """Acquire every resource the game needs; return the time it took.
+
+        Args:
+            frame_size: ``(width, height)`` of the blank frame the tracker is
+                warmed up on.
+        """
+        if self.ready:
+            return self.warm_up_time
+        start = time.perf_counter()
+
+        self._hands = self._no_hands
+        # MediaPipe and pygame are only imported once they are needed
+        if self.images is None:
+            from .assets import load_images
+
+            self.images = load_images()
+            self._owned.add('images')
+        if self.gestures is None and self.learned_gestures:
+            self.gestures = GestureClassifier.load()
+            self._owned.add('gestures')
+        if self.audio is None:
+            from .sounds import load_sounds
+
+            self.audio = load_sounds()
+            self._owned.add('audio')
+        if self.tracker is None:
+            from .motion_gate import MotionGate
+            from .tracker import HandTracker
+
+            self.tracker = HandTracker(
+                max_num_hands=1,
+                motion_gate=MotionGate() if self.motion_gate else None,
+            )
+            self._owned.add('tracker')
+
+        self._gate = getattr(self.tracker, 'motion_gate', None)
+
+        # The first inference builds MediaPipe's graph; pay for it now
+        self.tracker.detect(np.zeros((frame_size[1], frame_size[0], 3), dtype=np.uint8))
+        if self._gate is not None:
+            self._gate.reset()
+
+        self.events.start()
+        self._ready = True
+        self.reset()
+        self.warm_up_time = time.perf_counter() - start
+        return self.warm_up_time
+
+    def open_camera(self) -> Any:
+        """Open the default camera unless one was injected; return it."""
+        if self.camera is None:
+            # Use the USB webcam on index 1 by default. Adjust as required for
+            # your system (e.g., 0 for built-in or virtual cameras).
+            self.camera = cv2.VideoCapture(self.camera_index)
+            self._owned.add('camera')
+        if self.target_fps is None:
+            # Cap the loop at the camera's own rate: faster iterations would
+            # only re-process the same frame and steal CPU from hand tracking.
+            camera_fps = self.camera.get(cv2.CAP_PROP_FPS)
+            self.target_fps = camera_fps if 0 < camera_fps < 1000 else 30.0
+            self.scheduler.set_target(self.target_fps)
+        return self.camera
+
+    def shutdown(self) -> None:
+        """Release what :meth:`warm_up` and :meth:`open_camera` acquired."""
+        if 'camera' in self._owned:
+            self.camera.release()
+            self.camera = None
+        if 'tracker' in self._owned:
+            self.tracker.close()
+            self.tracker = None
+        if 'audio' in self._owned:
+            from .sounds import close_sounds
+
+            close_sounds()
+            self.audio = None
+        if 'images' in self._owned:
+            self.images = None
+        if 'gestures' in self._owned:
+            self.gestures = None
+        self._owned.clear()
+        self.events.close()
+        if self.profiles is not None:
+            self.profiles.close()
+        if self.display:
+            cv2.destroyAllWindows()
+        self._ready = False
+
+    def __enter__(self) -> 'RPSGame':
+        self.warm_up()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Frame processing
+    # ------------------------------------------------------------------
+
+    def _play(self, name: str) -> None:
+        sound = self.audio.get(name)
+        if sound:
+            sound.play()
+
+    def step(
+        self, frame: np.ndarray, render: bool = True, capture_time: float | None = None
+    ) -> np.ndarray | None:
+        """Advance the game by one camera frame.
+
+        Args:
+            frame: Raw BGR camera frame (mirrored here for the selfie view).
+            render: Whether to compose the UI; skipped frames still run
+                detection and game logic.
+            capture_time: :func:`time.monotonic` when *frame* was read from
+                the camera; latency is measured from the call when omitted.
+
+        Returns:
+            The composed image, or ``None`` when *render* is false. With
+            ``native_ui`` it is the compositor's canvas, which the next call
+            overwrites.
+        """
+        if not self.ready:
+            self.warm_up((frame.shape[1], frame.shape[0]))
+        self.latency.begin(capture_time)
+
+        # Flip the frame horizontally for a later selfie-view display
+        image = cv2.flip(frame, 1)
+        attract = self.attract
+        if attract is not None and attract.active:
+            if attract.should_detect(image):
+                # Landmarks are normalized, so detecting on a smaller frame is transparent
+                hands = self.tracker.detect(attract.downscale(image))
+            else:
+                hands = self._no_hands
+        else:
+            # Outside the capture window detection runs at a reduced rate (or
+            # not at all); frames in between reuse the last result
+            if self.phases.update():
+                self._beeped = 0
+            if self.phases.should_detect():
+                self._hands = self.tracker.detect(image)
+            elif self.phases.phase == RESULT:
+                self._hands = self._no_hands  # nothing to follow while the outcome is shown
+            hands = self._hands
+        self.latency.stamp('detection')
+
+        if attract is not None and attract.update(len(hands) > 0):
+            self.scheduler.set_target(attract.fps if attract.active else self.target_fps)
+            self.scheduler.reset()
+            if self._gate is not None:
+                self._gate.reset()
+            if attract.active:
+                self.phases.suspend()
+            else:
+                # Welcome the new player with a fresh countdown and AI
+                self._resume_player()
+                self._start_countdown()
+
+        if attract is not None and attract.active:
+            if self.native_ui:
+                image = cv2.resize(image, CANVAS_SIZE)
+            self._draw_attract(image)
+            return image
+
+        phase = self.phases.phase
+        if phase == COUNTDOWN:
+            self._draw_countdown(image)
+
+        if len(hands):
+            # Draw the hand annotations on the image.
+            draw_hands(image, hands)
+
+        if phase == CAPTURE:
+            # Every frame of the capture window votes; the round is played
+            # once enough recent frames agree on a move
+            gesture = 'unknown'
+            if len(hands):
+                gesture = self._recognize(hands.landmarks[0], image.shape[1] / image.shape[0])
+            move = self.phases.vote(gesture)
+            if move is not None:
+                self.player_choice = move
+                self._play_round()
+                self.latency.stamp('decision')
+
+        if not render:
+            return None
+        image = display_ui(
+            image,
+            self.player_choice,
+            self.computer_choice,
+            self.winner,
+            self.scores,
+            self.images,
+            difficulty=self.difficulty_label,
+            compositor=self.compositor,
+            native=self.native_ui,
+        )
+        if self.phases.phase == RESULT:
+            # On the canvas, keep the banner out of the HUD panel, which is
+            # only redrawn when its contents change
+            draw_winner_banner(self.compositor.webcam_region if self.native_ui else image, self.winner)
+        return image
+
+    def _recognize(self, landmarks: np.ndarray, aspect: float) -> str:
+        if self.gestures is None:
+            return get_hand_gesture(landmarks)
+        return self.gestures.classify(landmarks[None], aspect)[0]
+
+    def _draw_countdown(self, image: np.ndarray) -> None:
+        countdown = self.phases.seconds_left
+        if countdown <= 0:
+            return
+        cv2.putText(
+            image,
+            str(countdown),
+            (
+                image.shape[1] // 2 - 50,
+                image.shape[0] // 2 + 50,
+            ),
+            cv2.FONT_HERSHEY_TRIPLEX,
+            4,
+            (255, 255, 255),
+            5,
+        )
+        if countdown != self._beeped:
+            self._play('countdown')
+            self._beeped = countdown
+
+    def _play_round(self) -> None:
+        self.computer_choice = get_computer_choice(
+            difficulty=self.difficulty,
+            predictor=self.predictor,
+        )
+        self.predictor.observe(self.player_choice, self.computer_choice)
+        if self.profiles is not None:
+            self.profiles.record(
+                self.player,
+                MOVE_INDEX[self.player_choice],
+                MOVE_INDEX[self.computer_choice],
+            )
+        self.winner = get_winner(self.player_choice, self.computer_choice)
+        self.round_number += 1
+        self.events.emit(
+            'round',
+            round=self.round_number,
+            player=self.player_choice,
+            computer=self.computer_choice,
+            winner=self.winner,
+            difficulty=self.difficulty,
+        )
+
+        if self.winner == 'player':
+            self.scores['player'] += 1
+            self._play('win')
+        elif self.winner == 'computer':
+            self.scores['computer'] += 1
+            self._play('lose')
+
+        # The outcome is shown for a while, then the next countdown starts
+        self.phases.start(RESULT)
+
+    @staticmethod
+    def _draw_attract(image: np.ndarray) -> None:
+        """Minimal idle screen: dimmed camera view and an invitation to play."""
+        cv2.convertScaleAbs(image, image, 0.5)
+        text = 'Show your hand to play!'
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_TRIPLEX, 1.2, 2)
+        cv2.putText(
+            image,
+            text,
+            ((image.shape[1] - text_width) // 2, image.shape[0] // 2),
+            cv2.FONT_HERSHEY_TRIPLEX,
+            1.2,
+            (255, 255, 255),
+            2,
+        )
+
+    def present(self, image: np.ndarray | None) -> int:
+        """Show *image* (if any), poll the keyboard and close the frame's latency.
+
+        Returns:
+            The low byte of the key pressed (``255`` when none was).
+        """
+        if image is not None:
+            cv2.imshow(WINDOW_NAME, image)
+        key = cv2.waitKey(1) & 0xFF
+        if image is not None:
+            self.latency.stamp('present')
+        self.latency.end()
+        if self.latency_every and time.monotonic() - self._last_latency_report >= self.latency_every:
+            self._last_latency_report = time.monotonic()
+            print(f'Latency {self.latency.summary()}')
+        return key
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Play on the camera until it stops or ESC is pressed."""
+        self.warm_up()
+        cap = self.open_camera()
+        while cap.isOpened():
+            ret, frame = cap.read()
+            captured = time.monotonic()
+            if not ret:
+                break
+            tick = self.scheduler.begin_frame()
+            image = self.step(frame, render=tick.render, capture_time=captured)
+            if self.present(image) == ESC:
+                break
+            self.scheduler.wait()
+
+    def summary(self) -> list[str]:
+        """Human-readable session statistics, one line each."""
+        lines = []
+        if self.warm_up_time is not None:
+            lines.append(f'Warm-up: {self.warm_up_time * 1000:.0f} ms')
+        if self.events.writer is not None:
+            lines.append(f'Event log: {self.events.summary()}')
+        if self.profiles is not None:
+            lines.append(f'Profiles: {self.profiles.summary()}')
+        lines.append(f'Latency {self.latency.summary()}')
+        lines.append(f'Pacing: {self.scheduler.summary()}')
+        lines.append(f'Phases: {self.phases.summary()}')
+        if self.attract is not None:
+            lines.append(f'Attract mode: {self.attract.summary()}')
+        if self._gate is not None:
+            lines.append(f'Motion gate {self._gate.summary()}')
+        return lines
@@ -0,0 +1,189 @@
+"""Structured game events with an asynchronous, batched writer.
+
+:meth:`EventLog.emit` only appends a ``(time, kind, fields)`` tuple to a
+bounded ring buffer (a thread-safe :class:`collections.deque`); a background
+thread drains it every ``flush_interval`` seconds and hands each batch to an
+:class:`EventWriter`, which does the serialization and file I/O.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any
+
+Event = tuple[float, str, dict]
+
+
+class EventWriter(ABC):
+    """Destination of event batches; every method runs on the writer thread."""
+
+    def open(self) -> None:
+        pass
+
+    @abstractmethod
+    def write(self, batch: list[Event]) -> None:
+        """Persist one batch of events."""
+
+    def close(self) -> None:
+        pass
+
+
+class JSONLWriter(EventWriter):
+    """Append events to rotating ``<prefix>_<session>_<n>.jsonl`` files.
+
+    Args:
+        directory: Directory the files are written to.
+        prefix: File name prefix.
+        max_bytes: Size after which a new file is started.
+    """
+
+    def __init__(self, directory: str, prefix: str = 'events', max_bytes: int = 10_000_000) -> None:
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.files: list[str] = []
+        self._session = time.strftime('%Y%m%d-%H%M%S')
+        self._file = None
+        self._size = 0
+
+    def open(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._roll()
+
+    def write(self, batch: list[Event]) -> None:
+        lines = ''.join(
+            json.dumps({'t': round(t, 4), 'event': kind, **fields}, separators=(',', ':')) + '\n'
+            for t, kind, fields in batch
+        )
+        if self._size and self._size + len(lines) > self.max_bytes:
+            self._roll()
+        self._file.write(lines)
+        self._file.flush()
+        self._size += len(lines)
+
+    def _roll(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        path = os.path.join(self.directory, f'{self.prefix}_{self._session}_{len(self.files):03d}.jsonl')
+        self._file = open(path, 'a', encoding='utf-8')
+        self._size = 0
+        self.files.append(path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SQLiteWriter(EventWriter):
+    """Insert events into an ``events(t, session, event, data)`` SQLite table.
+
+    Args:
+        path: Database file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.session = time.strftime('%Y%m%d-%H%M%S')
+        self._db: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Created on the writer thread, which is the only one using it
+        self._db = sqlite3.connect(self.path)
+        self._db.execute('CREATE TABLE IF NOT EXISTS events (t REAL, session TEXT, event TEXT, data TEXT)')
+
+    def write(self, batch: list[Event]) -> None:
+        rows = [(t, self.session, kind, json.dumps(fields, separators=(',', ':'))) for t, kind, fields in batch]
+        with self._db:
+            self._db.executemany('INSERT INTO events VALUES (?, ?, ?, ?)', rows)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class EventLog:
+    """Ring-buffered event recorder flushed by a background thread.
+
+    If events arrive faster than the writer drains them, the oldest buffered
+    events are dropped (and counted) instead of blocking the game loop.
+
+    Args:
+        writer: Where batches go; ``None`` keeps events in memory only.
+        capacity: Size of the ring buffer.
+        flush_interval: Seconds between flushes.
+    """
+
+    def __init__(self, writer: EventWriter | None = None, capacity: int = 8192, flush_interval: float = 0.5) -> None:
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self._buffer: deque[Event] = deque(maxlen=capacity)
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        self.emitted = 0
+        self.written = 0
+        self.batches = 0
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        """Record an event of type *kind*; *fields* must be JSON-serializable."""
+        self._buffer.append((time.time(), kind, fields))
+        self.emitted += 1
+
+    @property
+    def dropped(self) -> int:
+        return self.emitted - self.written - len(self._buffer)
+
+    def start(self) -> 'EventLog':
+        if self.writer is not None and self._thread is None:
+            self._stop = False
+            self._wake.clear()
+            self._thread = threading.Thread(target=self._run, name='EventLog', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush every buffered event and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._stop = True
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _drain(self) -> list[Event]:
+        batch = []
+        while self._buffer:
+            try:
+                batch.append(self._buffer.popleft())
+            except IndexError:
+                break
+        return batch
+
+    def _run(self) -> None:
+        self.writer.open()
+        try:
+            while True:
+                self._wake.wait(self.flush_interval)
+                stopping = self._stop
+                batch = self._drain()
+                if batch:
+                    self.writer.write(batch)
+                    self.written += len(batch)
+                    self.batches += 1
+                if stopping:
+                    break
+        finally:
+            self.writer.close()
+
+    def summary(self) -> str:
+        return f'{self.emitted} events, {self.written} written in {self.batches} batches, {self.dropped} dropped'
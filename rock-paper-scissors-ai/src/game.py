@@ -2,20 +2,22 @@
 from collections import deque
 from typing import Deque, Optional
 
-from .ai import smart_choice
+from .ai import NGramPredictor, smart_choice
 
 
 def get_computer_choice(
     history: Optional[Deque[str]] = None,
     difficulty: str = "medium",
+    predictor: Optional[NGramPredictor] = None,
 ) -> str:
     """Return the computer's move based on the selected *difficulty*.
 
-    The function remains backward-compatible: when *history* is ``None`` it
-    falls back to a random choice (equivalent to *easy*).
+    The function remains backward-compatible: when neither *history* nor
+    *predictor* is given it falls back to a random choice (equivalent to
+    *easy*).
     """
 
-    return smart_choice(history, difficulty)
+    return smart_choice(history, difficulty, predictor)
 
 def get_winner(player_choice, computer_choice):
     """
@@ -0,0 +1,169 @@
+"""Landmark-feature gesture classifier.
+
+:func:`hand_features` turns ``(hands, 21, 3)`` landmark arrays into a
+``(hands, N_FEATURES)`` matrix of quantities that do not change when a hand
+is rotated in the image plane, moved, scaled or mirrored (left vs right
+hand): how far each finger tip reaches relative to the palm, how much every
+joint is bent, and how far apart neighbouring finger tips are. A
+:class:`GestureClassifier` assigns each row to the nearest class centroid,
+or to ``unknown`` when no centroid is close.
+
+Unlike the tip-above-joint rules of :func:`src.hand_gesture.get_hand_gesture`
+this keeps working when the hand is tilted. Everything is batched, so every
+hand of a frame (or a whole dataset) is classified in one call. The
+centroids ship as ``assets/gesture_model.npy``; ``python -m src.dataset_eval
+DATASET --train`` refits them on labelled recordings (``python -m
+src.gesture_bench --train`` fits the synthetic-hand bootstrap model).
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from .ai import MOVES
+
+WRIST = 0
+# (mcp, pip, dip, tip) of the thumb (cmc, mcp, ip, tip) and of each finger
+FINGERS = np.array(
+    [
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+        [9, 10, 11, 12],
+        [13, 14, 15, 16],
+        [17, 18, 19, 20],
+    ]
+)
+PALM = (WRIST, 9)  # wrist → middle finger MCP sets the scale
+N_FEATURES = 19  # 5 reaches + 10 joint bends + 4 tip gaps
+
+LABELS = MOVES
+UNKNOWN = 'unknown'
+REJECT_DISTANCE = 2.5  # RMS distance, in standard deviations of the class
+
+
+def _default_model_path() -> str:
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), os.pardir, 'assets', 'gesture_model.npy')
+    )
+
+
+def hand_features(landmarks: np.ndarray, aspect: float = 1.0) -> np.ndarray:
+    """Rotation-, scale- and mirror-invariant features of every hand.
+
+    Args:
+        landmarks: ``(hands, 21, 3)`` or ``(21, 3)`` landmarks; only ``x``
+            and ``y`` are used.
+        aspect: Frame width / height when the landmarks are normalized, so
+            that distances and angles are measured in square pixels.
+
+    Returns:
+        ``(hands, N_FEATURES)`` float32 features.
+    """
+    pts = np.asarray(landmarks, dtype=np.float32)
+    if pts.ndim == 2:
+        pts = pts[None]
+    xy = pts[:, :, :2] * np.array([aspect, 1.0], dtype=np.float32)
+    palm = np.linalg.norm(xy[:, PALM[1]] - xy[:, PALM[0]], axis=1)
+    palm = np.maximum(palm, 1e-6)[:, None]
+
+    chain = xy[:, FINGERS]  # (hands, 5, 4, 2)
+    # How far each tip reaches from the wrist, in palm lengths
+    reach = np.linalg.norm(chain[:, :, 3] - xy[:, None, WRIST], axis=2) / palm
+
+    # Bend at the two middle joints of each finger: cosine between bones
+    bones = np.diff(chain, axis=2)  # (hands, 5, 3, 2)
+    bones /= np.maximum(np.linalg.norm(bones, axis=3, keepdims=True), 1e-6)
+    bend = (bones[:, :, 1:] * bones[:, :, :-1]).sum(axis=3).reshape(len(xy), -1)
+
+    # Gaps between neighbouring tips (open scissors vs closed fist)
+    tips = chain[:, :, 3]
+    gaps = np.linalg.norm(np.diff(tips, axis=1), axis=2) / palm
+
+    return np.concatenate([reach, bend, gaps], axis=1).astype(np.float32)
+
+
+class GestureClassifier:
+    """Nearest-centroid classifier over :func:`hand_features`.
+
+    Every class has its own centroid and per-feature spread; the distance to
+    a class is the RMS of the feature differences in units of that class's
+    spread, so a feature a gesture pins down (say, the curled ring finger of
+    scissors) weighs more than one it leaves loose.
+
+    Args:
+        centroids: ``(len(LABELS), N_FEATURES)`` class means.
+        scales: ``(len(LABELS), N_FEATURES)`` class standard deviations.
+        reject: Hands farther than this from every centroid are ``unknown``.
+    """
+
+    def __init__(self, centroids: np.ndarray, scales: np.ndarray, reject: float = REJECT_DISTANCE) -> None:
+        self.centroids = centroids.astype(np.float32)
+        self.inv_scales = (1.0 / np.maximum(scales, 1e-6)).astype(np.float32)
+        self.reject = reject
+
+    @classmethod
+    def fit(cls, features: np.ndarray, labels: np.ndarray, reject: float = REJECT_DISTANCE) -> 'GestureClassifier':
+        """Fit on ``(n, N_FEATURES)`` *features* with label indices into ``LABELS``."""
+        classes = [features[labels == k] for k in range(len(LABELS))]
+        return cls(np.stack([f.mean(axis=0) for f in classes]), np.stack([f.std(axis=0) for f in classes]), reject)
+
+    @classmethod
+    def load(cls, path: str | None = None, reject: float | None = None) -> 'GestureClassifier':
+        """Load weights saved by :meth:`save`.
+
+        The file holds the centroid rows, then the scale rows, then optionally
+        a row filled with the reject distance, which is used unless *reject*
+        is given (``REJECT_DISTANCE`` when the file has none).
+        """
+        weights = np.load(_default_model_path() if path is None else path)
+        n = len(LABELS)
+        if reject is None:
+            reject = float(weights[2 * n, 0]) if len(weights) > 2 * n else REJECT_DISTANCE
+        return cls(weights[:n], weights[n : 2 * n], reject)
+
+    def save(self, path: str | None = None) -> None:
+        weights = np.vstack([self.centroids, 1.0 / self.inv_scales, np.full((1, self.centroids.shape[1]), self.reject)])
+        np.save(_default_model_path() if path is None else path, weights.astype(np.float32))
+
+    def calibrate(self, features: np.ndarray, labels: np.ndarray) -> float:
+        """Pick the reject distance that best separates gestures from other poses.
+
+        *labels* are indices into ``LABELS``, ``-1`` for hands that show no
+        gesture. The distance maximizes the mean of the gesture accuracy and
+        the share of other poses rejected; without both kinds of hands it is
+        left unchanged.
+
+        Returns:
+            The new ``reject`` distance.
+        """
+        other = labels < 0
+        if not other.any() or other.all():
+            return self.reject
+        dist = self.distances(features)
+        best = dist.argmin(axis=1)
+        nearest = dist[np.arange(len(dist)), best]
+        right = np.sort(nearest[~other & (best == labels)])
+        wrong = np.sort(nearest[other])
+        candidates = np.unique(nearest)
+        accuracy = np.searchsorted(right, candidates, side='right') / (~other).sum()
+        rejected = 1.0 - np.searchsorted(wrong, candidates, side='right') / other.sum()
+        self.reject = float(candidates[np.argmax(accuracy + rejected)])
+        return self.reject
+
+    def distances(self, features: np.ndarray) -> np.ndarray:
+        """``(hands, len(LABELS))`` scaled RMS distance of every hand to every class."""
+        z = (features[:, None, :] - self.centroids[None]) * self.inv_scales[None]
+        return np.sqrt((z * z).mean(axis=2))
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """Label index of every row of *features*, ``-1`` for unknown."""
+        dist = self.distances(features)
+        best = dist.argmin(axis=1)
+        return np.where(dist[np.arange(len(dist)), best] <= self.reject, best, -1)
+
+    def classify(self, landmarks: np.ndarray, aspect: float = 1.0) -> list[str]:
+        """Gesture name (``LABELS`` or ``unknown``) of every hand in *landmarks*."""
+        if not len(landmarks):
+            return []
+        return [LABELS[k] if k >= 0 else UNKNOWN for k in self.predict(hand_features(landmarks, aspect)).tolist()]
@@ -0,0 +1,204 @@
+"""Synthetic-hand sanity check, throughput benchmark and bootstrap trainer.
+
+Run from the project root::
+
+    python -m src.gesture_bench            # sanity and throughput report
+    python -m src.gesture_bench --train    # refit assets/gesture_model.npy
+
+:func:`synthesize_hands` poses a simple articulated hand (bone lengths from
+average adult proportions, fingers flexing towards the camera, thumb folding
+across the palm) as rock, paper or scissors, or as a gesture that is none of
+them, then tilts it in the image plane, mirrors it half of the time (left
+hands), scales, moves and jitters it and returns MediaPipe-style landmarks
+normalized to a 16:9 frame. Both the rule-based
+:func:`src.hand_gesture.get_hand_gesture` and the :class:`GestureClassifier`
+are scored on the same hands, upright and tilted.
+
+The bootstrap model is fitted on hands from this same generator, so its
+scores here only show that features and classifier work, not how they
+compare with the rules on real players: that comparison is
+``python -m src.dataset_eval DATASET --train`` on labelled recordings.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from .gesture import LABELS, UNKNOWN, GestureClassifier, hand_features
+from .hand_gesture import get_hand_gesture
+
+ASPECT = 16 / 9
+
+# Palm-relative MCP positions (x right, y up) and bone lengths of the
+# index..pinky fingers, and the thumb's CMC position and bones.
+_MCP = np.array([[-0.30, 0.92], [0.0, 0.96], [0.24, 0.90], [0.44, 0.80]])
+_SPLAY = np.radians([-8.0, 0.0, 8.0, 16.0])
+_BONES = np.array([[0.45, 0.27, 0.22], [0.50, 0.30, 0.23], [0.47, 0.28, 0.22], [0.37, 0.20, 0.18]])
+_THUMB_CMC = np.array([-0.22, 0.30])
+_THUMB_BONES = np.array([0.38, 0.32, 0.27])
+
+# Degrees of flexion (mcp, pip, dip) of a straight and of a curled finger
+_STRAIGHT = ((0.0, 12.0), (0.0, 10.0), (0.0, 8.0))
+_CURLED = ((70.0, 95.0), (85.0, 105.0), (30.0, 60.0))
+
+# Which fingers (index..pinky) are straight, and whether the thumb is out
+POSES = {
+    'rock': ((False, False, False, False), False),
+    'paper': ((True, True, True, True), True),
+    'scissors': ((True, True, False, False), False),
+}
+OTHER_POSES = [
+    ((True, False, False, False), False),  # pointing
+    ((True, True, True, False), False),  # three
+    ((False, False, False, False), True),  # thumbs out
+    ((True, False, False, True), False),  # horns
+]
+
+
+def _pose(rng: np.random.Generator, fingers: tuple[bool, ...], thumb_out: bool) -> np.ndarray:
+    """``(21, 3)`` landmarks of one upright right hand, palm length 1, y up."""
+    pts = np.zeros((21, 3))
+    for f, straight in enumerate(fingers):
+        base = 5 + 4 * f
+        pts[base, :2] = _MCP[f] + rng.normal(0, 0.02, 2)
+        direction = _SPLAY[f] + rng.normal(0, np.radians(4))
+        if straight and f < 2 and fingers[1 - f]:
+            direction += np.radians(10.0) * (1 if f else -1)  # open the V
+        up = np.array([np.sin(direction), np.cos(direction)])
+        flex = 0.0
+        for j, length in enumerate(_BONES[f] * rng.uniform(0.93, 1.07)):
+            lo, hi = (_STRAIGHT if straight else _CURLED)[j]
+            flex += np.radians(rng.uniform(lo, hi))
+            # Flexion tilts the bone towards the camera: it shortens in the
+            # image and folds back towards the wrist past 90 degrees
+            pts[base + j + 1, :2] = pts[base + j, :2] + up * length * np.cos(flex)
+            pts[base + j + 1, 2] = pts[base + j, 2] - length * np.sin(flex)
+
+    pts[1, :2] = _THUMB_CMC
+    angle = np.radians(-55.0 if thumb_out else -35.0) + rng.normal(0, np.radians(5))
+    for j, length in enumerate(_THUMB_BONES):
+        # An extended thumb points away from the palm; a folded one crosses it
+        turn = rng.uniform(-5.0, 10.0) if thumb_out else rng.uniform(45.0, 70.0)
+        angle += np.radians(turn) if j else 0.0
+        pts[2 + j, :2] = pts[1 + j, :2] + length * np.array([np.sin(angle), np.cos(angle)])
+    return pts
+
+
+def synthesize_hands(
+    n: int,
+    rng: np.random.Generator,
+    max_tilt: float = 0.0,
+    other_fraction: float = 0.0,
+    left_fraction: float = 0.5,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Random hands as normalized landmarks and their label indices.
+
+    Args:
+        n: Number of hands.
+        rng: Random generator.
+        max_tilt: Hands are rotated by up to this many degrees either way.
+        other_fraction: Share of hands in a pose that is no gesture
+            (label ``-1``).
+        left_fraction: Share of left (mirrored) hands.
+
+    Returns:
+        ``(n, 21, 3)`` landmarks normalized to a 16:9 frame and ``(n,)``
+        labels (indices into ``LABELS``, ``-1`` for other poses).
+    """
+    labels = rng.integers(0, len(LABELS), n)
+    labels[rng.random(n) < other_fraction] = -1
+    hands = np.empty((n, 21, 3))
+    for i, label in enumerate(labels.tolist()):
+        if label < 0:
+            fingers, thumb_out = OTHER_POSES[rng.integers(len(OTHER_POSES))]
+        else:
+            fingers, thumb_out = POSES[LABELS[label]]
+        hands[i] = _pose(rng, fingers, thumb_out)
+
+    tilt = np.radians(rng.uniform(-max_tilt, max_tilt, n))
+    c, s = np.cos(tilt), np.sin(tilt)
+    rot = np.stack([np.stack([c, -s], axis=1), np.stack([s, c], axis=1)], axis=1)  # (n, 2, 2)
+    xy = np.einsum('nij,nkj->nki', rot, hands[:, :, :2])
+    mirror = rng.random(n) < left_fraction
+    xy[mirror, :, 0] *= -1.0
+    xy[:, :, 1] *= -1.0  # image y points down
+    xy += rng.normal(0, 0.025, xy.shape)  # landmark jitter, in palm lengths
+
+    scale = rng.uniform(0.12, 0.3, n)[:, None, None]  # palm length / frame height
+    center = np.stack([rng.uniform(0.3, 0.7, n) * ASPECT, rng.uniform(0.4, 0.7, n)], axis=1)[:, None]
+    xy = xy * scale + center
+    hands[:, :, :2] = xy / np.array([ASPECT, 1.0])
+    hands[:, :, 2] *= scale[:, :, 0]
+    return hands.astype(np.float32), labels
+
+
+def train(n: int = 30000, seed: int = 0) -> GestureClassifier:
+    """Fit the bootstrap classifier on tilted synthetic hands of the three gestures."""
+    hands, labels = synthesize_hands(n, np.random.default_rng(seed), max_tilt=90.0)
+    return GestureClassifier.fit(hand_features(hands, ASPECT), labels)
+
+
+def _score(predicted: np.ndarray, labels: np.ndarray) -> tuple[float, float]:
+    """Accuracy on real gestures, and share of other poses rejected."""
+    gestures = labels >= 0
+    accuracy = float((predicted[gestures] == labels[gestures]).mean())
+    rejected = float((predicted[~gestures] == -1).mean()) if (~gestures).any() else float('nan')
+    return accuracy, rejected
+
+
+def benchmark(classifier: GestureClassifier, n: int = 20000, seed: int = 1) -> None:
+    index = {name: k for k, name in enumerate(LABELS)}
+    index[UNKNOWN] = -1
+    print('Synthetic hands (the classifier was fitted on this generator; see src.dataset_eval for real accuracy)')
+    print(f"{'hands':<22} {'rules':>16} {'classifier':>16}")
+    cases = (
+        ('right, upright (±10°)', 10.0, 0.0),
+        ('upright (±10°)', 10.0, 0.5),
+        ('tilted (±45°)', 45.0, 0.5),
+        ('any angle (±90°)', 90.0, 0.5),
+    )
+    for title, tilt, left in cases:
+        rng = np.random.default_rng(seed)
+        hands, labels = synthesize_hands(n, rng, max_tilt=tilt, other_fraction=0.2, left_fraction=left)
+        rules = np.array([index[get_hand_gesture(hand)] for hand in hands])
+        model = classifier.predict(hand_features(hands, ASPECT))
+        (r_acc, r_rej), (m_acc, m_rej) = _score(rules, labels), _score(model, labels)
+        print(f'{title:<22} {r_acc:>7.1%} acc {r_rej:>4.0%} rej {m_acc:>7.1%} acc {m_rej:>4.0%} rej')
+
+    hands, _ = synthesize_hands(n, np.random.default_rng(seed), max_tilt=45.0)
+    start = time.perf_counter()
+    for hand in hands:
+        get_hand_gesture(hand)
+    rules_rate = n / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for hand in hands:
+        classifier.classify(hand[None], ASPECT)
+    single_rate = n / (time.perf_counter() - start)
+    start = time.perf_counter()
+    classifier.classify(hands, ASPECT)
+    batch_rate = n / (time.perf_counter() - start)
+    print(
+        f'Throughput: rules {rules_rate:,.0f} hands/s, classifier {single_rate:,.0f} hands/s '
+        f'one at a time, {batch_rate:,.0f} hands/s batched'
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Sanity-check and time the gesture classifiers on synthetic hands')
+    parser.add_argument('--train', action='store_true', help='Refit and save assets/gesture_model.npy first')
+    parser.add_argument('--hands', type=int, default=20000, help='Hands per benchmark (default: 20000)')
+    args = parser.parse_args(argv)
+
+    if args.train:
+        classifier = train()
+        classifier.save()
+        print('Saved assets/gesture_model.npy')
+    else:
+        classifier = GestureClassifier.load()
+    benchmark(classifier, args.hands)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,10 @@ Phase 1 implements a very simple layout:
     └─────────────────────────────┘
 
 Later phases will replace the HUD with prettier components and animations.
+
+A :class:`Compositor` keeps one canvas alive across frames: only the webcam
+region is rewritten every frame, and each HUD region (the two icons, the
+text) is redrawn when the part of the ``UIState`` it shows changes.
 """
 from __future__ import annotations
 
@@ -18,10 +22,17 @@ from typing import Dict
 import cv2
 import numpy as np
 
+from .assets import IMAGE_SIZE
 
 _CANVAS_W = 1280
 _CANVAS_H = 720
 _WEBCAM_S = 720  # square side for webcam region
+_HUD_X = _WEBCAM_S + 20  # left edge of the HUD contents
+_ICON_W, _ICON_H = IMAGE_SIZE
+# UIState attribute -> top of its icon slot
+_ICON_SLOTS = {"player_choice": 50, "computer_choice": 200}
+_TEXT_TOP = 300  # the score and difficulty text lives below this row
+CANVAS_SIZE = (_CANVAS_W, _CANVAS_H)
 
 
 class UIState:
@@ -49,6 +60,10 @@ class UIState:
         self.difficulty = difficulty
         self.images = images
 
+    def text(self) -> tuple:
+        """Everything the HUD's text shows; equal values draw identical text."""
+        return (self.scores["player"], self.scores["computer"], self.difficulty)
+
 
 # ----------------------------------------------------------------------------
 # Background helpers
@@ -80,27 +95,70 @@ _BACKGROUND: np.ndarray = _load_background()
 # ----------------------------------------------------------------------------
 
 
-def compose_frame(webcam_frame: np.ndarray, state: UIState) -> np.ndarray:
-    """Return a 1280×720 frame composed of webcam + HUD."""
-    # Ensure webcam frame is square and the expected size
+def _square_crop(webcam_frame: np.ndarray) -> np.ndarray:
+    """Centred square view of *webcam_frame* (no copy)."""
     h, w = webcam_frame.shape[:2]
-    # Crop to square centred region
-    if w != h:
-        side = min(h, w)
-        y0 = (h - side) // 2
-        x0 = (w - side) // 2
-        webcam_frame = webcam_frame[y0 : y0 + side, x0 : x0 + side]
-    webcam_frame = cv2.resize(webcam_frame, (_WEBCAM_S, _WEBCAM_S))
+    if w == h:
+        return webcam_frame
+    side = min(h, w)
+    y0 = (h - side) // 2
+    x0 = (w - side) // 2
+    return webcam_frame[y0 : y0 + side, x0 : x0 + side]
+
+
+class Compositor:
+    """Persistent 1280×720 canvas of webcam + HUD.
+
+    :meth:`compose` resizes the webcam straight into its region of the
+    canvas. An icon slot is only re-blitted when the icon it shows changes,
+    and the text only when :meth:`UIState.text` does; a redrawn region is
+    first restored from the background. The returned canvas is reused by the
+    next call, so copy it to keep it.
+    """
 
-    # Copy background to avoid mutating global
-    canvas = _BACKGROUND.copy()
-    # Place webcam at (0,0)
-    canvas[0:_WEBCAM_S, 0:_WEBCAM_S] = webcam_frame
+    def __init__(self) -> None:
+        self.canvas = _BACKGROUND.copy()
+        self._webcam = self.canvas[0:_WEBCAM_S, 0:_WEBCAM_S]
+        self._shown: dict[str, object] = {}  # HUD region -> what it shows
+        self.icon_blits = 0
+        self.text_redraws = 0
+
+    def invalidate(self) -> None:
+        """Force a HUD redraw on the next frame."""
+        self._shown.clear()
+
+    def compose(self, webcam_frame: np.ndarray, state: UIState) -> np.ndarray:
+        """Return the canvas with *webcam_frame* and *state* drawn on it."""
+        cv2.resize(_square_crop(webcam_frame), (_WEBCAM_S, _WEBCAM_S), dst=self._webcam)
+
+        for slot, top in _ICON_SLOTS.items():
+            icon = state.images.get(getattr(state, slot))
+            if slot in self._shown and self._shown[slot] is icon:
+                continue
+            region = (slice(top, top + _ICON_H), slice(_HUD_X, _HUD_X + _ICON_W))
+            self.canvas[region] = _BACKGROUND[region]
+            if icon is not None:
+                _blend_icon(self.canvas[region], icon)
+                self.icon_blits += 1
+            self._shown[slot] = icon
+
+        text = state.text()
+        if self._shown.get("text") != text:
+            self.canvas[_TEXT_TOP:, _WEBCAM_S:] = _BACKGROUND[_TEXT_TOP:, _WEBCAM_S:]
+            _draw_text(self.canvas, state)
+            self._shown["text"] = text
+            self.text_redraws += 1
+        return self.canvas
+
+    @property
+    def webcam_region(self) -> np.ndarray:
+        """View of the canvas the webcam is drawn to (rewritten every frame)."""
+        return self._webcam
 
-    # Draw HUD on the right panel
-    _draw_hud(canvas, state)
 
-    return canvas
+def compose_frame(webcam_frame: np.ndarray, state: UIState) -> np.ndarray:
+    """Return a new 1280×720 frame composed of webcam + HUD."""
+    return Compositor().compose(webcam_frame, state)
 
 
 # ----------------------------------------------------------------------------
@@ -108,18 +166,19 @@ def compose_frame(webcam_frame: np.ndarray, state: UIState) -> np.ndarray:
 # ----------------------------------------------------------------------------
 
 
-def _draw_hud(frame: np.ndarray, state: UIState) -> None:
-    """Draw scores, difficulty, and icons on *frame* (in-place)."""
-    # Region start x coordinate for HUD
-    x0 = _WEBCAM_S + 20
+def _blend_icon(region: np.ndarray, icon: np.ndarray) -> None:
+    """Alpha-blend a premultiplied BGRA *icon* over *region* (in-place)."""
+    if icon.shape[2] == 3:
+        region[:] = icon
+        return
+    # out = icon + region * (1 - alpha), in one pass over 16-bit integers
+    inverse = 255 - icon[:, :, 3:].astype(np.uint16)
+    region[:] = icon[:, :, :3] + region * inverse // 255
+
 
-    # Icons (100×100) positions
-    if state.player_choice in state.images:
-        icon = state.images[state.player_choice]
-        frame[50 : 150, x0 : x0 + 100] = icon[:, :, :3]
-    if state.computer_choice in state.images:
-        icon = state.images[state.computer_choice]
-        frame[200 : 300, x0 : x0 + 100] = icon[:, :, :3]
+def _draw_text(frame: np.ndarray, state: UIState) -> None:
+    """Draw scores and difficulty on *frame* (in-place)."""
+    x0 = _HUD_X
 
     # Scores
     cv2.putText(
@@ -170,7 +229,7 @@ def display_ui(
     images: Dict[str, np.ndarray],
     *,
     difficulty: str = "normal",
-) -> None:  # noqa: D401 – simple wrapper
+) -> np.ndarray:  # noqa: D401 – simple wrapper
     """Deprecated wrapper kept for existing import paths.
 
     The implementation now lives in ``src.ui``. This function simply forwards
@@ -180,7 +239,7 @@ def display_ui(
 
     from .ui import display_ui as _display_ui  # local import to avoid cycles
 
-    _display_ui(
+    return _display_ui(
         frame,
         player_choice,
         computer_choice,
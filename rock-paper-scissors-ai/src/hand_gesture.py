@@ -1,47 +1,56 @@
+import numpy as np
+
+# Landmark ids of the four finger tips (index → pinky) and their PIP joints.
+_FINGER_TIPS = [8, 12, 16, 20]
+_FINGER_PIPS = [6, 10, 14, 18]
+_THUMB_TIP = 4
+_THUMB_IP = 3
+
+
+def as_landmark_array(hand_landmarks) -> np.ndarray:
+    """Return *hand_landmarks* as a ``(21, 2+)`` array.
+
+    Accepts either an array (as produced by ``src.tracker``) or a MediaPipe
+    ``NormalizedLandmarkList`` for backwards compatibility.
+    """
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks
+    return np.array(
+        [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32
+    )
+
+
 def get_hand_gesture(hand_landmarks):
     """
     Determine the hand gesture (rock, paper, or scissors) from hand landmarks.
 
     Args:
-        hand_landmarks: A list of hand landmarks detected by MediaPipe.
+        hand_landmarks: A ``(21, 3)`` landmark array for one hand (normalized
+            or pixel coordinates), or a MediaPipe landmark list.
 
     Returns:
         The detected gesture as a string ('rock', 'paper', 'scissors', or 'unknown').
     """
-    # Get the coordinates of the fingertips and the base of the fingers
-    thumb_tip = hand_landmarks.landmark[4]
-    index_tip = hand_landmarks.landmark[8]
-    middle_tip = hand_landmarks.landmark[12]
-    ring_tip = hand_landmarks.landmark[16]
-    pinky_tip = hand_landmarks.landmark[20]
-
-    thumb_ip = hand_landmarks.landmark[3]
-    index_pip = hand_landmarks.landmark[6]
-    middle_pip = hand_landmarks.landmark[10]
-    ring_pip = hand_landmarks.landmark[14]
-    pinky_pip = hand_landmarks.landmark[18]
+    pts = as_landmark_array(hand_landmarks)
+
+    # Compare every fingertip with its PIP joint in one shot
+    tip_y = pts[_FINGER_TIPS, 1]
+    pip_y = pts[_FINGER_PIPS, 1]
+    extended = tip_y < pip_y
+    curled = tip_y > pip_y
+    thumb_tip_x = pts[_THUMB_TIP, 0]
+    thumb_ip_x = pts[_THUMB_IP, 0]
 
     # Check for paper (all fingers extended)
-    if (index_tip.y < index_pip.y and
-            middle_tip.y < middle_pip.y and
-            ring_tip.y < ring_pip.y and
-            pinky_tip.y < pinky_pip.y and
-            thumb_tip.x < thumb_ip.x):
+    if extended.all() and thumb_tip_x < thumb_ip_x:
         return 'paper'
 
     # Check for scissors (index and middle fingers extended)
-    if (index_tip.y < index_pip.y and
-            middle_tip.y < middle_pip.y and
-            ring_tip.y > ring_pip.y and
-            pinky_tip.y > pinky_pip.y):
+    if extended[0] and extended[1] and curled[2] and curled[3]:
         return 'scissors'
 
     # Check for rock (all fingers curled)
-    if (index_tip.y > index_pip.y and
-            middle_tip.y > middle_pip.y and
-            ring_tip.y > ring_pip.y and
-            pinky_tip.y > pinky_pip.y and
-            thumb_tip.x > thumb_ip.x):
+    if curled.all() and thumb_tip_x > thumb_ip_x:
         return 'rock'
 
     return 'unknown'
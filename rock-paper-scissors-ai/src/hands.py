@@ -0,0 +1,88 @@
+"""Hand landmarks as NumPy arrays, and drawing them.
+
+Nothing here needs MediaPipe: :mod:`src.tracker` produces
+:class:`HandResult` objects, but an injected tracker (or a recording) can too,
+so the engine runs without MediaPipe installed.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# Same skeleton as ``mediapipe.solutions.hands.HAND_CONNECTIONS``
+_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),  # thumb
+        (0, 5), (5, 6), (6, 7), (7, 8),  # index
+        (5, 9), (9, 10), (10, 11), (11, 12),  # middle
+        (9, 13), (13, 14), (14, 15), (15, 16),  # ring
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # pinky
+    ],
+    dtype=np.intp,
+)
+
+
+@dataclass
+class HandResult:
+    """Detected hands as arrays.
+
+    Attributes:
+        landmarks: ``(hands, 21, 3)`` float32 ``(x, y, z)``, normalized to
+            ``[0, 1]`` unless ``pixel_space`` is set.
+        handedness: ``(hands,)`` int8, ``0`` = left hand, ``1`` = right hand.
+        scores: ``(hands,)`` float32 handedness confidence.
+        pixel_space: Whether ``landmarks`` are expressed in pixels.
+    """
+
+    landmarks: np.ndarray
+    handedness: np.ndarray
+    scores: np.ndarray
+    pixel_space: bool = False
+
+    @classmethod
+    def empty(cls) -> 'HandResult':
+        return cls(
+            np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32),
+            np.empty(0, dtype=np.int8),
+            np.empty(0, dtype=np.float32),
+        )
+
+    def __len__(self) -> int:
+        return self.landmarks.shape[0]
+
+    def bounds(self) -> tuple[float, float, float, float] | None:
+        """Return the ``(x0, y0, x1, y1)`` box around all hands, or ``None``."""
+        if not len(self):
+            return None
+        xy = self.landmarks[:, :, :2].reshape(-1, 2)
+        x0, y0 = xy.min(axis=0)
+        x1, y1 = xy.max(axis=0)
+        return float(x0), float(y0), float(x1), float(y1)
+
+    def to_pixels(self, frame_width: int, frame_height: int) -> 'HandResult':
+        """Return a copy scaled to pixel coordinates (z scales with width)."""
+        if self.pixel_space:
+            return self
+        scale = np.array([frame_width, frame_height, frame_width], dtype=np.float32)
+        return HandResult(self.landmarks * scale, self.handedness, self.scores, True)
+
+
+def draw_hands(
+    image: np.ndarray,
+    hands: HandResult,
+    color: tuple[int, int, int] = (255, 255, 255),
+    landmark_color: tuple[int, int, int] = (0, 0, 255),
+) -> None:
+    """Draw hand skeletons on *image* (in-place)."""
+    if not len(hands):
+        return
+    h, w = image.shape[:2]
+    pts = hands.to_pixels(w, h).landmarks[:, :, :2].astype(np.int32)
+    for hand_pts in pts:
+        cv2.polylines(image, list(hand_pts[_CONNECTIONS]), False, color, 2)
+        for x, y in hand_pts:
+            cv2.circle(image, (int(x), int(y)), 3, landmark_color, -1)
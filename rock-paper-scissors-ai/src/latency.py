@@ -0,0 +1,76 @@
+"""Rolling motion-to-photon latency statistics of the game loop."""
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+
+import numpy as np
+
+# span name -> (start event, end event)
+PIPELINE_SPANS: dict[str, tuple[str, str]] = {
+    'capture→detection': ('capture', 'detection'),
+    'detection→decision': ('detection', 'decision'),
+    'capture→present': ('capture', 'present'),
+}
+
+
+class LatencyTracker:
+    """Percentiles of the time between pipeline events over recent frames.
+
+    Every frame is stamped with :func:`time.monotonic` at a few events
+    (``capture`` right after the camera read, then ``detection``,
+    ``decision`` once the gesture has been classified and ``present`` after
+    ``cv2.waitKey``). Ending a frame pushes each span into a ring buffer of
+    the last ``window`` frames.
+
+    Args:
+        window: Number of frames the percentiles are computed over.
+        spans: Span name to ``(start event, end event)``.
+    """
+
+    def __init__(self, window: int = 300, spans: dict[str, tuple[str, str]] | None = None) -> None:
+        self.spans = dict(PIPELINE_SPANS if spans is None else spans)
+        self.window = window
+        self._samples = np.full((len(self.spans), window), np.nan)
+        self._cursor = 0
+        self.frames = 0
+        self._stamps: dict[str, float] = {}
+
+    def begin(self, capture_time: float | None = None) -> None:
+        """Start a frame captured at *capture_time* (default: now)."""
+        self._stamps.clear()
+        self._stamps['capture'] = time.monotonic() if capture_time is None else capture_time
+
+    def stamp(self, event: str, t: float | None = None) -> None:
+        self._stamps[event] = time.monotonic() if t is None else t
+
+    def end(self) -> None:
+        """Record the spans of the current frame; missing events are skipped."""
+        if not self._stamps:
+            return
+        col = self._cursor
+        for row, (start, end) in enumerate(self.spans.values()):
+            t0, t1 = self._stamps.get(start), self._stamps.get(end)
+            self._samples[row, col] = t1 - t0 if t0 is not None and t1 is not None else np.nan
+        self._cursor = (col + 1) % self.window
+        self.frames += 1
+        self._stamps.clear()
+
+    def percentiles(self, q: Sequence[float] = (50, 95, 99)) -> dict[str, dict[str, float]]:
+        """Return span name -> ``{'p50': ms, ...}`` over the rolling window."""
+        result: dict[str, dict[str, float]] = {}
+        for name, row in zip(self.spans, self._samples):
+            values = row[~np.isnan(row)]
+            if values.size:
+                ms = np.percentile(values, q) * 1000.0
+                result[name] = {f'p{p:g}': float(v) for p, v in zip(q, ms)}
+        return result
+
+    def summary(self) -> str:
+        parts = [
+            f'{name} ' + '/'.join(f'{v:.1f}' for v in stats.values())
+            for name, stats in self.percentiles().items()
+        ]
+        if not parts:
+            return 'no frames measured'
+        return 'p50/p95/p99 ms: ' + ', '.join(parts)
@@ -0,0 +1,99 @@
+"""Frame-difference gate that lets the tracker skip inference on static scenes."""
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Decide whether the previous hand detection can be reused.
+
+    Each frame is reduced to a small grayscale thumbnail and compared with the
+    thumbnail of the last frame that ran inference. Inference is skipped while
+    the share of changed pixels stays below ``scene_threshold`` for the whole
+    scene and below ``region_threshold`` around the last detected hand, for at
+    most ``max_skipped`` frames in a row.
+
+    Args:
+        width: Thumbnail width in pixels.
+        pixel_threshold: Grey-level difference above which a pixel has changed.
+        scene_threshold: Allowed fraction of changed pixels in the scene.
+        region_threshold: Allowed fraction of changed pixels near the hand.
+        region_padding: Padding around the hand box, in normalized units.
+        max_skipped: Consecutive skips after which inference is forced.
+    """
+
+    def __init__(
+        self,
+        width: int = 64,
+        pixel_threshold: int = 12,
+        scene_threshold: float = 0.01,
+        region_threshold: float = 0.02,
+        region_padding: float = 0.1,
+        max_skipped: int = 15,
+    ) -> None:
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.scene_threshold = scene_threshold
+        self.region_threshold = region_threshold
+        self.region_padding = region_padding
+        self.max_skipped = max_skipped
+
+        self._reference: np.ndarray | None = None
+        self._consecutive = 0
+        self.checks = 0
+        self.skipped = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        return self.skipped / self.checks if self.checks else 0.0
+
+    def summary(self) -> str:
+        return f'skipped {self.skipped}/{self.checks} inferences ({self.skip_ratio:.0%})'
+
+    def reset(self) -> None:
+        """Force inference on the next frame."""
+        self._reference = None
+        self._consecutive = 0
+
+    def should_skip(self, frame_bgr: np.ndarray, hand_bbox=None) -> bool:
+        """Return ``True`` when nothing moved since the last inference.
+
+        Args:
+            frame_bgr: Current camera frame.
+            hand_bbox: Normalized ``(x0, y0, x1, y1)`` box around the last
+                detected hand, or ``None`` if no hand was visible.
+        """
+        self.checks += 1
+        h, w = frame_bgr.shape[:2]
+        size = (self.width, max(1, round(h * self.width / w)))
+        small = cv2.cvtColor(
+            cv2.resize(frame_bgr, size, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY,
+        )
+
+        if self._consecutive < self.max_skipped and self._is_static(small, hand_bbox):
+            self._consecutive += 1
+            self.skipped += 1
+            return True
+
+        self._reference = small
+        self._consecutive = 0
+        return False
+
+    def _is_static(self, small: np.ndarray, hand_bbox) -> bool:
+        if self._reference is None or self._reference.shape != small.shape:
+            return False
+        changed = cv2.absdiff(small, self._reference) > self.pixel_threshold
+        if changed.mean() > self.scene_threshold:
+            return False
+        if hand_bbox is None:
+            return True
+
+        h, w = small.shape
+        pad = self.region_padding
+        x0 = int(np.clip((hand_bbox[0] - pad) * w, 0, w - 1))
+        y0 = int(np.clip((hand_bbox[1] - pad) * h, 0, h - 1))
+        x1 = int(np.clip((hand_bbox[2] + pad) * w, x0 + 1, w))
+        y1 = int(np.clip((hand_bbox[3] + pad) * h, y0 + 1, h))
+        return changed[y0:y1, x0:x1].mean() <= self.region_threshold
@@ -0,0 +1,146 @@
+"""Target-FPS frame scheduler for the game loop."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+LATE_POLICIES = ('skip_render', 'catch_up')
+
+
+@dataclass
+class FrameTick:
+    """What the loop should do this frame.
+
+    Attributes:
+        dt: Seconds to advance per simulation step.
+        steps: Number of simulation steps to run.
+        render: Whether to draw and present this frame.
+    """
+
+    dt: float
+    steps: int = 1
+    render: bool = True
+
+
+class FrameScheduler:
+    """Pace a frame loop at ``target_fps`` on the monotonic clock.
+
+    :meth:`wait` sleeps until the next deadline (``time.sleep`` followed by a
+    short spin for precision). A frame starting one or more whole periods
+    late either skips rendering (``'skip_render'``, never twice in a row) or
+    runs extra fixed-period simulation steps (``'catch_up'``).
+
+    Args:
+        target_fps: Frame rate to hold; ``None`` or ``0`` disables pacing.
+        late_policy: ``'skip_render'`` or ``'catch_up'``.
+        max_catch_up: Maximum simulation steps per frame when catching up.
+        spin: Seconds before the deadline at which sleeping turns to spinning.
+        window: Number of frames the cadence statistics cover.
+    """
+
+    def __init__(
+        self,
+        target_fps: float | None = None,
+        late_policy: str = 'skip_render',
+        max_catch_up: int = 4,
+        spin: float = 0.002,
+        window: int = 300,
+    ) -> None:
+        if late_policy not in LATE_POLICIES:
+            raise ValueError(f'Unknown late-frame policy: {late_policy}')
+        self.late_policy = late_policy
+        self.max_catch_up = max_catch_up
+        self.spin = spin
+        self.set_target(target_fps)
+
+        self._intervals = np.full(window, np.nan)
+        self._cursor = 0
+        self.frames = 0
+        self.late_frames = 0
+        self.skipped_renders = 0
+        self.catch_up_steps = 0
+        self.sleep_time = 0.0
+        self._started = time.monotonic()
+        self.reset()
+
+    def set_target(self, target_fps: float | None) -> None:
+        self.target_fps = target_fps or None
+        self.period = 1.0 / target_fps if target_fps else 0.0
+
+    def reset(self) -> None:
+        """Forget the deadline, e.g. after the loop was blocked on purpose."""
+        self._deadline: float | None = None
+        self._last_start: float | None = None
+        self._skipped_last = False
+
+    def begin_frame(self, now: float | None = None) -> FrameTick:
+        """Start a frame and decide how to simulate and whether to render it.
+
+        *now* replaces the monotonic clock reading (e.g. in tests).
+        """
+        now = time.monotonic() if now is None else now
+        measured = self.period if self._last_start is None else now - self._last_start
+        if self._last_start is not None:
+            self._intervals[self._cursor] = measured
+            self._cursor = (self._cursor + 1) % len(self._intervals)
+        self._last_start = now
+        self.frames += 1
+
+        if not self.period:
+            return FrameTick(measured)
+        if self._deadline is None:
+            self._deadline = now
+        lateness = now - self._deadline
+        missed = int(lateness // self.period) if lateness > 0 else 0
+        self._deadline += (missed + 1) * self.period
+
+        if missed == 0:
+            tick = FrameTick(self.period)
+        elif self.late_policy == 'catch_up':
+            steps = min(missed + 1, self.max_catch_up)
+            self.late_frames += 1
+            self.catch_up_steps += steps - 1
+            tick = FrameTick(self.period, steps=steps)
+        else:
+            self.late_frames += 1
+            render = self._skipped_last
+            if not render:
+                self.skipped_renders += 1
+            tick = FrameTick((missed + 1) * self.period, render=render)
+        self._skipped_last = not tick.render
+        return tick
+
+    def wait(self) -> None:
+        """Sleep until the next frame's deadline (no-op when uncapped or late)."""
+        if self._deadline is None:
+            return
+        start = time.monotonic()
+        remaining = self._deadline - start
+        if remaining <= 0:
+            return
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.monotonic() < self._deadline:
+            pass
+        self.sleep_time += time.monotonic() - start
+
+    @property
+    def fps(self) -> float:
+        """Mean frame rate over the recent window."""
+        values = self._intervals[~np.isnan(self._intervals)]
+        return 1.0 / values.mean() if values.size else 0.0
+
+    def summary(self) -> str:
+        values = self._intervals[~np.isnan(self._intervals)] * 1000.0
+        if not values.size:
+            return 'no frames paced'
+        target = f'{self.target_fps:g} FPS target' if self.target_fps else 'uncapped'
+        idle = self.sleep_time / max(1e-9, time.monotonic() - self._started)
+        return (
+            f'{self.fps:.1f} FPS ({target}), frame time '
+            f'mean {values.mean():.1f} ± {values.std():.1f} ms, p95 {np.percentile(values, 95):.1f} ms; '
+            f'{self.late_frames} late frames, {self.skipped_renders} renders skipped, '
+            f'{self.catch_up_steps} catch-up steps, {idle:.0%} of the time asleep'
+        )
@@ -0,0 +1,146 @@
+"""Round phases and the hand-detection duty cycle they imply."""
+from __future__ import annotations
+
+import math
+import time
+from collections import Counter, deque
+
+from .gesture import UNKNOWN
+
+COUNTDOWN = 'countdown'
+CAPTURE = 'capture'
+RESULT = 'result'
+PHASES = (COUNTDOWN, CAPTURE, RESULT)
+
+
+class RoundPhases:
+    """State machine of one round: countdown → capture → result → countdown.
+
+    Only the capture window decides anything, so that is the only phase
+    that runs hand detection on every frame:
+
+    * ``countdown`` (``countdown`` seconds): detection on every
+      ``countdown_detect_every``-th frame, enough to keep the hand overlay
+      and the idle timer alive;
+    * ``capture`` (until a gesture is decided): detection on every frame;
+      each frame's gesture is a vote and the round is decided once
+      ``quorum`` of the last ``window`` votes agree on a move;
+    * ``result`` (``result`` seconds): no detection while the outcome is
+      shown.
+
+    Wall-clock and process CPU time (``time.process_time``, which includes
+    MediaPipe's worker threads) are accounted per phase.
+
+    Args:
+        countdown: Length of the countdown in seconds.
+        result: How long the outcome is shown.
+        countdown_detect_every: Detection stride during the countdown
+            (``0`` = no detection).
+        window: Number of recent capture frames that vote.
+        quorum: Votes a move needs to be played.
+    """
+
+    def __init__(
+        self,
+        countdown: float = 3.0,
+        result: float = 1.0,
+        countdown_detect_every: int = 6,
+        window: int = 5,
+        quorum: int = 4,
+    ) -> None:
+        if not 0 < quorum <= window:
+            raise ValueError(f'quorum must be in 1..{window}, got {quorum}')
+        self.countdown = countdown
+        self.result = result
+        self.countdown_detect_every = countdown_detect_every
+        self.quorum = quorum
+        self._votes: deque[str] = deque(maxlen=window)
+
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.frames = dict.fromkeys(PHASES, 0)
+        self.detections = dict.fromkeys(PHASES, 0)
+        self._clock: tuple[float, float] | None = None
+        self.start(COUNTDOWN)
+
+    def start(self, phase: str, now: float | None = None) -> None:
+        """Enter *phase* (restarting it if it is the current one)."""
+        if phase not in PHASES:
+            raise ValueError(f'Unknown phase: {phase}')
+        now = time.monotonic() if now is None else now
+        self._account(now)
+        self.phase = phase
+        self.started = now
+        self._frame = 0
+        self._votes.clear()
+
+    def suspend(self) -> None:
+        """Stop accounting (e.g. while the game idles) until the next phase starts."""
+        self._account(time.monotonic())
+        self._clock = None
+
+    def _account(self, now: float) -> None:
+        cpu = time.process_time()
+        if self._clock is not None:
+            self.wall[self.phase] += now - self._clock[0]
+            self.cpu[self.phase] += cpu - self._clock[1]
+        self._clock = (now, cpu)
+
+    def elapsed(self, now: float | None = None) -> float:
+        return (time.monotonic() if now is None else now) - self.started
+
+    def update(self, now: float | None = None) -> bool:
+        """Start a frame; return ``True`` if a timed phase just ended."""
+        now = time.monotonic() if now is None else now
+        changed = False
+        if self.phase == COUNTDOWN and self.elapsed(now) >= self.countdown:
+            self.start(CAPTURE, now)
+            changed = True
+        elif self.phase == RESULT and self.elapsed(now) >= self.result:
+            self.start(COUNTDOWN, now)
+            changed = True
+        else:
+            self._account(now)
+        self.frames[self.phase] += 1
+        self._frame += 1
+        return changed
+
+    @property
+    def seconds_left(self) -> int:
+        """Whole seconds left in the countdown (3, 2, 1)."""
+        if self.phase != COUNTDOWN:
+            return 0
+        return max(0, math.ceil(self.countdown - self.elapsed()))
+
+    def should_detect(self) -> bool:
+        """Whether this frame is worth running hand detection on."""
+        if self.phase == CAPTURE:
+            detect = True
+        elif self.phase == COUNTDOWN:
+            every = self.countdown_detect_every
+            detect = every > 0 and (self._frame - 1) % every == 0
+        else:
+            detect = False
+        if detect:
+            self.detections[self.phase] += 1
+        return detect
+
+    def vote(self, gesture: str) -> str | None:
+        """Add this capture frame's *gesture*; return the move once decided."""
+        self._votes.append(gesture)
+        ranked = Counter(v for v in self._votes if v != UNKNOWN).most_common(1)
+        if ranked and ranked[0][1] >= self.quorum:
+            return ranked[0][0]
+        return None
+
+    def summary(self) -> str:
+        parts = []
+        for phase in PHASES:
+            wall = self.wall[phase]
+            if not self.frames[phase]:
+                continue
+            parts.append(
+                f'{phase} {wall:.1f} s, CPU {self.cpu[phase] / max(wall, 1e-9):.0%}, '
+                f'{self.detections[phase]}/{self.frames[phase]} frames detected'
+            )
+        return '; '.join(parts) or 'no rounds'
@@ -0,0 +1,271 @@
+"""Persistent per-player opponent models in one memory-mapped file.
+
+Every player (or the whole kiosk, when players are anonymous) owns one
+fixed-size slot of a structured ``.npy`` array: move counts laid out like
+the n-gram tables of :class:`src.ai.NGramPredictor` (up to ``ORDER``), a
+ring buffer of their last moves and lifetime totals. The file is opened with
+``numpy.lib.format.open_memmap``, so starting a session is a dictionary
+lookup plus copying one slot out of the page cache, and recording a round
+writes a few integers into the mapping. A background thread ``msync``\\ s the
+dirty pages every ``flush_interval`` seconds.
+
+The store holds ``capacity`` slots; when it is full the least recently seen
+player is evicted, and players not seen for ``expire_after`` seconds are
+dropped when the store is opened.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+ORDER = 5  # longest n-gram stored (the predictors read the prefix they need)
+HISTORY = 256
+KEY_BYTES = 32
+
+_MODULUS = 3 ** np.arange(ORDER)
+_OFFSET = np.concatenate(([0], np.cumsum(_MODULUS)[:-1]))
+_ROWS = int(_MODULUS.sum())
+
+
+def _slot_key(player: str) -> str:
+    """*player* cut to what fits in a slot key.
+
+    Raises:
+        ValueError: For an empty name, which would look like a free slot.
+    """
+    key = player.encode()[:KEY_BYTES].decode(errors='ignore')
+    if not key:
+        raise ValueError('Player names must not be empty')
+    return key
+
+
+def slot_dtype(history: int = HISTORY) -> np.dtype:
+    return np.dtype(
+        [
+            ('key', f'S{KEY_BYTES}'),
+            ('last_seen', '<f8'),
+            ('sessions', '<u4'),
+            ('rounds', '<u4'),
+            ('wins', '<u4'),
+            ('losses', '<u4'),
+            ('ties', '<u4'),
+            ('counts', '<u4', (_ROWS, 3)),
+            ('history', 'i1', (history,)),
+        ]
+    )
+
+
+@dataclass
+class Profile:
+    """Snapshot of a player's slot; outcomes are from the player's side.
+
+    Attributes:
+        counts: ``(rows, 3)`` n-gram counts (see :class:`src.ai.NGramPredictor`).
+        history: Most recent move indices, oldest first.
+    """
+
+    player: str
+    sessions: int
+    rounds: int
+    wins: int
+    losses: int
+    ties: int
+    counts: np.ndarray
+    history: np.ndarray
+
+
+class OpponentStore:
+    """LRU-capped, memory-mapped store of :class:`Profile` slots.
+
+    The file is created on first use. An existing file keeps its own
+    capacity and history length.
+
+    Args:
+        path: ``.npy`` file holding the slots.
+        capacity: Number of players kept before evicting the least recent.
+        history: Moves kept per player.
+        expire_after: Drop players unseen for this many seconds on open.
+        flush_interval: Seconds between background flushes of dirty pages.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        capacity: int = 1024,
+        history: int = HISTORY,
+        expire_after: float | None = None,
+        flush_interval: float = 2.0,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.history = history
+        self.expire_after = expire_after
+        self.flush_interval = flush_interval
+        self._map: np.memmap | None = None
+        self._index: dict[str, int] = {}
+        self._dirty = threading.Event()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        self.evicted = 0
+        self.flushes = 0
+
+    # ------------------------------------------------------------------
+    # Opening and flushing
+    # ------------------------------------------------------------------
+
+    def open(self) -> 'OpponentStore':
+        if self._map is not None:
+            return self
+        if os.path.exists(self.path):
+            self._map = np.lib.format.open_memmap(self.path, mode='r+')
+            if self._map.dtype.names != slot_dtype().names or self._map.dtype['counts'].shape != (_ROWS, 3):
+                self._map = None
+                raise ValueError(f'{self.path} is not an opponent store of this version')
+            self.capacity = self._map.shape[0]
+            self.history = self._map.dtype['history'].shape[0]
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._map = np.lib.format.open_memmap(
+                self.path, mode='w+', dtype=slot_dtype(self.history), shape=(self.capacity,)
+            )
+
+        m = self._map
+        # Field views of the mapping; writes go straight to the page cache
+        self._key, self._last_seen = m['key'], m['last_seen']
+        self._sessions, self._rounds = m['sessions'], m['rounds']
+        self._wins, self._losses, self._ties = m['wins'], m['losses'], m['ties']
+        self._counts, self._history = m['counts'], m['history']
+
+        if self.expire_after is not None:
+            stale = (self._key != b'') & (self._last_seen < time.time() - self.expire_after)
+            for slot in np.flatnonzero(stale):
+                self._clear(int(slot))
+            self._dirty.set()
+        self._index = {key.decode(): slot for slot, key in enumerate(self._key.tolist()) if key}
+
+        self._stop = False
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name='OpponentStore', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            stopping = self._stop
+            if self._dirty.is_set():
+                self._dirty.clear()
+                self._map.flush()
+                self.flushes += 1
+            if stopping:
+                break
+
+    def close(self) -> None:
+        """Stop the flusher, write every dirty page and unmap the file."""
+        if self._map is None:
+            return
+        self._stop = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        self._map.flush()
+        self._map = None
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+
+    def _clear(self, slot: int) -> None:
+        self._map[slot] = np.zeros((), dtype=self._map.dtype)
+
+    def _slot(self, player: str) -> int:
+        slot = self._index.get(player)
+        if slot is not None:
+            return slot
+        free = np.flatnonzero(self._key == b'')
+        if free.size:
+            slot = int(free[0])
+        else:
+            # Full: evict the least recently seen player
+            slot = int(np.argmin(self._last_seen))
+            del self._index[self._key[slot].decode()]
+            self.evicted += 1
+        self._clear(slot)
+        self._key[slot] = player.encode()
+        self._index[player] = slot
+        return slot
+
+    def _recent(self, slot: int, n: int) -> np.ndarray:
+        """The last *n* moves of *slot*, oldest first."""
+        rounds = int(self._rounds[slot])
+        n = min(n, rounds, self.history)
+        return self._history[slot, (rounds - np.arange(n, 0, -1)) % self.history]
+
+    def start_session(self, player: str) -> Profile:
+        """Count a new session for *player* and return their profile."""
+        player = _slot_key(player)
+        self.open()
+        slot = self._slot(player)
+        self._sessions[slot] += 1
+        self._last_seen[slot] = time.time()
+        self._dirty.set()
+        return self.profile(player)
+
+    def profile(self, player: str) -> Profile | None:
+        """Copy of *player*'s slot, or ``None`` for an unknown player."""
+        self.open()
+        slot = self._index.get(_slot_key(player))
+        if slot is None:
+            return None
+        return Profile(
+            player,
+            int(self._sessions[slot]),
+            int(self._rounds[slot]),
+            int(self._wins[slot]),
+            int(self._losses[slot]),
+            int(self._ties[slot]),
+            self._counts[slot].astype(np.int64),
+            self._recent(slot, self.history).astype(np.int64),
+        )
+
+    def record(self, player: str, move: int, computer_move: int) -> None:
+        """Add one round (move indices) to *player*'s slot."""
+        player = _slot_key(player)
+        self.open()
+        slot = self._slot(player)
+        context = 0
+        recent = self._recent(slot, ORDER - 1)
+        for m in recent.tolist():
+            context = context * 3 + m
+        known = len(recent) + 1
+        self._counts[slot, _OFFSET[:known] + context % _MODULUS[:known], move] += 1
+
+        rounds = int(self._rounds[slot])
+        self._history[slot, rounds % self.history] = move
+        self._rounds[slot] = rounds + 1
+        outcome = (move - computer_move) % 3  # 1 = player wins, 2 = computer wins
+        if outcome == 1:
+            self._wins[slot] += 1
+        elif outcome == 2:
+            self._losses[slot] += 1
+        else:
+            self._ties[slot] += 1
+        self._last_seen[slot] = time.time()
+        self._dirty.set()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def summary(self) -> str:
+        return f'{len(self)}/{self.capacity} players, {self.evicted} evicted, {self.flushes} flushes'
+
+    def __enter__(self) -> 'OpponentStore':
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -50,3 +50,9 @@ def play_sound(sound):
     if sound:
         sound.play()
 
+
+def close_sounds():
+    """
+    Shut down the audio mixer started by :func:`load_sounds`.
+    """
+    pygame.mixer.quit()
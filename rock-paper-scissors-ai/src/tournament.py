@@ -0,0 +1,271 @@
+"""Headless tournament between the AI difficulties and synthetic player bots.
+
+Run from the project root::
+
+    python -m src.tournament --games 1000 --rounds 1000
+
+Every (difficulty, bot) pair plays ``games`` independent games of ``rounds``
+rounds each. The games of a pair run in lockstep: a round is one vectorized
+step of the batched predictors from ``src.ai`` (the same models
+``smart_choice`` uses) and of the bot, so a million rounds take seconds.
+Pairs are spread over a process pool. Only NumPy is needed: no camera,
+MediaPipe or pygame.
+
+Win rates are reported with 95% confidence intervals computed over the
+per-game win rates, since rounds within a game are not independent.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .ai import DIFFICULTIES, EnsemblePredictor, NGramPredictor
+
+# ---------------------------------------------------------------------------
+# Player bots
+# ---------------------------------------------------------------------------
+
+
+class Bot(ABC):
+    """Synthetic player of ``games`` simultaneous games.
+
+    Moves are indices into ``src.ai.MOVES``; each game draws its own
+    parameters (bias, cycle direction, transition matrix) from *rng*.
+    """
+
+    def __init__(self, games: int, rng: np.random.Generator) -> None:
+        self.games = games
+        self.rng = rng
+
+    @abstractmethod
+    def play(self, last_player: np.ndarray | None, last_computer: np.ndarray | None) -> np.ndarray:
+        """Next move of every game given the previous round (``None`` at first)."""
+
+    def _random(self) -> np.ndarray:
+        return self.rng.integers(0, 3, self.games)
+
+
+class RandomBot(Bot):
+    """Uniformly random moves; no strategy can beat it in expectation."""
+
+    def play(self, last_player, last_computer):
+        return self._random()
+
+
+class BiasedBot(Bot):
+    """Random moves from a fixed, per-game skewed distribution."""
+
+    def __init__(self, games: int, rng: np.random.Generator) -> None:
+        super().__init__(games, rng)
+        self._cdf = np.cumsum(rng.dirichlet((0.7, 0.7, 0.7), games), axis=1)
+
+    def play(self, last_player, last_computer):
+        return np.minimum((self.rng.random(self.games)[:, None] > self._cdf).sum(axis=1), 2)
+
+
+class CyclicBot(Bot):
+    """Rock, paper, scissors, … (or the reverse), from a random start."""
+
+    def __init__(self, games: int, rng: np.random.Generator) -> None:
+        super().__init__(games, rng)
+        self._step = rng.choice((1, 2), games)
+
+    def play(self, last_player, last_computer):
+        if last_player is None:
+            return self._random()
+        return (last_player + self._step) % 3
+
+
+class MarkovBot(Bot):
+    """Next move drawn from a per-game random transition matrix."""
+
+    def __init__(self, games: int, rng: np.random.Generator) -> None:
+        super().__init__(games, rng)
+        self._cdf = np.cumsum(rng.dirichlet((0.4, 0.4, 0.4), (games, 3)), axis=2)
+
+    def play(self, last_player, last_computer):
+        if last_player is None:
+            return self._random()
+        cdf = self._cdf[np.arange(self.games), last_player]
+        return np.minimum((self.rng.random(self.games)[:, None] > cdf).sum(axis=1), 2)
+
+
+class CopyLastBot(Bot):
+    """Plays whatever the computer played last round."""
+
+    def play(self, last_player, last_computer):
+        return self._random() if last_computer is None else last_computer
+
+
+class BeatLastBot(Bot):
+    """Plays what would have beaten the computer's last move."""
+
+    def play(self, last_player, last_computer):
+        return self._random() if last_computer is None else (last_computer + 1) % 3
+
+
+BOTS: dict[str, type[Bot]] = {
+    'random': RandomBot,
+    'biased': BiasedBot,
+    'cyclic': CyclicBot,
+    'markov': MarkovBot,
+    'copy-last': CopyLastBot,
+    'beat-last': BeatLastBot,
+}
+
+# ---------------------------------------------------------------------------
+# Batched AI
+# ---------------------------------------------------------------------------
+
+
+class BatchAI:
+    """``smart_choice`` for ``games`` simultaneous games, on move indices."""
+
+    def __init__(self, difficulty: str, games: int, rng: np.random.Generator) -> None:
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f'Unknown difficulty: {difficulty}')
+        self.difficulty = difficulty
+        self.games = games
+        self.rng = rng
+        seed = int(rng.integers(1 << 31))
+        if difficulty == 'expert':
+            self.model = EnsemblePredictor(games=games, seed=seed)
+        elif difficulty in ('medium', 'hard'):
+            self.model = NGramPredictor(games=games, seed=seed)
+        else:
+            self.model = None
+
+    def choose(self) -> np.ndarray:
+        if self.difficulty == 'easy':
+            return self.rng.integers(0, 3, self.games)
+        if self.difficulty == 'expert':
+            return self.model.choose_batch()
+        predicted = self.model.predict_batch(1 if self.difficulty == 'medium' else None)
+        return (predicted + 1) % 3  # COUNTER_MOVE on indices
+
+    def observe(self, player: np.ndarray, computer: np.ndarray) -> None:
+        if isinstance(self.model, EnsemblePredictor):
+            self.model.observe_batch(player, computer)
+        elif self.model is not None:
+            self.model.observe_batch(player)
+
+
+# ---------------------------------------------------------------------------
+# Tournament
+# ---------------------------------------------------------------------------
+
+
+def play_pair(
+    difficulty: str,
+    bot: str,
+    games: int,
+    rounds: int,
+    seed: int | np.random.SeedSequence | None = None,
+) -> dict:
+    """Play *games* games of *rounds* rounds between *difficulty* and *bot*.
+
+    Returns:
+        ``difficulty``, ``bot``, ``rounds`` (total), ``win``/``tie``/``loss``
+        (mean per-game rates from the computer's side), ``win_ci`` (95%
+        half-width) and ``seconds`` of simulation.
+    """
+    rng = np.random.default_rng(seed)
+    ai = BatchAI(difficulty, games, rng)
+    player = BOTS[bot](games, rng)
+    wins = np.zeros(games, dtype=np.int64)
+    losses = np.zeros(games, dtype=np.int64)
+
+    last_player = last_computer = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        computer = ai.choose()
+        moves = player.play(last_player, last_computer)
+        outcome = (computer - moves) % 3  # 1 = computer wins, 2 = player wins
+        wins += outcome == 1
+        losses += outcome == 2
+        ai.observe(moves, computer)
+        last_player, last_computer = moves, computer
+    seconds = time.perf_counter() - start
+
+    win_rate = wins / rounds
+    loss_rate = losses / rounds
+    spread = win_rate.std(ddof=1) if games > 1 else 0.0
+    return {
+        'difficulty': difficulty,
+        'bot': bot,
+        'rounds': games * rounds,
+        'win': float(win_rate.mean()),
+        'tie': float(1.0 - win_rate.mean() - loss_rate.mean()),
+        'loss': float(loss_rate.mean()),
+        'win_ci': float(1.96 * spread / np.sqrt(games)),
+        'seconds': seconds,
+    }
+
+
+def run_tournament(
+    difficulties: list[str],
+    bots: list[str],
+    games: int = 1000,
+    rounds: int = 1000,
+    workers: int | None = None,
+    seed: int | None = None,
+) -> list[dict]:
+    """Play every (difficulty, bot) pair, in parallel over *workers* processes."""
+    pairs = [(difficulty, bot) for difficulty in difficulties for bot in bots]
+    seeds = np.random.SeedSequence(seed).spawn(len(pairs))
+    jobs = [(difficulty, bot, games, rounds, s) for (difficulty, bot), s in zip(pairs, seeds)]
+    if workers == 1:
+        return [play_pair(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_pair, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def format_results(results: list[dict]) -> str:
+    lines = [f"{'difficulty':<10} {'bot':<10} {'win %':>15} {'tie %':>6} {'loss %':>6} {'decisions/s':>12}"]
+    for r in results:
+        win = f"{r['win']:.1%} ± {r['win_ci']:.1%}"
+        lines.append(
+            f"{r['difficulty']:<10} {r['bot']:<10} {win:>15} {r['tie']:>6.1%} {r['loss']:>6.1%} "
+            f"{r['rounds'] / r['seconds']:>12,.0f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the RPS AI difficulties against synthetic players')
+    parser.add_argument('--games', type=int, default=1000, help='Simultaneous games per pair (default: 1000)')
+    parser.add_argument('--rounds', type=int, default=1000, help='Rounds per game (default: 1000)')
+    parser.add_argument(
+        '--difficulty',
+        nargs='+',
+        choices=DIFFICULTIES,
+        default=list(DIFFICULTIES),
+        help='Difficulties to benchmark (default: all)',
+    )
+    parser.add_argument(
+        '--bots',
+        nargs='+',
+        choices=list(BOTS),
+        default=list(BOTS),
+        help='Player bots to play against (default: all)',
+    )
+    parser.add_argument('--workers', type=int, help='Worker processes (default: one per CPU, 1 = no pool)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible tournaments')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_tournament(args.difficulty, args.bots, args.games, args.rounds, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    print(format_results(results))
+    total = sum(r['rounds'] for r in results)
+    print(f'{total:,} rounds in {elapsed:.1f} s ({total / elapsed:,.0f} decisions/s on {args.workers or os.cpu_count()} workers)')
+
+
+if __name__ == '__main__':
+    main()
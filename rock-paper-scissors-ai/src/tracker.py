@@ -0,0 +1,82 @@
+"""MediaPipe hand tracking that returns landmarks as NumPy arrays.
+
+The rest of the game (gesture recognition, drawing) works on the
+``(hands, 21, 3)`` landmark array instead of MediaPipe protobuf objects, so the
+protobuf is read exactly once per frame, here.
+"""
+from __future__ import annotations
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+# HandResult and draw_hands used to live here; keep them importable
+from .hands import HandResult, draw_hands
+from .motion_gate import MotionGate
+
+
+class HandTracker:
+    """Thin wrapper around ``mediapipe.solutions.hands.Hands``.
+
+    With a ``motion_gate`` the previous result is reused while the scene is
+    static instead of running inference. ``static_image_mode`` detects every
+    frame from scratch (for unrelated still images) instead of tracking.
+    """
+
+    def __init__(
+        self,
+        max_num_hands: int = 1,
+        detection_confidence: float = 0.7,
+        tracking_confidence: float = 0.5,
+        motion_gate: MotionGate | None = None,
+        static_image_mode: bool = False,
+    ) -> None:
+        self._hands = mp.solutions.hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=detection_confidence,
+            min_tracking_confidence=tracking_confidence,
+        )
+        self.motion_gate = motion_gate
+        self._last_hands = HandResult.empty()
+
+    def detect(self, frame_bgr: np.ndarray, pixel_space: bool = False) -> HandResult:
+        """Run MediaPipe on a BGR frame and return every hand as arrays."""
+        gate = self.motion_gate
+        if gate is not None and gate.should_skip(frame_bgr, self._last_hands.bounds()):
+            hands = self._last_hands
+        else:
+            image = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+            # Not writeable lets MediaPipe take the buffer by reference.
+            image.flags.writeable = False
+            hands = to_arrays(self._hands.process(image))
+            self._last_hands = hands
+        if pixel_space:
+            h, w = frame_bgr.shape[:2]
+            hands = hands.to_pixels(w, h)
+        return hands
+
+    def close(self) -> None:
+        self._hands.close()
+
+
+def to_arrays(results) -> HandResult:
+    """Pack MediaPipe ``results`` into a normalized :class:`HandResult`."""
+    if not results.multi_hand_landmarks:
+        return HandResult.empty()
+
+    landmarks = np.array(
+        [
+            [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+            for hand in results.multi_hand_landmarks
+        ],
+        dtype=np.float32,
+    )
+    n = landmarks.shape[0]
+    handedness = np.zeros(n, dtype=np.int8)
+    scores = np.ones(n, dtype=np.float32)
+    for i, hand_class in enumerate((results.multi_handedness or ())[:n]):
+        top = hand_class.classification[0]
+        handedness[i] = 1 if top.label == 'Right' else 0
+        scores[i] = top.score
+    return HandResult(landmarks, handedness, scores)
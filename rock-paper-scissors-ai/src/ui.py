@@ -3,17 +3,20 @@ from __future__ import annotations
 """UI facade for main loop.
 
 Provides *display_ui* expected by ``main.py``. It converts the raw parameters
-into a ``UIState`` and composes a full 1280×720 frame using ``compose_frame``
-from ``src.gui``. The function mutates the input *frame* in-place so the caller
-can continue to use the same reference.
+into a ``UIState`` and composes a full 1280×720 frame on a persistent
+``Compositor`` from ``src.gui``. By default the composed frame is scaled back
+into the input *frame* in-place so the caller can continue to use the same
+reference; with ``native=True`` the canvas is returned at full size instead.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
 import cv2
 import numpy as np
 
-from .gui import UIState, compose_frame
+from .gui import Compositor, UIState
+
+_COMPOSITOR = Compositor()
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -29,11 +32,13 @@ def display_ui(
     images: Dict[str, np.ndarray],
     *,
     difficulty: str = "normal",
-) -> None:
+    compositor: Optional[Compositor] = None,
+    native: bool = False,
+) -> np.ndarray:
     """Augment *frame* with HUD elements.
 
     This is a thin wrapper translating the arguments used in ``main.py`` to the
-    ``compose_frame`` helper.
+    ``Compositor`` of ``src.gui``.
 
     Parameters
     ----------
@@ -49,6 +54,15 @@ def display_ui(
         Pre-loaded gesture icons.
     difficulty : str, optional
         Difficulty label displayed in the HUD.
+    compositor : Compositor, optional
+        Canvas to compose on; a module-wide one by default.
+    native : bool, optional
+        Return the 1280×720 canvas itself instead of scaling it into *frame*.
+
+    Returns
+    -------
+    np.ndarray
+        The image to show: *frame*, or the compositor's canvas when *native*.
     """
 
     state = UIState(
@@ -59,13 +73,15 @@ def display_ui(
         images=images,
     )
 
-    composed = compose_frame(frame, state)
+    compositor = _COMPOSITOR if compositor is None else compositor
+    composed = compositor.compose(frame, state)
+    if native:
+        return composed
 
-    # Copy composed frame back to the provided array to avoid reallocations in
-    # the caller. Ensure shapes match (they should given compose_frame's spec).
+    # Scale the composed canvas straight into the provided array to avoid
+    # reallocations in the caller.
     if frame.shape == composed.shape:
         frame[:, :] = composed
     else:
-        # If shapes differ, resize caller's frame and assign.
-        resized = cv2.resize(composed, (frame.shape[1], frame.shape[0]))
-        frame[:, :] = resized
+        cv2.resize(composed, (frame.shape[1], frame.shape[0]), dst=frame)
+    return frame
@@ -0,0 +1,87 @@
+"""Online opponent models of the AI difficulties."""
+import numpy as np
+
+from src.ai import MOVE_INDEX, MOVES, EnsemblePredictor, NGramPredictor
+
+
+def _counter(move: str) -> str:
+    return MOVES[(MOVE_INDEX[move] + 1) % 3]
+
+
+def test_ngram_counts_every_context_length():
+    predictor = NGramPredictor(order=3)
+    for move in ('rock', 'paper', 'scissors'):
+        predictor.observe(move)
+    assert predictor.seen == 3
+    counts = predictor.counts[0]
+    # Order 0: plain frequency; order 1: one row per previous move
+    assert counts[0].tolist() == [1, 1, 1]
+    assert counts[1 + MOVE_INDEX['rock'], MOVE_INDEX['paper']] == 1
+    assert counts[1 + MOVE_INDEX['paper'], MOVE_INDEX['scissors']] == 1
+    # Order 2: (rock, paper) -> scissors
+    assert counts[4 + MOVE_INDEX['rock'] * 3 + MOVE_INDEX['paper'], MOVE_INDEX['scissors']] == 1
+    assert counts.sum() == 3 + 2 + 1
+
+
+def test_ngram_ignores_unknown_and_resets():
+    predictor = NGramPredictor()
+    predictor.observe('unknown')
+    assert predictor.seen == 0
+    predictor.observe('rock')
+    predictor.reset()
+    assert predictor.seen == 0 and not predictor.counts.any()
+
+
+def test_ngram_predicts_a_cycle():
+    predictor = NGramPredictor(order=3, seed=0)
+    cycle = ['rock', 'paper', 'scissors']
+    for i in range(30):
+        predictor.observe(cycle[i % 3])
+    assert predictor.predict() == cycle[30 % 3]
+
+
+def test_ngram_backs_off_to_shorter_contexts():
+    predictor = NGramPredictor(order=3, seed=0)
+    for move in ('rock', 'paper', 'rock', 'paper', 'scissors', 'rock'):
+        predictor.observe(move)
+    # (scissors, rock) was never followed by anything, but rock alone was
+    # followed by paper twice; the plain frequency would say rock
+    assert predictor.predict() == 'paper'
+    assert predictor.predict(max_order=1) == 'rock'
+
+
+def test_ngram_games_are_independent():
+    predictor = NGramPredictor(order=2, games=2, seed=0)
+    for _ in range(10):
+        predictor.observe_batch(np.array([MOVE_INDEX['rock'], MOVE_INDEX['scissors']]))
+    assert predictor.predict_batch().tolist() == [MOVE_INDEX['rock'], MOVE_INDEX['scissors']]
+
+
+def test_ensemble_counters_a_repeated_move():
+    ensemble = EnsemblePredictor(seed=0)
+    for _ in range(20):
+        computer = ensemble.choose()
+        ensemble.observe('rock', computer)
+    assert ensemble.choose() == 'paper'
+
+
+def test_ensemble_beats_a_cycle():
+    ensemble = EnsemblePredictor(seed=0)
+    cycle = ['rock', 'paper', 'scissors']
+    wins = 0
+    for i in range(300):
+        computer = ensemble.choose()
+        move = cycle[i % 3]
+        wins += computer == _counter(move)
+        ensemble.observe(move, computer)
+    assert wins > 250
+
+
+def test_ensemble_batch_shapes():
+    ensemble = EnsemblePredictor(games=4, seed=0)
+    moves = ensemble.choose_batch()
+    assert moves.shape == (4,) and set(moves.tolist()) <= {0, 1, 2}
+    ensemble.observe_batch(np.zeros(4, dtype=np.int64), moves)
+    assert ensemble.scores.shape == (4, ensemble.n_predictors * 3)
+    ensemble.reset()
+    assert not ensemble.scores.any()
@@ -0,0 +1,128 @@
+"""Landmark features and the nearest-centroid gesture classifier."""
+import numpy as np
+import pytest
+
+from src.dataset_eval import cross_validate, fit, hand_feature_arrays
+from src.gesture import LABELS, N_FEATURES, REJECT_DISTANCE, UNKNOWN, GestureClassifier, hand_features
+from src.gesture_bench import synthesize_hands
+
+
+def _classifier(reject=2.5):
+    centroids = np.zeros((len(LABELS), N_FEATURES), dtype=np.float32)
+    centroids[:, 0] = [0.0, 10.0, 20.0]
+    scales = np.ones((len(LABELS), N_FEATURES), dtype=np.float32)
+    return GestureClassifier(centroids, scales, reject)
+
+
+def test_predict_nearest_centroid():
+    classifier = _classifier()
+    features = np.zeros((3, N_FEATURES), dtype=np.float32)
+    features[:, 0] = [0.5, 9.0, 21.0]
+    assert classifier.predict(features).tolist() == [0, 1, 2]
+
+
+def test_predict_rejects_far_hands():
+    classifier = _classifier(reject=2.5)
+    features = np.zeros((2, N_FEATURES), dtype=np.float32)
+    # RMS over the features: a gap of g in one feature is g / sqrt(N_FEATURES)
+    features[0, 1] = 2.4 * np.sqrt(N_FEATURES)
+    features[1, 1] = 2.6 * np.sqrt(N_FEATURES)
+    assert classifier.predict(features).tolist() == [0, -1]
+
+
+def test_per_class_scales_weigh_features():
+    centroids = np.zeros((len(LABELS), N_FEATURES), dtype=np.float32)
+    centroids[1, 0] = 2.0
+    scales = np.ones((len(LABELS), N_FEATURES), dtype=np.float32)
+    scales[1, 0] = 10.0  # class 1 leaves feature 0 loose
+    classifier = GestureClassifier(centroids, scales, reject=100.0)
+    features = np.zeros((1, N_FEATURES), dtype=np.float32)
+    features[0, 0] = 0.8  # nearer class 0 in raw units, nearer class 1 in spreads
+    assert classifier.predict(features).tolist() == [1]
+
+
+def test_fit_save_load_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    labels = np.repeat(np.arange(len(LABELS)), 50)
+    features = rng.normal(labels[:, None] * 5.0, 1.0, (len(labels), N_FEATURES)).astype(np.float32)
+    classifier = GestureClassifier.fit(features, labels)
+    assert (classifier.predict(features) == labels).mean() > 0.95
+
+    classifier.reject = 1.75
+    path = str(tmp_path / 'model.npy')
+    classifier.save(path)
+    loaded = GestureClassifier.load(path)
+    assert loaded.reject == pytest.approx(1.75)
+    np.testing.assert_allclose(loaded.predict(features), classifier.predict(features))
+    assert GestureClassifier.load(path, reject=3.0).reject == 3.0
+
+    # Weights without a reject row fall back to the default distance
+    np.save(path, np.load(path)[: 2 * len(LABELS)])
+    assert GestureClassifier.load(path).reject == REJECT_DISTANCE
+
+
+def test_calibrate_rejects_other_poses():
+    rng = np.random.default_rng(0)
+    labels = np.repeat(np.arange(len(LABELS)), 200)
+    features = rng.normal(labels[:, None] * 5.0, 1.0, (len(labels), N_FEATURES)).astype(np.float32)
+    classifier = GestureClassifier.fit(features, labels)
+    others = rng.normal(2.5, 1.0, (200, N_FEATURES)).astype(np.float32)  # between the classes
+    assert classifier.calibrate(features, labels) == REJECT_DISTANCE  # no other poses: unchanged
+
+    mixed = np.concatenate([features, others])
+    truth = np.concatenate([labels, np.full(len(others), -1)])
+    classifier.calibrate(mixed, truth)
+    predicted = classifier.predict(mixed)
+    assert (predicted[: len(labels)] == labels).mean() > 0.95
+    assert (predicted[len(labels) :] == -1).mean() > 0.95
+
+
+def test_classify_names_and_empty_input():
+    classifier = _classifier()
+    assert classifier.classify(np.empty((0, 21, 3), dtype=np.float32)) == []
+    hands = np.random.default_rng(0).uniform(0.3, 0.7, (2, 21, 3)).astype(np.float32)
+    assert set(classifier.classify(hands)) <= {*LABELS, UNKNOWN}
+
+
+def test_features_ignore_rotation_scale_and_mirroring():
+    hand = np.random.default_rng(1).uniform(-1.0, 1.0, (21, 3)).astype(np.float32)
+    angle = np.radians(37.0)
+    rot = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]], dtype=np.float32)
+    moved = hand.copy()
+    moved[:, :2] = 0.4 * hand[:, :2] @ rot.T + [0.3, -0.2]
+    mirrored = hand.copy()
+    mirrored[:, 0] *= -1.0
+    base = hand_features(hand)
+    np.testing.assert_allclose(hand_features(moved), base, rtol=1e-4, atol=1e-4)
+    np.testing.assert_allclose(hand_features(mirrored), base, rtol=1e-4, atol=1e-4)
+    assert base.shape == (1, N_FEATURES)
+
+
+def _recordings(files_per_label, rng):
+    """Synthetic stand-ins for per-file landmark arrays, some frames without a hand."""
+    arrays, labels = [], []
+    for _ in range(files_per_label):
+        hands, y = synthesize_hands(80, rng, max_tilt=60.0, other_fraction=0.25)
+        hands[:, :, 0] *= 16 / 9  # dataset_eval works in square-pixel units
+        for k, name in enumerate([*LABELS, UNKNOWN]):
+            clip = hands[y == k if k < len(LABELS) else y < 0]
+            clip[::5] = np.nan
+            arrays.append(clip)
+            labels.append(name)
+    return arrays, labels
+
+
+def test_dataset_training_is_cross_validated_by_file():
+    arrays, labels = _recordings(6, np.random.default_rng(0))
+    features = hand_feature_arrays(arrays)
+    assert [len(f) for f in features] == [int((~np.isnan(a).any(axis=(1, 2))).sum()) for a in arrays]
+
+    predicted = cross_validate(features, labels, folds=3)
+    assert [len(p) for p in predicted] == [len(f) for f in features]
+    correct = [name == label for names, label in zip(predicted, labels) for name in names]
+    assert np.mean(correct) > 0.9
+
+    classifier = fit(features, labels)
+    assert classifier.reject != REJECT_DISTANCE  # calibrated on the unknown clips
+    with pytest.raises(ValueError):
+        fit([f for f, label in zip(features, labels) if label != 'paper'], [label for label in labels if label != 'paper'])
@@ -0,0 +1,63 @@
+"""Late-frame handling and cadence statistics of the frame scheduler."""
+import pytest
+
+from src.pacing import FrameScheduler
+
+PERIOD = 0.25  # 4 FPS keeps every timestamp exact in binary
+
+
+def _ticks(scheduler, times):
+    return [scheduler.begin_frame(now=t) for t in times]
+
+
+def test_on_time_frames_step_one_period():
+    scheduler = FrameScheduler(1 / PERIOD)
+    ticks = _ticks(scheduler, [10.0, 10.25, 10.5, 10.6])
+    assert [(t.dt, t.steps, t.render) for t in ticks] == [(PERIOD, 1, True)] * 4
+    assert scheduler.late_frames == 0
+
+
+def test_skip_render_counts_missed_periods():
+    scheduler = FrameScheduler(1 / PERIOD)
+    # Deadlines 0.25, 0.5; the frame at 1.0 is two whole periods late
+    _, _, late = _ticks(scheduler, [0.0, 0.25, 1.0])
+    assert late.dt == 3 * PERIOD and late.steps == 1 and not late.render
+    assert scheduler.late_frames == 1 and scheduler.skipped_renders == 1
+    # The deadline moved past the missed periods: the next frame is on time
+    assert scheduler.begin_frame(now=1.25).render
+
+
+def test_skip_render_never_skips_twice_in_a_row():
+    scheduler = FrameScheduler(1 / PERIOD)
+    ticks = _ticks(scheduler, [0.0, 1.0, 2.0, 3.0, 4.0])
+    assert [t.render for t in ticks] == [True, False, True, False, True]
+    assert scheduler.late_frames == 4 and scheduler.skipped_renders == 2
+
+
+def test_catch_up_steps_are_capped():
+    scheduler = FrameScheduler(1 / PERIOD, late_policy='catch_up', max_catch_up=4)
+    _, two_late, ten_late = _ticks(scheduler, [0.0, 0.75, 3.5])
+    assert (two_late.dt, two_late.steps, two_late.render) == (PERIOD, 3, True)
+    assert (ten_late.dt, ten_late.steps, ten_late.render) == (PERIOD, 4, True)
+    assert scheduler.catch_up_steps == 2 + 3
+
+
+def test_reset_forgets_the_deadline():
+    scheduler = FrameScheduler(1 / PERIOD)
+    _ticks(scheduler, [0.0, 0.25])
+    scheduler.reset()
+    tick = scheduler.begin_frame(now=5.0)
+    assert tick.render and tick.dt == PERIOD and scheduler.late_frames == 0
+
+
+def test_uncapped_reports_measured_frame_time():
+    scheduler = FrameScheduler(None)
+    ticks = _ticks(scheduler, [0.0, 0.5, 0.75])
+    assert [t.dt for t in ticks] == [0.0, 0.5, 0.25]
+    assert scheduler.fps == pytest.approx(1 / 0.375)
+    scheduler.wait()  # no deadline, returns at once
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        FrameScheduler(30, late_policy='drop')
@@ -0,0 +1,107 @@
+"""Round phases: timing, detection duty cycle and gesture voting."""
+import time
+
+import pytest
+
+from src.phases import CAPTURE, COUNTDOWN, RESULT, RoundPhases
+
+
+def test_timed_transitions():
+    phases = RoundPhases(countdown=3.0, result=1.0)
+    phases.start(COUNTDOWN, now=100.0)
+    assert not phases.update(now=102.9)
+    assert phases.phase == COUNTDOWN
+    assert phases.update(now=103.0)
+    assert phases.phase == CAPTURE
+    # Capture only ends when a move is decided
+    assert not phases.update(now=200.0)
+    assert phases.phase == CAPTURE
+
+    phases.start(RESULT, now=200.0)
+    assert not phases.update(now=200.5)
+    assert phases.update(now=201.0)
+    assert phases.phase == COUNTDOWN
+
+
+def test_seconds_left_counts_down():
+    phases = RoundPhases(countdown=3.0)
+    phases.start(COUNTDOWN, now=time.monotonic())
+    assert phases.seconds_left == 3
+    phases.start(COUNTDOWN, now=time.monotonic() - 2.5)
+    assert phases.seconds_left == 1
+    phases.start(CAPTURE)
+    assert phases.seconds_left == 0
+
+
+def _detected(phases, frames, now):
+    result = []
+    for _ in range(frames):
+        phases.update(now=now)
+        result.append(phases.should_detect())
+    return result
+
+
+def test_detection_stride_per_phase():
+    phases = RoundPhases(countdown=10.0, result=10.0, countdown_detect_every=3)
+    phases.start(COUNTDOWN, now=0.0)
+    assert _detected(phases, 7, now=1.0) == [True, False, False, True, False, False, True]
+
+    phases.start(CAPTURE, now=1.0)
+    assert _detected(phases, 4, now=1.0) == [True] * 4
+
+    phases.start(RESULT, now=1.0)
+    assert _detected(phases, 4, now=1.0) == [False] * 4
+
+    assert phases.detections == {COUNTDOWN: 3, CAPTURE: 4, RESULT: 0}
+    assert phases.frames == {COUNTDOWN: 7, CAPTURE: 4, RESULT: 4}
+
+
+def test_no_detection_during_countdown():
+    phases = RoundPhases(countdown=10.0, countdown_detect_every=0)
+    phases.start(COUNTDOWN, now=0.0)
+    assert _detected(phases, 5, now=1.0) == [False] * 5
+
+
+def test_quorum_voting():
+    phases = RoundPhases(window=5, quorum=4)
+    phases.start(CAPTURE)
+    assert phases.vote('rock') is None
+    assert phases.vote('unknown') is None
+    assert phases.vote('rock') is None
+    assert phases.vote('rock') is None
+    assert phases.vote('rock') == 'rock'
+
+
+def test_votes_slide_and_reset():
+    phases = RoundPhases(window=3, quorum=3)
+    phases.start(CAPTURE)
+    for gesture in ('paper', 'rock', 'rock'):
+        assert phases.vote(gesture) is None
+    # The paper vote has slid out of the window
+    assert phases.vote('rock') == 'rock'
+
+    phases.start(CAPTURE)
+    assert phases.vote('rock') is None
+
+
+def test_unknown_never_wins():
+    phases = RoundPhases(window=3, quorum=2)
+    phases.start(CAPTURE)
+    assert [phases.vote('unknown') for _ in range(3)] == [None] * 3
+
+
+def test_invalid_quorum():
+    with pytest.raises(ValueError):
+        RoundPhases(window=3, quorum=4)
+    with pytest.raises(ValueError):
+        RoundPhases(window=3, quorum=0)
+
+
+def test_accounting_skips_suspended_time():
+    phases = RoundPhases()
+    phases.update()
+    phases.suspend()
+    wall = phases.wall[COUNTDOWN]
+    phases.start(COUNTDOWN, now=time.monotonic() + 50.0)
+    assert phases.wall[COUNTDOWN] == wall
+    assert 'countdown' in phases.summary()
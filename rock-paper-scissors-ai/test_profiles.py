@@ -0,0 +1,78 @@
+"""Round-trip of the AI's opponent model through an ``OpponentStore``."""
+import numpy as np
+import pytest
+
+from src.ai import MOVE_INDEX, MOVES, EnsemblePredictor, NGramPredictor
+from src.profiles import OpponentStore
+
+
+def _play(store, predictor, moves, player='alice'):
+    store.start_session(player)
+    for move, computer in moves:
+        predictor.observe(MOVES[move], MOVES[computer])
+        store.record(player, move, computer)
+
+
+PREDICTORS = [
+    (lambda: NGramPredictor(order=3), 'counts'),
+    (lambda: EnsemblePredictor(max_order=5), '_counts'),
+]
+
+
+@pytest.mark.parametrize('make, counts', PREDICTORS)
+@pytest.mark.parametrize('rounds', [0, 1, 3, 40])
+def test_warm_start_restores_live_model(tmp_path, make, counts, rounds):
+    rng = np.random.default_rng(rounds)
+    moves = rng.integers(0, 3, (rounds, 2)).tolist()
+    live = make()
+    with OpponentStore(str(tmp_path / 'profiles.npy')) as store:
+        _play(store, live, moves)
+
+    with OpponentStore(str(tmp_path / 'profiles.npy')) as store:
+        profile = store.profile('alice')
+    resumed = make()
+    resumed.warm_start(profile.counts, profile.history)
+
+    assert profile.rounds == rounds
+    assert resumed.seen == live.seen
+    np.testing.assert_array_equal(resumed._context, live._context)
+    np.testing.assert_array_equal(getattr(resumed, counts), getattr(live, counts))
+
+
+def test_short_history_context():
+    predictor = EnsemblePredictor(max_order=5)
+    counts = np.zeros((121, 3), dtype=np.int64)
+    predictor.warm_start(counts, np.array([MOVE_INDEX['rock'], MOVE_INDEX['paper'], MOVE_INDEX['scissors']]))
+    assert predictor._context[0] == 0 * 9 + 1 * 3 + 2
+
+
+def test_outcomes_and_sessions(tmp_path):
+    with OpponentStore(str(tmp_path / 'profiles.npy')) as store:
+        store.start_session('bob')
+        store.record('bob', MOVE_INDEX['paper'], MOVE_INDEX['rock'])  # bob wins
+        store.record('bob', MOVE_INDEX['rock'], MOVE_INDEX['paper'])  # bob loses
+        store.record('bob', MOVE_INDEX['rock'], MOVE_INDEX['rock'])  # tie
+        store.start_session('bob')
+        profile = store.profile('bob')
+    assert (profile.sessions, profile.rounds) == (2, 3)
+    assert (profile.wins, profile.losses, profile.ties) == (1, 1, 1)
+    assert profile.history.tolist() == [1, 0, 0]
+
+
+def test_full_store_evicts_least_recent(tmp_path):
+    with OpponentStore(str(tmp_path / 'profiles.npy'), capacity=2) as store:
+        store.record('a', 0, 0)
+        store.record('b', 0, 0)
+        store.record('a', 1, 0)
+        store.record('c', 2, 0)
+        assert store.profile('b') is None
+        assert store.profile('a').rounds == 2
+        assert store.evicted == 1
+
+
+def test_empty_player_name_is_rejected(tmp_path):
+    with OpponentStore(str(tmp_path / 'profiles.npy')) as store:
+        with pytest.raises(ValueError):
+            store.start_session('')
+        with pytest.raises(ValueError):
+            store.record('', 0, 0)